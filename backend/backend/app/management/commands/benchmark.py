@@ -0,0 +1,376 @@
+import datetime as dt
+import enum
+import gc
+import itertools
+import json
+import statistics
+import time
+import types
+import typing as t
+import uuid
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from app.src.connectors.api_domain.model_converters import ApiToDomainModelConverter, DomainToApiModelConverter
+from app.src.connectors.domain_storage.model_converters import (
+    DomainToStorageModelConverter,
+    StorageToDomainModelConverter
+)
+from app.src.hl7date import DatePrecision, HL7DateUtils
+from app.src.layers.api import compact
+from app.src.layers.api import models as am
+from app.src.layers.domain import models as dm
+from app.src.layers.domain.models import field_types as ft
+from app.src.layers.storage.services import StorageService
+from extensions import pydantic as pde
+
+
+# Only the first item of a list gets a value for these fields as they are unique for the parent
+UNIQUE_PER_PARENT_FIELD_NAMES = {'c_2_r_5_primary_source_regulatory_purposes'}
+# These fields are not wrapped into the value models in the api layer and refer to the reactions
+RAW_FIELD_NAMES = {'uuid', 'g_k_9_i_1_reaction_assessed'}
+
+
+def make_icsr_data(rows: int, number: int = 0, nested_rows: int | None = None) -> dict[str, t.Any]:
+    """
+    Builds api data of an ICSR with all fields filled with valid values and `rows` items in every list.
+    Lists of nested models get `nested_rows` items if it is given.
+    Text values are unique for every call with different number.
+    """
+    counter = itertools.count()
+    reaction_uuids = [str(uuid.uuid5(uuid.NAMESPACE_OID, f'{number}.{i}')) for i in range(rows)]
+    if nested_rows is None:
+        nested_rows = rows
+    return _make_model_data(dm.ICSR, rows, nested_rows, number, counter, reaction_uuids)
+
+
+def _make_model_data(
+    model_class: type[dm.DomainModel],
+    rows: int,
+    nested_rows: int,
+    number: int,
+    counter: t.Iterator[int],
+    reaction_uuids: list[str],
+    index: int = 0
+) -> dict[str, t.Any]:
+    data = {}
+
+    type_hints = t.get_type_hints(model_class, include_extras=True)
+
+    for field_name in model_class.model_fields.keys():
+        if field_name in ['id', 'version', 'tech_mock']:
+            continue
+
+        annotation = type_hints[field_name]
+        if t.get_origin(annotation) is t.Annotated:
+            annotation = t.get_args(annotation)[0]
+        if t.get_origin(annotation) in [t.Union, types.UnionType]:
+            annotation = t.get_args(annotation)[0]
+
+        if t.get_origin(annotation) is list:
+            item_class = t.get_args(annotation)[0]
+            data[field_name] = [
+                _make_model_data(item_class, nested_rows, nested_rows, number, counter, reaction_uuids, i)
+                for i in range(rows)
+            ]
+
+        elif isinstance(annotation, type) and issubclass(annotation, dm.DomainModel):
+            data[field_name] = _make_model_data(annotation, rows, nested_rows, number, counter, reaction_uuids)
+
+        elif field_name in RAW_FIELD_NAMES:
+            data[field_name] = reaction_uuids[index]
+
+        elif field_name in UNIQUE_PER_PARENT_FIELD_NAMES and index > 0:
+            data[field_name] = {}
+
+        else:
+            data[field_name] = {'value': _make_value(annotation, number, next(counter))}
+
+    return data
+
+
+def _make_value(annotation: t.Any, number: int, index: int) -> t.Any:
+    origin = t.get_origin(annotation)
+
+    if origin is ft.Datetime:
+        return '20240115123045'
+
+    if origin in [ft.AlphaNumeric, ft.Alpha]:
+        max_length = t.get_args(t.get_args(annotation)[0])[0]
+        if origin is ft.Alpha:
+            return 'ABC'[:max_length]
+        return f'Text {number} {index}'[:max_length]
+
+    if origin is t.Literal:
+        return t.get_args(annotation)[0]
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, enum.Enum):
+            return next(iter(annotation)).value
+        if issubclass(annotation, bool):
+            return True
+        if issubclass(annotation, int):
+            return 10
+        if annotation.__name__ == 'Decimal':
+            return '1.5'
+
+    raise TypeError(f'Unexpected field type for benchmark data: {annotation}')
+
+
+class Command(BaseCommand):
+    help = 'Run benchmarks of ICSR processing and print the timings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('scenarios', nargs='*', help='Scenarios to run (all by default)')
+        parser.add_argument('--rows', type=int, default=10, help='Number of items in every list of ICSR')
+        parser.add_argument('--repeat', type=int, default=20, help='Number of runs for every scenario')
+        parser.add_argument(
+            '--nested-rows',
+            type=int,
+            default=None,
+            help='Number of items in lists of nested models (same as --rows by default)'
+        )
+
+    def handle(self, *args, **options):
+        scenarios = self.get_scenarios()
+        names = options['scenarios'] or list(scenarios.keys())
+        for name in names:
+            if name not in scenarios:
+                raise ValueError(f'Unknown scenario: {name}, expected one of: {", ".join(scenarios.keys())}')
+
+        for name in names:
+            scenarios[name](options)
+
+    def get_scenarios(self) -> dict[str, t.Callable[[dict[str, t.Any]], None]]:
+        return {
+            'api-construct': self.run_api_construct,
+            'api-validate': self.run_api_validate,
+            'api-serialize': self.run_api_serialize,
+            'compact-serialize': self.run_compact_serialize,
+            'domain-validate': self.run_domain_validate,
+            'storage-create': self.run_storage_create,
+            'storage-update': self.run_storage_update,
+            'storage-delete': self.run_storage_delete,
+            'storage-clone': self.run_storage_clone,
+            'date-parse': self.run_date_parse,
+        }
+
+    def run_api_construct(self, options: dict[str, t.Any]) -> None:
+        data = make_icsr_data(options['rows'])
+        self.measure(
+            'api-construct',
+            lambda: am.ICSR.model_dict_construct(data),
+            options,
+            size=len(json.dumps(data))
+        )
+
+    def run_api_validate(self, options: dict[str, t.Any]) -> None:
+        data = make_icsr_data(options['rows'])
+        self.measure('api-validate', lambda: am.ICSR.model_validate(data), options)
+
+    def run_api_serialize(self, options: dict[str, t.Any]) -> None:
+        data = make_icsr_data(options['rows'], nested_rows=options['nested_rows'])
+        model = am.ICSR.model_dict_construct(data).model_safe_validate(data)
+        self.measure(
+            'api-serialize',
+            lambda: model.model_dump_json(by_alias=True),
+            options,
+            size=len(model.model_dump_json(by_alias=True))
+        )
+
+    def run_compact_serialize(self, options: dict[str, t.Any]) -> None:
+        data = make_icsr_data(options['rows'], nested_rows=options['nested_rows'])
+        api_model = am.ICSR.model_dict_construct(data).model_safe_validate(data)
+        domain_model = ApiToDomainModelConverter.convert(api_model)
+        # As a model read from the storage, so that api models are not validated again
+        domain_model.is_trusted = True
+
+        # Both start from a read domain model, as the default format needs conversion to api models
+        def dump_default() -> bytes:
+            return DomainToApiModelConverter.convert(domain_model).model_dump_json(by_alias=True)
+
+        self.measure('default-serialize', dump_default, options, size=len(dump_default()))
+        self.measure(
+            'compact-serialize',
+            lambda: compact.dump(domain_model),
+            options,
+            size=len(compact.dump(domain_model))
+        )
+
+    def run_domain_validate(self, options: dict[str, t.Any]) -> None:
+        data = make_icsr_data(options['rows'])
+        api_model = am.ICSR.model_dict_construct(data).model_safe_validate(data)
+        domain_model, domain_data = ApiToDomainModelConverter.convert_to_model_and_dict(api_model)
+
+        with pde.PostValidationRuleProfiler() as profiler:
+            self.measure(
+                'domain-validate',
+                lambda: domain_model.model_business_validate(domain_data),
+                options
+            )
+
+        for rule_name, stats in profiler.get_summary().items():
+            self.stdout.write(
+                f'  {rule_name}: calls={stats["calls"]}, failures={stats["failures"]}, '
+                f'total_ms={round(stats["total_time"] * 1000, 3)}'
+            )
+
+    def run_storage_create(self, options: dict[str, t.Any]) -> None:
+        data = make_icsr_data(options['rows'], nested_rows=options['nested_rows'])
+        api_model = am.ICSR.model_dict_construct(data).model_safe_validate(data)
+        domain_model = ApiToDomainModelConverter.convert(api_model)
+        storage_service = StorageService()
+
+        def create() -> None:
+            # Every run saves new instances and its changes are rolled back
+            storage_model = DomainToStorageModelConverter.convert(domain_model)
+            with transaction.atomic():
+                storage_service.create(storage_model)
+                transaction.set_rollback(True)
+
+        with CaptureQueriesContext(connection) as queries:
+            create()
+        self.measure('storage-create', create, options, queries=len(queries))
+
+    def run_storage_update(self, options: dict[str, t.Any]) -> None:
+        data = make_icsr_data(options['rows'], nested_rows=options['nested_rows'])
+        api_model = am.ICSR.model_dict_construct(data).model_safe_validate(data)
+        storage_service = StorageService()
+
+        # The case is created only for the benchmark and its changes are rolled back in the end
+        with transaction.atomic():
+            storage_model, _ = storage_service.create(
+                DomainToStorageModelConverter.convert(ApiToDomainModelConverter.convert(api_model))
+            )
+            # As a case read to be edited, with a single field changed
+            domain_model = StorageToDomainModelConverter.convert(storage_service.read(type(storage_model), storage_model.id))
+            domain_model.c_3_information_sender_case_safety_report.c_3_2_sender_organisation = 'Edited'
+
+            def update() -> None:
+                new_storage_model = DomainToStorageModelConverter.convert(domain_model)
+                with transaction.atomic():
+                    storage_service.update(new_storage_model, storage_model.id)
+                    transaction.set_rollback(True)
+
+            with CaptureQueriesContext(connection) as queries:
+                update()
+            self.measure('storage-update', update, options, queries=len(queries))
+            transaction.set_rollback(True)
+
+    def run_storage_delete(self, options: dict[str, t.Any]) -> None:
+        storage_service = StorageService()
+        bulk_count = 10
+
+        # Cases are created only for the benchmark and its changes are rolled back in the end
+        with transaction.atomic():
+            pks = []
+            for number in range(bulk_count):
+                data = make_icsr_data(options['rows'], number=number, nested_rows=options['nested_rows'])
+                api_model = am.ICSR.model_dict_construct(data).model_safe_validate(data)
+                storage_model, _ = storage_service.create(
+                    DomainToStorageModelConverter.convert(ApiToDomainModelConverter.convert(api_model))
+                )
+                pks.append(storage_model.id)
+            model_class = type(storage_model)
+
+            def delete() -> None:
+                with transaction.atomic():
+                    storage_service.delete(model_class, pks[0])
+                    transaction.set_rollback(True)
+
+            def bulk_delete() -> None:
+                with transaction.atomic():
+                    storage_service.bulk_delete(model_class, pks)
+                    transaction.set_rollback(True)
+
+            for name, func in [('storage-delete', delete), (f'storage-bulk-delete-{bulk_count}', bulk_delete)]:
+                with CaptureQueriesContext(connection) as queries:
+                    func()
+                self.measure(name, func, options, queries=len(queries))
+            transaction.set_rollback(True)
+
+    def run_storage_clone(self, options: dict[str, t.Any]) -> None:
+        data = make_icsr_data(options['rows'], nested_rows=options['nested_rows'])
+        api_model = am.ICSR.model_dict_construct(data).model_safe_validate(data)
+        # Copy made by a client gets other unique values, as it would be rejected otherwise
+        copy_data = make_icsr_data(options['rows'], number=1, nested_rows=options['nested_rows'])
+        copy_api_model = am.ICSR.model_dict_construct(copy_data).model_safe_validate(copy_data)
+        storage_service = StorageService()
+
+        # The case is created only for the benchmark and its changes are rolled back in the end
+        with transaction.atomic():
+            storage_model, _ = storage_service.create(
+                DomainToStorageModelConverter.convert(ApiToDomainModelConverter.convert(api_model))
+            )
+            model_class = type(storage_model)
+
+            def read_and_create() -> None:
+                # As a client copies the case: reads it and creates the same data without ids again
+                StorageToDomainModelConverter.convert(storage_service.read(model_class, storage_model.id))
+                with transaction.atomic():
+                    storage_service.create(
+                        DomainToStorageModelConverter.convert(ApiToDomainModelConverter.convert(copy_api_model))
+                    )
+                    transaction.set_rollback(True)
+
+            def clone() -> None:
+                with transaction.atomic():
+                    storage_service.clone(model_class, storage_model.id)
+                    transaction.set_rollback(True)
+
+            for name, func in [('storage-read-create', read_and_create), ('storage-clone', clone)]:
+                with CaptureQueriesContext(connection) as queries:
+                    func()
+                self.measure(name, func, options, queries=len(queries))
+            transaction.set_rollback(True)
+
+    def run_date_parse(self, options: dict[str, t.Any]) -> None:
+        start = dt.datetime(2024, 1, 15, 12, 30, 45, 123400)
+        # Distinct values, so that every one of them is parsed when the cache is empty
+        full_values = [
+            (start + dt.timedelta(days=i * 400, minutes=i)).strftime('%Y%m%d%H%M%S.%f')[:19]
+            for i in range(options['rows'] * 100)
+        ]
+        lengths = {
+            DatePrecision.YEAR: 4,
+            DatePrecision.MONTH: 6,
+            DatePrecision.DAY: 8,
+            DatePrecision.HOUR: 10,
+            DatePrecision.MINUTE: 12,
+            DatePrecision.SECOND: 14,
+            DatePrecision.MILLISECOND: 19,
+        }
+
+        for precision, length in lengths.items():
+            values = [value[:length] for value in full_values]
+
+            def parse_all() -> None:
+                for value in values:
+                    HL7DateUtils.parse_and_get_precision(value)
+
+            def parse_all_uncached() -> None:
+                HL7DateUtils.try_parse.cache_clear()
+                parse_all()
+
+            name = f'date-parse-{precision.name.lower()}'
+            self.measure(name, parse_all_uncached, options, values=len(values))
+            self.measure(f'{name}-cached', parse_all, options, values=len(values))
+
+    def measure(self, name: str, func: t.Callable[[], t.Any], options: dict[str, t.Any], **extra: t.Any) -> None:
+        timings = []
+        for _ in range(options['repeat']):
+            # Garbage left by the previous run should not be collected during the measured one
+            gc.collect()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+        result = {
+            'rows': options['rows'],
+            'median_ms': round(statistics.median(timings) * 1000, 3),
+            'min_ms': round(min(timings) * 1000, 3),
+        }
+        result.update(extra)
+        self.stdout.write(f'{name}: ' + ', '.join(f'{k}={v}' for k, v in result.items()))
@@ -0,0 +1,358 @@
+# Generated by Django 5.0.2 on 2026-10-19 10:18
+
+import functools
+import itertools
+import operator
+
+import app.src.layers.storage.models.icsr
+from django.db import migrations
+from django.db.models import Q
+
+
+BATCH_SIZE = 1000
+
+
+def fill_date_derived_fields(apps, schema_editor):
+    for model in apps.get_app_config('app').get_models():
+        derived_fields = [
+            field for field in model._meta.concrete_fields
+            if isinstance(field, app.src.layers.storage.models.icsr.HL7DateDerivedField)
+        ]
+        if not derived_fields:
+            continue
+
+        # Rows are loaded in chunks with the date fields only, so that large tables don't take all the memory
+        date_field_names = {field.date_field_name for field in derived_fields}
+        has_date = functools.reduce(operator.or_, [Q(**{f'{name}__isnull': False}) for name in date_field_names])
+        queryset = model.objects.filter(has_date).only(*date_field_names).order_by('pk')
+        for instances in itertools.batched(queryset.iterator(chunk_size=BATCH_SIZE), BATCH_SIZE):
+            for instance in instances:
+                for field in derived_fields:
+                    field.pre_save(instance, add=False)
+            model.objects.bulk_update(instances, [field.name for field in derived_fields])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0019_auto_20240516_2304'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='c_1_identification_case_safety_report',
+            name='prec_c_1_2_date_creation',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='c_1_2_date_creation', null=True),
+        ),
+        migrations.AddField(
+            model_name='c_1_identification_case_safety_report',
+            name='prec_c_1_4_date_report_first_received_source',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='c_1_4_date_report_first_received_source', null=True),
+        ),
+        migrations.AddField(
+            model_name='c_1_identification_case_safety_report',
+            name='prec_c_1_5_date_most_recent_information',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='c_1_5_date_most_recent_information', null=True),
+        ),
+        migrations.AddField(
+            model_name='c_1_identification_case_safety_report',
+            name='ts_c_1_2_date_creation',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='c_1_2_date_creation', db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='c_1_identification_case_safety_report',
+            name='ts_c_1_4_date_report_first_received_source',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='c_1_4_date_report_first_received_source', db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='c_1_identification_case_safety_report',
+            name='ts_c_1_5_date_most_recent_information',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='c_1_5_date_most_recent_information', db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='prec_d_10_7_1_r_2_start_date',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_10_7_1_r_2_start_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='prec_d_10_7_1_r_4_end_date',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_10_7_1_r_4_end_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='ts_d_10_7_1_r_2_start_date',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_10_7_1_r_2_start_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='ts_d_10_7_1_r_4_end_date',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_10_7_1_r_4_end_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_10_8_r_past_drug_history_parent',
+            name='prec_d_10_8_r_4_start_date',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_10_8_r_4_start_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_10_8_r_past_drug_history_parent',
+            name='prec_d_10_8_r_5_end_date',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_10_8_r_5_end_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_10_8_r_past_drug_history_parent',
+            name='ts_d_10_8_r_4_start_date',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_10_8_r_4_start_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_10_8_r_past_drug_history_parent',
+            name='ts_d_10_8_r_5_end_date',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_10_8_r_5_end_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='prec_d_7_1_r_2_start_date',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_7_1_r_2_start_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='prec_d_7_1_r_4_end_date',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_7_1_r_4_end_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='ts_d_7_1_r_2_start_date',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_7_1_r_2_start_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='ts_d_7_1_r_4_end_date',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_7_1_r_4_end_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_8_r_past_drug_history',
+            name='prec_d_8_r_4_start_date',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_8_r_4_start_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_8_r_past_drug_history',
+            name='prec_d_8_r_5_end_date',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_8_r_5_end_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_8_r_past_drug_history',
+            name='ts_d_8_r_4_start_date',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_8_r_4_start_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_8_r_past_drug_history',
+            name='ts_d_8_r_5_end_date',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_8_r_5_end_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_patient_characteristics',
+            name='prec_d_10_2_1_date_birth_parent',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_10_2_1_date_birth_parent', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_patient_characteristics',
+            name='prec_d_10_3_last_menstrual_period_date_parent',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_10_3_last_menstrual_period_date_parent', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_patient_characteristics',
+            name='prec_d_2_1_date_birth',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_2_1_date_birth', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_patient_characteristics',
+            name='prec_d_6_last_menstrual_period_date',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_6_last_menstrual_period_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_patient_characteristics',
+            name='prec_d_9_1_date_death',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='d_9_1_date_death', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_patient_characteristics',
+            name='ts_d_10_2_1_date_birth_parent',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_10_2_1_date_birth_parent', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_patient_characteristics',
+            name='ts_d_10_3_last_menstrual_period_date_parent',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_10_3_last_menstrual_period_date_parent', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_patient_characteristics',
+            name='ts_d_2_1_date_birth',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_2_1_date_birth', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_patient_characteristics',
+            name='ts_d_6_last_menstrual_period_date',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_6_last_menstrual_period_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='d_patient_characteristics',
+            name='ts_d_9_1_date_death',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='d_9_1_date_death', null=True),
+        ),
+        migrations.AddField(
+            model_name='e_i_reaction_event',
+            name='prec_e_i_4_date_start_reaction',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='e_i_4_date_start_reaction', null=True),
+        ),
+        migrations.AddField(
+            model_name='e_i_reaction_event',
+            name='prec_e_i_5_date_end_reaction',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='e_i_5_date_end_reaction', null=True),
+        ),
+        migrations.AddField(
+            model_name='e_i_reaction_event',
+            name='ts_e_i_4_date_start_reaction',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='e_i_4_date_start_reaction', db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='e_i_reaction_event',
+            name='ts_e_i_5_date_end_reaction',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='e_i_5_date_end_reaction', null=True),
+        ),
+        migrations.AddField(
+            model_name='f_r_results_tests_procedures_investigation_patient',
+            name='prec_f_r_1_test_date',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='f_r_1_test_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='f_r_results_tests_procedures_investigation_patient',
+            name='ts_f_r_1_test_date',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='f_r_1_test_date', null=True),
+        ),
+        migrations.AddField(
+            model_name='g_k_4_r_dosage_information',
+            name='prec_g_k_4_r_4_date_time_drug',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='g_k_4_r_4_date_time_drug', null=True),
+        ),
+        migrations.AddField(
+            model_name='g_k_4_r_dosage_information',
+            name='prec_g_k_4_r_5_date_time_last_administration',
+            field=app.src.layers.storage.models.icsr.HL7DatePrecisionField(date_field_name='g_k_4_r_5_date_time_last_administration', null=True),
+        ),
+        migrations.AddField(
+            model_name='g_k_4_r_dosage_information',
+            name='ts_g_k_4_r_4_date_time_drug',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='g_k_4_r_4_date_time_drug', db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='g_k_4_r_dosage_information',
+            name='ts_g_k_4_r_5_date_time_last_administration',
+            field=app.src.layers.storage.models.icsr.HL7DateTimestampField(date_field_name='g_k_4_r_5_date_time_last_administration', null=True),
+        ),
+        migrations.AlterField(
+            model_name='c_1_identification_case_safety_report',
+            name='c_1_2_date_creation',
+            field=app.src.layers.storage.models.icsr.HL7DateField(is_indexed=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='c_1_identification_case_safety_report',
+            name='c_1_4_date_report_first_received_source',
+            field=app.src.layers.storage.models.icsr.HL7DateField(is_indexed=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='c_1_identification_case_safety_report',
+            name='c_1_5_date_most_recent_information',
+            field=app.src.layers.storage.models.icsr.HL7DateField(is_indexed=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='d_10_7_1_r_2_start_date',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='d_10_7_1_r_4_end_date',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_10_8_r_past_drug_history_parent',
+            name='d_10_8_r_4_start_date',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_10_8_r_past_drug_history_parent',
+            name='d_10_8_r_5_end_date',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='d_7_1_r_2_start_date',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='d_7_1_r_4_end_date',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_8_r_past_drug_history',
+            name='d_8_r_4_start_date',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_8_r_past_drug_history',
+            name='d_8_r_5_end_date',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_patient_characteristics',
+            name='d_10_2_1_date_birth_parent',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_patient_characteristics',
+            name='d_10_3_last_menstrual_period_date_parent',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_patient_characteristics',
+            name='d_2_1_date_birth',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_patient_characteristics',
+            name='d_6_last_menstrual_period_date',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='d_patient_characteristics',
+            name='d_9_1_date_death',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='e_i_reaction_event',
+            name='e_i_4_date_start_reaction',
+            field=app.src.layers.storage.models.icsr.HL7DateField(is_indexed=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='e_i_reaction_event',
+            name='e_i_5_date_end_reaction',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='f_r_results_tests_procedures_investigation_patient',
+            name='f_r_1_test_date',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='g_k_4_r_dosage_information',
+            name='g_k_4_r_4_date_time_drug',
+            field=app.src.layers.storage.models.icsr.HL7DateField(is_indexed=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='g_k_4_r_dosage_information',
+            name='g_k_4_r_5_date_time_last_administration',
+            field=app.src.layers.storage.models.icsr.HL7DateField(null=True),
+        ),
+        migrations.RunPython(fill_date_derived_fields, migrations.RunPython.noop),
+    ]
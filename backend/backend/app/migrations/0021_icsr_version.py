@@ -0,0 +1,18 @@
+# Generated by Django 5.0.2 on 2026-10-19 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0020_hl7_date_timestamp_precision'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='icsr',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
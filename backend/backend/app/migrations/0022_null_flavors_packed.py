@@ -0,0 +1,638 @@
+# Generated by Django 5.0.2 on 2026-10-19 11:41
+
+import functools
+import operator
+
+import app.src.layers.storage.models.icsr
+from django.db import migrations, models
+
+
+# Copies of the names and codes the null flavors were packed with, so that the migration doesn't change with the model
+NULL_FLAVOR_FIELD_NAME_PREFIX = 'nf_'
+NULL_FLAVORS_FIELD_NAME = 'null_flavors'
+BITS_PER_FIELD = 4
+NULL_FLAVOR_CODES = {
+    'NI': 1,
+    'MSK': 2,
+    'UNK': 3,
+    'NA': 4,
+    'ASKU': 5,
+    'NASK': 6,
+    'NINF': 7,
+    'PINF': 8,
+}
+
+
+def pack_null_flavors(apps, schema_editor):
+    """Moves the null flavors of the separate columns into the packed column with a single query per table."""
+    for model in apps.get_app_config('app').get_models():
+        null_flavors_field = _get_null_flavors_field(model)
+        if null_flavors_field is None:
+            continue
+
+        codes = []
+        has_null_flavor = models.Q()
+        for position, field_name in enumerate(null_flavors_field.field_names):
+            null_flavor_field_name = NULL_FLAVOR_FIELD_NAME_PREFIX + field_name
+            shift = position * BITS_PER_FIELD
+            codes.append(models.Case(
+                *[
+                    models.When(**{null_flavor_field_name: null_flavor}, then=models.Value(code << shift))
+                    for null_flavor, code in NULL_FLAVOR_CODES.items()
+                ],
+                default=models.Value(0),
+                output_field=models.BigIntegerField()
+            ))
+            has_null_flavor |= models.Q(**{f'{null_flavor_field_name}__isnull': False})
+
+        # Bits of the fields don't overlap, so their sum is the same as bitwise or
+        model.objects.filter(has_null_flavor).update(
+            null_flavors=functools.reduce(operator.add, codes)
+        )
+
+
+def unpack_null_flavors(apps, schema_editor):
+    for model in apps.get_app_config('app').get_models():
+        null_flavors_field = _get_null_flavors_field(model)
+        if null_flavors_field is None:
+            continue
+
+        null_flavor_field_names = [
+            NULL_FLAVOR_FIELD_NAME_PREFIX + field_name
+            for field_name in null_flavors_field.field_names
+        ]
+        null_flavors = {code: null_flavor for null_flavor, code in NULL_FLAVOR_CODES.items()}
+        instances = list(model.objects.filter(null_flavors__isnull=False))
+        for instance in instances:
+            for position, null_flavor_field_name in enumerate(null_flavor_field_names):
+                code = instance.null_flavors >> (position * BITS_PER_FIELD) & (2 ** BITS_PER_FIELD - 1)
+                setattr(instance, null_flavor_field_name, null_flavors.get(code))
+        model.objects.bulk_update(instances, null_flavor_field_names, batch_size=1000)
+
+
+def _get_null_flavors_field(model):
+    for field in model._meta.concrete_fields:
+        if field.name == NULL_FLAVORS_FIELD_NAME:
+            return field
+    return None
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0021_icsr_version'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='c_1_identification_case_safety_report',
+            name='choics__C_1_identification_case_s__nf_c_1_7_fulfil_local_cri',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_1_identification_case_safety_report',
+            name='choics__C_1_identification_case_s__nf_c_1_9_1_other_case_ids',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_2_r_primary_source_information',
+            name='choics__C_2_r_primary_source_info__nf_c_2_r_1_1_reporter_tit',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_2_r_primary_source_information',
+            name='choics__C_2_r_primary_source_info__nf_c_2_r_1_2_reporter_giv',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_2_r_primary_source_information',
+            name='choics__C_2_r_primary_source_info__nf_c_2_r_1_3_reporter_mid',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_2_r_primary_source_information',
+            name='choics__C_2_r_primary_source_info__nf_c_2_r_1_4_reporter_fam',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_2_r_primary_source_information',
+            name='choics__C_2_r_primary_source_info__nf_c_2_r_2_1_reporter_org',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_2_r_primary_source_information',
+            name='choics__C_2_r_primary_source_info__nf_c_2_r_2_2_reporter_dep',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_2_r_primary_source_information',
+            name='choics__C_2_r_primary_source_info__nf_c_2_r_2_3_reporter_str',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_2_r_primary_source_information',
+            name='choics__C_2_r_primary_source_info__nf_c_2_r_2_4_reporter_cit',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_2_r_primary_source_information',
+            name='choics__C_2_r_primary_source_info__nf_c_2_r_2_5_reporter_sta',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_2_r_primary_source_information',
+            name='choics__C_2_r_primary_source_info__nf_c_2_r_2_6_reporter_pos',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_2_r_primary_source_information',
+            name='choics__C_2_r_primary_source_info__nf_c_2_r_2_7_reporter_tel',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_2_r_primary_source_information',
+            name='choics__C_2_r_primary_source_info__nf_c_2_r_4_qualification',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_4_r_literature_reference',
+            name='choics__C_4_r_literature_referenc__nf_c_4_r_1_literature_ref',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_5_1_r_study_registration',
+            name='choics__C_5_1_r_study_registratio__nf_c_5_1_r_1_study_regist',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_5_1_r_study_registration',
+            name='choics__C_5_1_r_study_registratio__nf_c_5_1_r_2_study_regist',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_5_study_identification',
+            name='choics__C_5_study_identification__nf_c_5_2_study_name',
+        ),
+        migrations.RemoveConstraint(
+            model_name='c_5_study_identification',
+            name='choics__C_5_study_identification__nf_c_5_3_sponsor_study_nu',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='choics__D_10_7_1_r_structured_inf__nf_d_10_7_1_r_2_start_dat',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='choics__D_10_7_1_r_structured_inf__nf_d_10_7_1_r_3_continuin',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='choics__D_10_7_1_r_structured_inf__nf_d_10_7_1_r_4_end_date',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_10_8_r_past_drug_history_parent',
+            name='choics__D_10_8_r_past_drug_histor__nf_d_10_8_r_4_start_date',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_10_8_r_past_drug_history_parent',
+            name='choics__D_10_8_r_past_drug_histor__nf_d_10_8_r_5_end_date',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='choics__D_7_1_r_structured_inform__nf_d_7_1_r_2_start_date',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='choics__D_7_1_r_structured_inform__nf_d_7_1_r_3_continuing',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='choics__D_7_1_r_structured_inform__nf_d_7_1_r_4_end_date',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_8_r_past_drug_history',
+            name='choics__D_8_r_past_drug_history__nf_d_8_r_1_name_drug',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_8_r_past_drug_history',
+            name='choics__D_8_r_past_drug_history__nf_d_8_r_4_start_date',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_8_r_past_drug_history',
+            name='choics__D_8_r_past_drug_history__nf_d_8_r_5_end_date',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_1_patient',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_1_1_1_medical_record',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_1_1_2_medical_record',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_1_1_3_medical_record',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_1_1_4_medical_record',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_2_1_date_birth',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_5_sex',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_7_2_text_medical_his',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_9_1_date_death',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_9_3_autopsy',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_10_1_parent_identifi',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_10_2_1_date_birth_pa',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_10_3_last_menstrual',
+        ),
+        migrations.RemoveConstraint(
+            model_name='d_patient_characteristics',
+            name='choics__D_patient_characteristics__nf_d_10_6_sex_parent',
+        ),
+        migrations.RemoveConstraint(
+            model_name='e_i_reaction_event',
+            name='choics__E_i_reaction_event__nf_e_i_3_2a_results_death',
+        ),
+        migrations.RemoveConstraint(
+            model_name='e_i_reaction_event',
+            name='choics__E_i_reaction_event__nf_e_i_3_2b_life_threaten',
+        ),
+        migrations.RemoveConstraint(
+            model_name='e_i_reaction_event',
+            name='choics__E_i_reaction_event__nf_e_i_3_2c_caused_prolon',
+        ),
+        migrations.RemoveConstraint(
+            model_name='e_i_reaction_event',
+            name='choics__E_i_reaction_event__nf_e_i_3_2d_disabling_inc',
+        ),
+        migrations.RemoveConstraint(
+            model_name='e_i_reaction_event',
+            name='choics__E_i_reaction_event__nf_e_i_3_2e_congenital_an',
+        ),
+        migrations.RemoveConstraint(
+            model_name='e_i_reaction_event',
+            name='choics__E_i_reaction_event__nf_e_i_3_2f_other_medical',
+        ),
+        migrations.RemoveConstraint(
+            model_name='e_i_reaction_event',
+            name='choics__E_i_reaction_event__nf_e_i_4_date_start_react',
+        ),
+        migrations.RemoveConstraint(
+            model_name='e_i_reaction_event',
+            name='choics__E_i_reaction_event__nf_e_i_5_date_end_reactio',
+        ),
+        migrations.RemoveConstraint(
+            model_name='f_r_results_tests_procedures_investigation_patient',
+            name='choics__F_r_results_tests_procedu__nf_f_r_1_test_date',
+        ),
+        migrations.RemoveConstraint(
+            model_name='f_r_results_tests_procedures_investigation_patient',
+            name='choics__F_r_results_tests_procedu__nf_f_r_3_2_test_result_va',
+        ),
+        migrations.RemoveConstraint(
+            model_name='g_k_4_r_dosage_information',
+            name='choics__G_k_4_r_dosage_informatio__nf_g_k_4_r_4_date_time_dr',
+        ),
+        migrations.RemoveConstraint(
+            model_name='g_k_4_r_dosage_information',
+            name='choics__G_k_4_r_dosage_informatio__nf_g_k_4_r_5_date_time_la',
+        ),
+        migrations.RemoveConstraint(
+            model_name='g_k_4_r_dosage_information',
+            name='choics__G_k_4_r_dosage_informatio__nf_g_k_4_r_9_1_pharmaceut',
+        ),
+        migrations.RemoveConstraint(
+            model_name='g_k_4_r_dosage_information',
+            name='choics__G_k_4_r_dosage_informatio__nf_g_k_4_r_10_1_route_adm',
+        ),
+        migrations.RemoveConstraint(
+            model_name='g_k_4_r_dosage_information',
+            name='choics__G_k_4_r_dosage_informatio__nf_g_k_4_r_11_1_parent_ro',
+        ),
+        migrations.RemoveConstraint(
+            model_name='g_k_7_r_indication_use_case',
+            name='choics__G_k_7_r_indication_use_ca__nf_g_k_7_r_1_indication_p',
+        ),
+        migrations.AddField(
+            model_name='c_1_identification_case_safety_report',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['c_1_7_fulfil_local_criteria_expedited_report', 'c_1_9_1_other_case_ids_previous_transmissions']),
+        ),
+        migrations.AddField(
+            model_name='c_2_r_primary_source_information',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['c_2_r_1_1_reporter_title', 'c_2_r_1_2_reporter_given_name', 'c_2_r_1_3_reporter_middle_name', 'c_2_r_1_4_reporter_family_name', 'c_2_r_2_1_reporter_organisation', 'c_2_r_2_2_reporter_department', 'c_2_r_2_3_reporter_street', 'c_2_r_2_4_reporter_city', 'c_2_r_2_5_reporter_state_province', 'c_2_r_2_6_reporter_postcode', 'c_2_r_2_7_reporter_telephone', 'c_2_r_4_qualification']),
+        ),
+        migrations.AddField(
+            model_name='c_4_r_literature_reference',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['c_4_r_1_literature_reference']),
+        ),
+        migrations.AddField(
+            model_name='c_5_1_r_study_registration',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['c_5_1_r_1_study_registration_number', 'c_5_1_r_2_study_registration_country']),
+        ),
+        migrations.AddField(
+            model_name='c_5_study_identification',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['c_5_2_study_name', 'c_5_3_sponsor_study_number']),
+        ),
+        migrations.AddField(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['d_10_7_1_r_2_start_date', 'd_10_7_1_r_3_continuing', 'd_10_7_1_r_4_end_date']),
+        ),
+        migrations.AddField(
+            model_name='d_10_8_r_past_drug_history_parent',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['d_10_8_r_4_start_date', 'd_10_8_r_5_end_date']),
+        ),
+        migrations.AddField(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['d_7_1_r_2_start_date', 'd_7_1_r_3_continuing', 'd_7_1_r_4_end_date']),
+        ),
+        migrations.AddField(
+            model_name='d_8_r_past_drug_history',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['d_8_r_1_name_drug', 'd_8_r_4_start_date', 'd_8_r_5_end_date']),
+        ),
+        migrations.AddField(
+            model_name='d_patient_characteristics',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['d_1_patient', 'd_1_1_1_medical_record_number_source_gp', 'd_1_1_2_medical_record_number_source_specialist', 'd_1_1_3_medical_record_number_source_hospital', 'd_1_1_4_medical_record_number_source_investigation', 'd_2_1_date_birth', 'd_5_sex', 'd_7_2_text_medical_history', 'd_9_1_date_death', 'd_9_3_autopsy', 'd_10_1_parent_identification', 'd_10_2_1_date_birth_parent', 'd_10_3_last_menstrual_period_date_parent', 'd_10_6_sex_parent']),
+        ),
+        migrations.AddField(
+            model_name='e_i_reaction_event',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['e_i_3_2a_results_death', 'e_i_3_2b_life_threatening', 'e_i_3_2c_caused_prolonged_hospitalisation', 'e_i_3_2d_disabling_incapacitating', 'e_i_3_2e_congenital_anomaly_birth_defect', 'e_i_3_2f_other_medically_important_condition', 'e_i_4_date_start_reaction', 'e_i_5_date_end_reaction']),
+        ),
+        migrations.AddField(
+            model_name='f_r_results_tests_procedures_investigation_patient',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['f_r_1_test_date', 'f_r_3_2_test_result_val_qual']),
+        ),
+        migrations.AddField(
+            model_name='g_k_4_r_dosage_information',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['g_k_4_r_4_date_time_drug', 'g_k_4_r_5_date_time_last_administration', 'g_k_4_r_9_1_pharmaceutical_dose_form', 'g_k_4_r_10_1_route_administration', 'g_k_4_r_11_1_parent_route_administration']),
+        ),
+        migrations.AddField(
+            model_name='g_k_7_r_indication_use_case',
+            name='null_flavors',
+            field=app.src.layers.storage.models.icsr.NullFlavorsField(field_names=['g_k_7_r_1_indication_primary_source']),
+        ),
+        migrations.RunPython(pack_null_flavors, unpack_null_flavors),
+        migrations.RemoveField(
+            model_name='c_1_identification_case_safety_report',
+            name='nf_c_1_7_fulfil_local_criteria_expedited_report',
+        ),
+        migrations.RemoveField(
+            model_name='c_1_identification_case_safety_report',
+            name='nf_c_1_9_1_other_case_ids_previous_transmissions',
+        ),
+        migrations.RemoveField(
+            model_name='c_2_r_primary_source_information',
+            name='nf_c_2_r_1_1_reporter_title',
+        ),
+        migrations.RemoveField(
+            model_name='c_2_r_primary_source_information',
+            name='nf_c_2_r_1_2_reporter_given_name',
+        ),
+        migrations.RemoveField(
+            model_name='c_2_r_primary_source_information',
+            name='nf_c_2_r_1_3_reporter_middle_name',
+        ),
+        migrations.RemoveField(
+            model_name='c_2_r_primary_source_information',
+            name='nf_c_2_r_1_4_reporter_family_name',
+        ),
+        migrations.RemoveField(
+            model_name='c_2_r_primary_source_information',
+            name='nf_c_2_r_2_1_reporter_organisation',
+        ),
+        migrations.RemoveField(
+            model_name='c_2_r_primary_source_information',
+            name='nf_c_2_r_2_2_reporter_department',
+        ),
+        migrations.RemoveField(
+            model_name='c_2_r_primary_source_information',
+            name='nf_c_2_r_2_3_reporter_street',
+        ),
+        migrations.RemoveField(
+            model_name='c_2_r_primary_source_information',
+            name='nf_c_2_r_2_4_reporter_city',
+        ),
+        migrations.RemoveField(
+            model_name='c_2_r_primary_source_information',
+            name='nf_c_2_r_2_5_reporter_state_province',
+        ),
+        migrations.RemoveField(
+            model_name='c_2_r_primary_source_information',
+            name='nf_c_2_r_2_6_reporter_postcode',
+        ),
+        migrations.RemoveField(
+            model_name='c_2_r_primary_source_information',
+            name='nf_c_2_r_2_7_reporter_telephone',
+        ),
+        migrations.RemoveField(
+            model_name='c_2_r_primary_source_information',
+            name='nf_c_2_r_4_qualification',
+        ),
+        migrations.RemoveField(
+            model_name='c_4_r_literature_reference',
+            name='nf_c_4_r_1_literature_reference',
+        ),
+        migrations.RemoveField(
+            model_name='c_5_1_r_study_registration',
+            name='nf_c_5_1_r_1_study_registration_number',
+        ),
+        migrations.RemoveField(
+            model_name='c_5_1_r_study_registration',
+            name='nf_c_5_1_r_2_study_registration_country',
+        ),
+        migrations.RemoveField(
+            model_name='c_5_study_identification',
+            name='nf_c_5_2_study_name',
+        ),
+        migrations.RemoveField(
+            model_name='c_5_study_identification',
+            name='nf_c_5_3_sponsor_study_number',
+        ),
+        migrations.RemoveField(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='nf_d_10_7_1_r_2_start_date',
+        ),
+        migrations.RemoveField(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='nf_d_10_7_1_r_3_continuing',
+        ),
+        migrations.RemoveField(
+            model_name='d_10_7_1_r_structured_information_parent_meddra_code',
+            name='nf_d_10_7_1_r_4_end_date',
+        ),
+        migrations.RemoveField(
+            model_name='d_10_8_r_past_drug_history_parent',
+            name='nf_d_10_8_r_4_start_date',
+        ),
+        migrations.RemoveField(
+            model_name='d_10_8_r_past_drug_history_parent',
+            name='nf_d_10_8_r_5_end_date',
+        ),
+        migrations.RemoveField(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='nf_d_7_1_r_2_start_date',
+        ),
+        migrations.RemoveField(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='nf_d_7_1_r_3_continuing',
+        ),
+        migrations.RemoveField(
+            model_name='d_7_1_r_structured_information_medical_history',
+            name='nf_d_7_1_r_4_end_date',
+        ),
+        migrations.RemoveField(
+            model_name='d_8_r_past_drug_history',
+            name='nf_d_8_r_1_name_drug',
+        ),
+        migrations.RemoveField(
+            model_name='d_8_r_past_drug_history',
+            name='nf_d_8_r_4_start_date',
+        ),
+        migrations.RemoveField(
+            model_name='d_8_r_past_drug_history',
+            name='nf_d_8_r_5_end_date',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_10_1_parent_identification',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_10_2_1_date_birth_parent',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_10_3_last_menstrual_period_date_parent',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_10_6_sex_parent',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_1_1_1_medical_record_number_source_gp',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_1_1_2_medical_record_number_source_specialist',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_1_1_3_medical_record_number_source_hospital',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_1_1_4_medical_record_number_source_investigation',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_1_patient',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_2_1_date_birth',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_5_sex',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_7_2_text_medical_history',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_9_1_date_death',
+        ),
+        migrations.RemoveField(
+            model_name='d_patient_characteristics',
+            name='nf_d_9_3_autopsy',
+        ),
+        migrations.RemoveField(
+            model_name='e_i_reaction_event',
+            name='nf_e_i_3_2a_results_death',
+        ),
+        migrations.RemoveField(
+            model_name='e_i_reaction_event',
+            name='nf_e_i_3_2b_life_threatening',
+        ),
+        migrations.RemoveField(
+            model_name='e_i_reaction_event',
+            name='nf_e_i_3_2c_caused_prolonged_hospitalisation',
+        ),
+        migrations.RemoveField(
+            model_name='e_i_reaction_event',
+            name='nf_e_i_3_2d_disabling_incapacitating',
+        ),
+        migrations.RemoveField(
+            model_name='e_i_reaction_event',
+            name='nf_e_i_3_2e_congenital_anomaly_birth_defect',
+        ),
+        migrations.RemoveField(
+            model_name='e_i_reaction_event',
+            name='nf_e_i_3_2f_other_medically_important_condition',
+        ),
+        migrations.RemoveField(
+            model_name='e_i_reaction_event',
+            name='nf_e_i_4_date_start_reaction',
+        ),
+        migrations.RemoveField(
+            model_name='e_i_reaction_event',
+            name='nf_e_i_5_date_end_reaction',
+        ),
+        migrations.RemoveField(
+            model_name='f_r_results_tests_procedures_investigation_patient',
+            name='nf_f_r_1_test_date',
+        ),
+        migrations.RemoveField(
+            model_name='f_r_results_tests_procedures_investigation_patient',
+            name='nf_f_r_3_2_test_result_val_qual',
+        ),
+        migrations.RemoveField(
+            model_name='g_k_4_r_dosage_information',
+            name='nf_g_k_4_r_10_1_route_administration',
+        ),
+        migrations.RemoveField(
+            model_name='g_k_4_r_dosage_information',
+            name='nf_g_k_4_r_11_1_parent_route_administration',
+        ),
+        migrations.RemoveField(
+            model_name='g_k_4_r_dosage_information',
+            name='nf_g_k_4_r_4_date_time_drug',
+        ),
+        migrations.RemoveField(
+            model_name='g_k_4_r_dosage_information',
+            name='nf_g_k_4_r_5_date_time_last_administration',
+        ),
+        migrations.RemoveField(
+            model_name='g_k_4_r_dosage_information',
+            name='nf_g_k_4_r_9_1_pharmaceutical_dose_form',
+        ),
+        migrations.RemoveField(
+            model_name='g_k_7_r_indication_use_case',
+            name='nf_g_k_7_r_1_indication_primary_source',
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 5.0.2 on 2026-10-19 11:50
+
+import app.src.layers.storage.models.icsr
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Repeating groups with their parents, the fields of the parents, which keep the groups from now on, and the value fields
+EMBEDDED_MODELS = [
+    ('c_1_6_1_r_documents_held_sender', 'c_1_identification_case_safety_report',
+     'c_1_6_1_r_documents_held_sender', ['c_1_6_1_r_1_documents_held_sender']),
+    ('c_1_10_r_identification_number_report_linked', 'c_1_identification_case_safety_report',
+     'c_1_10_r_identification_number_report_linked', ['c_1_10_r_identification_number_report_linked']),
+    ('h_5_r_case_summary_reporter_comments_native_language', 'h_narrative_case_summary',
+     'h_5_r_case_summary_reporter_comments_native_language',
+     ['h_5_r_1a_case_summary_reporter_comments_text', 'h_5_r_1b_case_summary_reporter_comments_language']),
+]
+
+
+def make_embed_sql(model_name, parent_model_name, field_name, value_field_names):
+    """Moves the rows into json lists of their parents with a single query."""
+    json_object_args = ', '.join(f"'{name}', {name}" for name in value_field_names)
+    return f'''
+        UPDATE app_{parent_model_name} AS parent
+        SET {field_name} = items.items
+        FROM (
+            SELECT {parent_model_name}_id AS parent_id,
+                jsonb_agg(jsonb_strip_nulls(jsonb_build_object({json_object_args})) ORDER BY id) AS items
+            FROM app_{model_name}
+            GROUP BY {parent_model_name}_id
+        ) AS items
+        WHERE parent.id = items.parent_id
+    '''
+
+
+def make_unembed_sql(model_name, parent_model_name, field_name, value_field_names):
+    columns = ', '.join(value_field_names)
+    values = ', '.join(f"item.value ->> '{name}'" for name in value_field_names)
+    return f'''
+        INSERT INTO app_{model_name} ({parent_model_name}_id, {columns})
+        SELECT parent.id, {values}
+        FROM app_{parent_model_name} AS parent, jsonb_array_elements(parent.{field_name}) WITH ORDINALITY AS item
+        WHERE parent.{field_name} IS NOT NULL
+        ORDER BY parent.id, item.ordinality
+    '''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0022_null_flavors_packed'),
+    ]
+
+    operations = [
+        # Reverse relations are released for the fields with the same names
+        migrations.AlterField(
+            model_name='c_1_6_1_r_documents_held_sender',
+            name='c_1_identification_case_safety_report',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='app.c_1_identification_case_safety_report'),
+        ),
+        migrations.AlterField(
+            model_name='c_1_10_r_identification_number_report_linked',
+            name='c_1_identification_case_safety_report',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='app.c_1_identification_case_safety_report'),
+        ),
+        migrations.AlterField(
+            model_name='h_5_r_case_summary_reporter_comments_native_language',
+            name='h_narrative_case_summary',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='app.h_narrative_case_summary'),
+        ),
+        migrations.AddField(
+            model_name='c_1_identification_case_safety_report',
+            name='c_1_10_r_identification_number_report_linked',
+            field=app.src.layers.storage.models.icsr.EmbeddedModelsField(unique_field_names=['c_1_10_r_identification_number_report_linked']),
+        ),
+        migrations.AddField(
+            model_name='c_1_identification_case_safety_report',
+            name='c_1_6_1_r_documents_held_sender',
+            field=app.src.layers.storage.models.icsr.EmbeddedModelsField(),
+        ),
+        migrations.AddField(
+            model_name='h_narrative_case_summary',
+            name='h_5_r_case_summary_reporter_comments_native_language',
+            field=app.src.layers.storage.models.icsr.EmbeddedModelsField(),
+        ),
+        *[
+            migrations.RunSQL(make_embed_sql(*embedded_model), make_unembed_sql(*embedded_model))
+            for embedded_model in EMBEDDED_MODELS
+        ],
+        migrations.DeleteModel(
+            name='C_1_10_r_identification_number_report_linked',
+        ),
+        migrations.DeleteModel(
+            name='C_1_6_1_r_documents_held_sender',
+        ),
+        migrations.DeleteModel(
+            name='H_5_r_case_summary_reporter_comments_native_language',
+        ),
+    ]
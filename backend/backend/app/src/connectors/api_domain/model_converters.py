@@ -1,5 +1,9 @@
+import functools
+import types
 import typing as t
 
+import pydantic as pd
+
 from app.src.connectors.base.model_converters import pydantic as pmc
 from app.src.enums import NullFlavor
 from app.src.layers.api.models import ApiModel, Value
@@ -48,6 +52,10 @@ class DomainToApiModelConverter[S: DomainModel, T: ApiModel](pmc.PydanticSourceM
         if not source_model.is_valid:
             target_model.errors = source_model.errors
             return target_model
+        # Domain validation rules cover the api ones, so api model built from trusted domain model is trusted too
+        elif source_model.is_trusted:
+            target_model.is_trusted = True
+            return target_model
         else:
             return target_model.model_safe_validate(target_dict)
         
@@ -69,21 +77,38 @@ class DomainToApiModelConverter[S: DomainModel, T: ApiModel](pmc.PydanticSourceM
         value = field_data.initial_value
         field_name = field_data.name
 
-        if field_name in ['id', 'uuid', 'g_k_9_i_1_reaction_assessed']:
-            result_value = value
+        if field_name in ['id', 'uuid', 'version', 'g_k_9_i_1_reaction_assessed']:
+            model_data.update(field_name, value)
+            return True
 
+        pure_value = None
+        null_flavor = None
+        if isinstance(value, NullFlavor):
+            null_flavor = value
         else:
-            pure_value = None
-            null_flavor = None
-            if isinstance(value, NullFlavor):
-                null_flavor = value
-            else:
-                pure_value = value
+            pure_value = value
+
+        result_dict = {
+            'value': pure_value,
+            'null_flavor': null_flavor
+        }
+        model_data.update(field_name, result_dict)
+
+        # Model is constructed the same way as validation would do it,
+        # so that target model is complete even if it is not validated later
+        field_model_class = cls._get_field_model_class(model_data.target_class, field_name)
+        if field_model_class:
+            model_data.target_dict_with_models[field_name] = field_model_class.model_construct(**result_dict)
 
-            result_value = {
-                'value': pure_value,
-                'null_flavor': null_flavor
-            }
+        return True
 
-        model_data.update(field_name, result_value)
-        return True
\ No newline at end of file
+    @staticmethod
+    @functools.cache
+    def _get_field_model_class(model_class: type[ApiModel], field_name: str) -> type[pd.BaseModel] | None:
+        # Both `T` and `T | None` notations are supported
+        annotation = model_class.model_fields[field_name].annotation
+        if t.get_origin(annotation) in [t.Union, types.UnionType]:
+            annotation = t.get_args(annotation)[0]
+        if isinstance(annotation, type) and issubclass(annotation, pd.BaseModel):
+            return annotation
+        return None
\ No newline at end of file
@@ -35,8 +35,9 @@ class BaseModelConverter[S, T](abc.ABC):
 
         for source_attr_name, source_attr in vars(source_module).items():
             if inspect.isclass(source_attr) and issubclass(source_attr, source_class) and source_attr != source_class:
-                target_attr = getattr(target_module, source_attr_name)
-                if issubclass(target_attr, target_class):
+                # Models, which are embedded into other ones in the target layer, have no classes of their own there
+                target_attr = getattr(target_module, source_attr_name, None)
+                if inspect.isclass(target_attr) and issubclass(target_attr, target_class):
                     class_map[source_attr] = target_attr
 
         return class_map
@@ -42,3 +42,11 @@ class BaseServiceAdapter[U, L](ServiceProtocol[U]):
     def delete(self, upper_model_class: type[U], pk: int) -> bool:
         lower_model_class = self.upper_to_lower_model_converter.get_target_model_class(upper_model_class)
         return self.adapted_service.delete(lower_model_class, pk)
+
+    def bulk_delete(self, upper_model_class: type[U], pks: t.Iterable[int]) -> t.List[int]:
+        lower_model_class = self.upper_to_lower_model_converter.get_target_model_class(upper_model_class)
+        return self.adapted_service.bulk_delete(lower_model_class, pks)
+
+    def clone(self, upper_model_class: type[U], pk: int, overrides: dict[str, t.Any] | None = None) -> int:
+        lower_model_class = self.upper_to_lower_model_converter.get_target_model_class(upper_model_class)
+        return self.adapted_service.clone(lower_model_class, pk, overrides)
@@ -1,19 +1,23 @@
+import functools
+import logging
+import random
 import typing as t
 
-from django import forms
-from django.db import models
-from django.core import exceptions
+from django.conf import settings
 
 from app.src.connectors.base.model_converters import base as bmc
 from app.src.connectors.base.model_converters import pydantic as pmc
 from app.src.enums import NullFlavor
 from app.src.layers.domain import models as dm
 from app.src.layers.domain.models import DomainModel
-from app.src.layers.storage.models import StorageModel, null_flavor_field_utils
+from app.src.layers.storage.models import StorageModel
 from extensions import utils
 from extensions.django.fields import temp_relation_field_utils
 
 
+logger = logging.getLogger(__name__)
+
+
 class DomainToStorageModelConverter[S: DomainModel, T: StorageModel](pmc.PydanticSourceModelConverter[S, T]):
     @classmethod
     def convert(cls, source_model: S) -> T:
@@ -32,10 +36,19 @@ class DomainToStorageModelConverter[S: DomainModel, T: StorageModel](pmc.Pydanti
         shared_data: pmc.SharedData
     ) -> bool:
         
+        field_metadata = model_data.target_class.get_field_metadata()
+
         # Skip field parsing if it doesn't exist in model
-        try:
-            model_data.target_class._meta.get_field(field_data.name)
-        except exceptions.FieldDoesNotExist:
+        if field_data.name not in field_metadata.field_names:
+            field_data.is_skip_post_convert = True
+            return True
+
+        # Repeating groups stored on the model row are saved as json without ids
+        if field_data.name in field_metadata.embedded_field_names:
+            model_data.update(field_data.name, [
+                item.model_dump(mode='json', exclude={'id'}, exclude_none=True, warnings=False)
+                for item in field_data.initial_value
+            ])
             field_data.is_skip_post_convert = True
             return True
         
@@ -57,11 +70,11 @@ class DomainToStorageModelConverter[S: DomainModel, T: StorageModel](pmc.Pydanti
         value = field_data.initial_value
         field_name = field_data.name
         # Field existence was checked in pre_convert
-        target_model_field = model_data.target_class._meta.get_field(field_name)
+        field_metadata = model_data.target_class.get_field_metadata()
 
         # Resaving fields with relations as temp fields
         # This fields must have already been converted, but only if their value is not none
-        if field_data.is_converted and target_model_field.is_relation:
+        if field_data.is_converted and field_metadata.is_relation(field_name):
             temp_field_name = temp_relation_field_utils.make_special_field_name(field_name)
             model_data.target_dict_with_models[temp_field_name] = model_data.target_dict_with_models.pop(field_name)
             model_data.target_dict_with_dicts[temp_field_name] = model_data.target_dict_with_dicts.pop(field_name)
@@ -70,7 +83,7 @@ class DomainToStorageModelConverter[S: DomainModel, T: StorageModel](pmc.Pydanti
             return True
 
         if isinstance(value, NullFlavor):
-            null_flavor_field_name = null_flavor_field_utils.make_special_field_name(field_name)
+            null_flavor_field_name = field_metadata.null_flavor_field_names[field_name]
             model_data.update(null_flavor_field_name, value)
             return True
         
@@ -92,15 +105,16 @@ class DomainToStorageModelConverter[S: DomainModel, T: StorageModel](pmc.Pydanti
                 events[event_id] = target_model
 
         elif isinstance(source_model, dm.G_k_9_i_drug_reaction_matrix):
-            rels = utils.get_or_create_dict_in_dict(shared_data.context, relation_key)
-            rels[source_model.g_k_9_i_1_reaction_assessed] = target_model
+            # The same reaction can be assessed for several drugs
+            rels = shared_data.context.setdefault(relation_key, [])
+            rels.append((source_model.g_k_9_i_1_reaction_assessed, target_model))
 
         elif isinstance(source_model, dm.ICSR):
             events = shared_data.context.get(events_key)
             rels = shared_data.context.get(relation_key)
             if not rels:
                 return
-            for id_, rel in rels.items():
+            for id_, rel in rels:
                 rel.g_k_9_i_1_reaction_assessed = events[id_]
 
 
@@ -110,7 +124,26 @@ class StorageToDomainModelConverter[S: StorageModel, T: DomainModel](bmc.BaseMod
     @classmethod
     def convert(cls, source_model: S, include_related: bool = INCLUDE_RELATED_DEFAULT) -> T:
         target_model, target_dict = cls.convert_to_model_and_dict(source_model, include_related)
-        return target_model.model_safe_validate(target_dict)
+
+        # Stored data is validated before being saved, so it is trusted unless verification is required
+        if not cls.is_verify_on_read():
+            target_model.is_trusted = True
+            return target_model
+
+        target_model = target_model.model_safe_validate(target_dict)
+        if not target_model.is_valid:
+            logger.warning(
+                f'Stored {source_model.__class__.__name__}(id={source_model.id}) failed verification on read: ' +
+                f'{target_model.errors}'
+            )
+        return target_model
+
+    @staticmethod
+    def is_verify_on_read() -> bool:
+        if settings.STORAGE_VERIFY_ON_READ:
+            return True
+        sample_percent = settings.STORAGE_VERIFY_ON_READ_SAMPLE_PERCENT
+        return sample_percent > 0 and random.random() * 100 < sample_percent
 
     @classmethod
     def convert_to_model_and_dict(
@@ -119,40 +152,49 @@ class StorageToDomainModelConverter[S: StorageModel, T: DomainModel](bmc.BaseMod
         include_related: bool = INCLUDE_RELATED_DEFAULT
     ) -> tuple[T, dict[str, t.Any]]:
         """Same as in PydanticModelConverter but for conversion from django model."""
-        
-        target_dict_with_models = forms.model_to_dict(source_model)
-        target_dict_with_dicts = target_dict_with_models.copy()
-
-        for field in source_model._meta.get_fields():
-            field_name = field.name
 
-            # Method forms.model_to_dict have already assigned this field the id
-            if field_name == 'g_k_9_i_1_reaction_assessed':
-                continue
+        field_metadata = source_model.get_field_metadata()
+        null_flavor_field_names = field_metadata.null_flavor_field_names
 
-            if null_flavor_field_utils.is_special_field_name(field_name):
-                null_flavor = target_dict_with_models.pop(field_name)
-                target_dict_with_dicts.pop(field_name)
-                if null_flavor:
-                    value_field_name = null_flavor_field_utils.get_base_field_name(field_name)
-                    result_value = NullFlavor(null_flavor)
-                    target_dict_with_models[value_field_name] = result_value
-                    target_dict_with_dicts[value_field_name] = result_value
+        # Forward relations are retrieved as ids (as it is done by forms.model_to_dict)
+        target_dict_with_models = {
+            field_name: getattr(source_model, attname)
+            for field_name, attname in field_metadata.concrete_field_attnames.items()
+        }
 
-            # Related models are retrieved only from 1-m and backward 1-1 relations
-            # (1-m relations can only be created as backward relations in django).
-            # m-m relations are ignored as there are none among the models.
-            # Forward relations are ignored as the domain models are only aware of embedded models
-            # (which are stored in storage models backward relations).
+        for value_field_name, null_flavor_field_name in null_flavor_field_names.items():
+            null_flavor = getattr(source_model, null_flavor_field_name)
+            if null_flavor:
+                target_dict_with_models[value_field_name] = null_flavor
 
-            # m-1 and forward 1-1 relations are retrieved as ids by forms.model_to_dict
-
-            # Last condition checks if this field is a backward (reverse) relation
-            if not include_related or not field.is_relation or not isinstance(field, models.ForeignObjectRel):
-                continue
+        target_dict_with_dicts = target_dict_with_models.copy()
+        target_model_class = cls.get_target_model_class(type(source_model))
 
-            if field.one_to_many:
-                related_source_models = getattr(source_model, field_name).all()
+        for field_name in field_metadata.embedded_field_names:
+            items = getattr(source_model, field_name) or []
+            item_class = cls._get_embedded_model_class(target_model_class, field_name)
+            target_dict_with_models[field_name] = [
+                pmc.PydanticSourceModelConverter.construct_pydantic_model(item_class, item) for item in items
+            ]
+            target_dict_with_dicts[field_name] = [dict(item) for item in items]
+
+        # Related models are retrieved only from 1-m and backward 1-1 relations
+        # (1-m relations can only be created as backward relations in django).
+        # m-m relations are ignored as there are none among the models.
+        # Forward relations are ignored as the domain models are only aware of embedded models
+        # (which are stored in storage models backward relations).
+        if not include_related:
+            backward_relations = []
+        else:
+            backward_relations = field_metadata.backward_relations.values()
+
+        for relation in backward_relations:
+            field_name = relation.name
+
+            # Related models are taken from the unit of work of the storage layer if they are already loaded
+            related_source_models = source_model.get_related_models(field_name)
+
+            if relation.is_many:
                 target_list_with_models = []
                 target_list_with_dicts = []
 
@@ -164,13 +206,16 @@ class StorageToDomainModelConverter[S: StorageModel, T: DomainModel](bmc.BaseMod
                 target_dict_with_models[field_name] = target_list_with_models
                 target_dict_with_dicts[field_name] = target_list_with_dicts
 
-            elif field.one_to_one:
-                related_source_model = getattr(source_model, field_name, None)
-                if related_source_model:
-                    model, dict_ = cls.convert_to_model_and_dict(related_source_model, include_related)
-                    target_dict_with_models[field_name] = model
-                    target_dict_with_dicts[field_name] = dict_
+            elif related_source_models:
+                model, dict_ = cls.convert_to_model_and_dict(related_source_models[0], include_related)
+                target_dict_with_models[field_name] = model
+                target_dict_with_dicts[field_name] = dict_
 
-        target_model_class = cls.get_target_model_class(type(source_model))
         target_model = pmc.PydanticSourceModelConverter.construct_pydantic_model(target_model_class, target_dict_with_models)
-        return target_model, target_dict_with_dicts
\ No newline at end of file
+        return target_model, target_dict_with_dicts
+
+    @staticmethod
+    @functools.cache
+    def _get_embedded_model_class(model_class: type[DomainModel], field_name: str) -> type[DomainModel]:
+        # Only `list[T]` notation is supported
+        return t.get_args(t.get_type_hints(model_class)[field_name])[0]
\ No newline at end of file
@@ -3,6 +3,7 @@ from app.src.connectors.domain_storage import model_converters as mc
 from app.src.layers.domain.models import DomainModel
 from app.src.layers.storage.models import StorageModel
 from app.src.layers.storage.services import StorageService
+from app.src.layers.storage.unit_of_work import UnitOfWork
 
 
 class StorageServiceAdapter(BaseServiceAdapter[DomainModel, StorageModel]):
@@ -12,3 +13,17 @@ class StorageServiceAdapter(BaseServiceAdapter[DomainModel, StorageModel]):
             upper_to_lower_model_converter=mc.DomainToStorageModelConverter(),
             lower_to_upper_model_converter=mc.StorageToDomainModelConverter()
         )
+
+    # Models loaded and saved by the storage service are converted without fetching them again
+
+    def read(self, upper_model_class: type[DomainModel], pk: int) -> DomainModel:
+        with UnitOfWork.join():
+            return super().read(upper_model_class, pk)
+
+    def create(self, upper_model: DomainModel) -> tuple[DomainModel, bool]:
+        with UnitOfWork.join():
+            return super().create(upper_model)
+
+    def update(self, upper_model: DomainModel, pk: int) -> tuple[DomainModel, bool]:
+        with UnitOfWork.join():
+            return super().update(upper_model, pk)
@@ -1,2 +1,6 @@
 class UserError(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class ConflictError(UserError):
+    pass
@@ -1,10 +1,10 @@
+import calendar
 import datetime as dt
 import enum
+import functools
 import re
 import typing as t
 
-from hl7apy import utils
-
 
 class DatePrecision(enum.IntEnum):
     YEAR = enum.auto()
@@ -15,53 +15,90 @@ class DatePrecision(enum.IntEnum):
     SECOND = enum.auto()
     MILLISECOND = enum.auto()
 
-    __MAP = {
-        '%Y': YEAR,
-        '%Y%m': MONTH,
-        '%Y%m%d': DAY,
-        '%Y%m%d%H': HOUR,
-        '%Y%m%d%H%M': MINUTE,
-        '%Y%m%d%H%M%S': SECOND,
-        '%Y%m%d%H%M%S.%f': MILLISECOND,
-    }
 
-    @classmethod
-    def from_format(cls, format: str) -> t.Self:
-        return cls.__MAP[format]
-    
+class HL7Date(t.NamedTuple):
+    datetime: dt.datetime
+    precision: DatePrecision
+    # Timezone offset as written in the value, e.g. +0100, or empty string if not specified
+    offset: str
+
 
 class HL7DateUtils:
+    # Formats are YYYY[MM[DD[HH[MM[SS[.S[S[S[S]]]]]]]]][+/-ZZZZ]
+    _PATTERN = re.compile(
+        r'(?P<year>\d{4})'
+        r'(?:(?P<month>\d{2})(?:(?P<day>\d{2})(?:(?P<hour>\d{2})(?:(?P<minute>\d{2})(?:(?P<second>\d{2})'
+        r'(?:\.(?P<fraction>\d{1,4}))?)?)?)?)?)?'
+        # Timezone without minutes is supported as well
+        r'(?P<offset>(?:\+(?:1[0-4]|0\d)|-(?:1[0-2]|0\d))(?:[0-5]\d)?)?'
+    )
+    _PRECISIONS = [
+        ('month', DatePrecision.YEAR),
+        ('day', DatePrecision.MONTH),
+        ('hour', DatePrecision.DAY),
+        ('minute', DatePrecision.HOUR),
+        ('second', DatePrecision.MINUTE),
+        ('fraction', DatePrecision.SECOND),
+    ]
+
     @classmethod
     def parse_and_get_precision(cls, value: str) -> DatePrecision:
-        return DatePrecision.from_format(cls.parse(value)[1])
+        return cls.parse(value).precision
+
+    @classmethod
+    def parse(cls, value: str) -> HL7Date:
+        date = cls.try_parse(value)
+        if date is None:
+            raise ValueError(f'{value} is not an HL7 valid date value')
+        return date
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def try_parse(cls, value: str) -> HL7Date | None:
+        """Returns None if the value is not a valid date, values are cached as they are repeated a lot in a case."""
 
-    @staticmethod
-    def parse(value: str) -> tuple[dt.datetime, str, str, int]:
-        try:
-            return utils.get_datetime_info(value)
+        match = cls._PATTERN.fullmatch(value)
+        if not match:
+            return None
         
-        # The first error will be rethrown if new occur
-        except ValueError as exc: 
-            new_value = value
-
-            # Support for 24 hours format
-            if re.match(r'\d{8}24', value):
-                try:
-                    date = utils.get_date_info(value[0: 8])[0]
-                except ValueError:
-                    raise exc
-                date += dt.timedelta(days=1)
-                new_value = date.strftime('%Y%m%d') + '00' + value[10:]
-
-            # Support for timezone without minutes format
-            if re.fullmatch(r'.*[+|-]\d{2}', new_value):
-                new_value += '00'
-
-            # Extra support conditions were not met
-            if new_value == value:
-                raise exc
-            
-            try:
-                return utils.get_datetime_info(new_value)
-            except ValueError:
-                raise exc
\ No newline at end of file
+        year, month, day, hour, minute, second, fraction, offset = match.groups()
+
+        precision = DatePrecision.MILLISECOND
+        for group_name, group_precision in cls._PRECISIONS:
+            if match.group(group_name) is None:
+                precision = group_precision
+                break
+
+        year = int(year)
+        month = int(month or 1)
+        day = int(day or 1)
+        hour = int(hour or 0)
+        minute = int(minute or 0)
+        second = int(second or 0)
+        microsecond = int(fraction.ljust(6, '0')) if fraction else 0
+
+        if not (
+            year >= dt.MINYEAR
+            and 1 <= month <= 12
+            and 1 <= day <= calendar.monthrange(year, month)[1]
+            # Support for 24 hours format, which means the start of the next day
+            and 0 <= hour <= 24
+            and 0 <= minute <= 59
+            and 0 <= second <= 59
+        ):
+            return None
+
+        is_next_day = hour == 24
+        if is_next_day:
+            hour = 0
+
+        datetime = dt.datetime(year, month, day, hour, minute, second, microsecond)
+        if is_next_day:
+            if datetime.date() == dt.date.max:
+                return None
+            datetime += dt.timedelta(days=1)
+
+        if offset and len(offset) == 3:
+            offset += '00'
+
+        return HL7Date(datetime, precision, offset or '')
@@ -0,0 +1,64 @@
+import concurrent.futures as cf
+import functools
+import multiprocessing
+import signal
+import typing as t
+
+import django
+from django.conf import settings
+
+from app.src.layers.api.models import ApiModel
+from app.src.layers.api.models.batch import CaseValidationStatus
+from app.src.layers.base.services import BusinessServiceProtocol
+
+
+class CaseValidationTimeoutError(Exception):
+    pass
+
+
+@functools.cache
+def get_executor() -> cf.ProcessPoolExecutor:
+    """The pool is created on first use and shared by all requests of the server process."""
+    return cf.ProcessPoolExecutor(
+        max_workers=settings.BATCH_VALIDATION_POOL_SIZE,
+        # Spawned processes don't inherit threads, locks and db connections of the server process
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=django.setup
+    )
+
+
+def reset_executor(executor: cf.ProcessPoolExecutor) -> None:
+    """Drops the pool, e.g. if it is broken by a terminated process, so that a new one is created on next use."""
+    if get_executor.cache_info().currsize and get_executor() is executor:
+        get_executor.cache_clear()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def validate_case(
+    domain_service: BusinessServiceProtocol[ApiModel],
+    model_class: type[ApiModel],
+    json_data: str | bytes,
+    timeout: float
+) -> tuple[CaseValidationStatus, dict[str, t.Any]]:
+    """Runs in a pool process, the same way as business validation of a single case, but aborted after the timeout."""
+
+    previous_handler = signal.signal(signal.SIGALRM, _raise_timeout_error)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        model = model_class.model_safe_validate_json(json_data)
+        if model.is_valid:
+            model, is_ok = domain_service.business_validate(model)
+        else:
+            is_ok = False
+        return (CaseValidationStatus.VALID if is_ok else CaseValidationStatus.INVALID), model.errors
+
+    except CaseValidationTimeoutError:
+        return CaseValidationStatus.TIMEOUT, {}
+
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _raise_timeout_error(signum: int, frame: t.Any) -> None:
+    raise CaseValidationTimeoutError()
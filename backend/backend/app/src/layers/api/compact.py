@@ -0,0 +1,78 @@
+"""
+Compact json format, which maps directly onto domain models.
+Values are not wrapped into value models, null flavors are kept in a sparse map of each model and
+errors are saved only in the root model, e.g.:
+{"c_1_7_fulfil_local_criteria_expedited_report": null, "_null_flavors": {"c_1_7_fulfil_local_criteria_expedited_report": "NI"}}
+"""
+
+import json
+import typing as t
+
+import pydantic_core as pdc
+
+from app.src.enums import NullFlavor
+from app.src.exceptions import UserError
+from extensions import pydantic as pde
+
+
+MEDIA_TYPE = 'application/vnd.e2b.compact+json'
+NULL_FLAVORS_KEY = '_null_flavors'
+
+
+def load[T: pde.SafeValidatableModel](model_class: type[T], json_data: str | bytes) -> tuple[T, dict[str, t.Any]]:
+    """Returns the model constructed without validation and the data to validate it with."""
+    data = json.loads(json_data)
+    if not isinstance(data, dict):
+        raise UserError('Invalid compact data: json object expected')
+    _move_null_flavors_to_values(data)
+    return model_class.model_dict_construct(data), data
+
+
+def dump(model: pde.SafeValidatableModel) -> bytes:
+    data = model.model_dump(by_alias=True, warnings=False)
+    errors = data.pop(model.ERRORS_KEY, None)
+    _move_null_flavors_to_map(data)
+    if errors:
+        data[model.ERRORS_KEY] = errors
+    return pdc.to_json(data)
+
+
+def _move_null_flavors_to_values(data: dict[str, t.Any]) -> None:
+    null_flavors = data.pop(NULL_FLAVORS_KEY, None) or {}
+    if not isinstance(null_flavors, dict):
+        raise UserError(f'Invalid compact data: {NULL_FLAVORS_KEY} should be a json object')
+
+    for key, null_flavor in null_flavors.items():
+        if data.get(key) is not None:
+            raise UserError(f'Null flavor should not be specified if value is specified: {key}')
+        try:
+            data[key] = NullFlavor(null_flavor)
+        except ValueError:
+            raise UserError(f'Invalid null flavor of {key}: {null_flavor}')
+
+    for value in data.values():
+        if isinstance(value, dict):
+            _move_null_flavors_to_values(value)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    _move_null_flavors_to_values(item)
+
+
+def _move_null_flavors_to_map(data: dict[str, t.Any]) -> None:
+    null_flavors = {}
+
+    for key, value in data.items():
+        if isinstance(value, NullFlavor):
+            null_flavors[key] = value
+        elif isinstance(value, dict):
+            _move_null_flavors_to_map(value)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    _move_null_flavors_to_map(item)
+
+    for key in null_flavors.keys():
+        data[key] = None
+    if null_flavors:
+        data[NULL_FLAVORS_KEY] = null_flavors
@@ -0,0 +1,36 @@
+import enum
+import typing as t
+
+import pydantic as pd
+
+
+class BatchValidationRequest(pd.BaseModel):
+    # Cases in the same format as for the single case validation
+    cases: list[dict[str, t.Any]] = []
+    # Ids of stored cases
+    ids: list[int] = []
+
+
+class CaseValidationStatus(enum.StrEnum):
+    VALID = enum.auto()
+    INVALID = enum.auto()
+    TIMEOUT = enum.auto()
+    NOT_FOUND = enum.auto()
+    ERROR = enum.auto()
+
+
+class CaseValidationResult(pd.BaseModel):
+    # Either index of the case in the request cases or id of the stored case is set
+    index: int | None = None
+    id: int | None = None
+    status: CaseValidationStatus
+    errors: dict[str, t.Any] = pd.Field(default={}, serialization_alias='_errors')
+
+
+class BatchDeleteRequest(pd.BaseModel):
+    ids: list[int]
+
+
+class BatchDeleteResult(pd.BaseModel):
+    deleted: list[int]
+    not_found: list[int]
@@ -14,16 +14,13 @@ class Value[T](pde.PostValidatableModel, pde.SafeValidatableModel):
 class NullableValue[T, N](Value[T]):
     null_flavor: N | None = None
 
-    @classmethod
-    def _post_validate(cls, processor: pde.PostValidationProcessor) -> None:
-        processor.try_validate_with_fields(
-            error_message='Null flavor should not be specified if value is specified',
-            is_add_single_error=True,
-            validate=lambda 
-                value, 
-                null_flavor:
-                value is None or null_flavor is None
-        )
+    @pde.post_validation_rule(
+        error_message='Null flavor should not be specified if value is specified',
+        is_add_single_error=True
+    )
+    @staticmethod
+    def _validate_value_or_null_flavor(value: T | None, null_flavor: N | None) -> bool:
+        return value is None or null_flavor is None
 
 
 class ApiModel(pde.PostValidatableModel, pde.SafeValidatableModel):
@@ -31,6 +28,7 @@ class ApiModel(pde.PostValidatableModel, pde.SafeValidatableModel):
                 
 
 class ICSR(ApiModel):
+    version: int | None = None
     c_1_identification_case_safety_report: t.Optional['C_1_identification_case_safety_report'] = None
     c_2_r_primary_source_information: list['C_2_r_primary_source_information'] = []
     c_3_information_sender_case_safety_report: t.Optional['C_3_information_sender_case_safety_report'] = None
@@ -1,18 +1,26 @@
 import base64
+import concurrent.futures as cf
+import contextlib
+import functools
 import json
+import logging
 from http import HTTPStatus
 import typing as t
 
 from django import http
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.shortcuts import render
 from django.utils import timezone as djtz
 from django.views import View
 
+import pydantic as pd
 import xmltodict
 
-from app.src.exceptions import UserError
-from app.src.layers.api.models import ApiModel, meddra, code_set
+from app.src.connectors.base.model_converters.base import BaseModelConverter
+from app.src.exceptions import ConflictError, UserError
+from app.src.layers.api import batch_validation, compact
+from app.src.layers.api.models import ApiModel, batch, meddra, code_set
 from app.src.layers.api.models.logging import Log
 from app.src.layers.base.services import (
     BusinessServiceProtocol, 
@@ -20,9 +28,40 @@ from app.src.layers.base.services import (
     CodeSetServiceProtocol,
     MedDRAServiceProtocol
 )
+from app.src.layers.domain.models import DomainModel
+from app.src.layers.domain.services import DomainService
+from extensions import pydantic as pde
 from extensions import utils
 
 
+logger = logging.getLogger(__name__)
+
+JSON_MEDIA_TYPE = 'application/json'
+
+
+def negotiate_media_type(request: http.HttpRequest, media_types: list[str]) -> str | None:
+    """
+    Returns the media type with the highest quality in the Accept header, earlier media types win ties.
+    Quality of a media type is taken from the most specific media range matching it.
+    """
+    best_media_type, best_quality = None, 0.0
+    for media_type in media_types:
+        matching_ranges = [accepted for accepted in request.accepted_types if accepted.match(media_type)]
+        if not matching_ranges:
+            continue
+        most_specific = max(
+            matching_ranges,
+            key=lambda accepted: (accepted.main_type != '*', accepted.sub_type != '*')
+        )
+        try:
+            quality = float(most_specific.params.get('q', 1))
+        except ValueError:
+            quality = 1.0
+        if quality > best_quality:
+            best_media_type, best_quality = media_type, quality
+    return best_media_type
+
+
 def log(method: t.Callable[[http.HttpRequest], http.HttpResponse]) \
 -> t.Callable[[http.HttpRequest], http.HttpResponse]:
     
@@ -74,33 +113,83 @@ class AuthView(View):
 class BaseView(AuthView):
     domain_service: BusinessServiceProtocol[ApiModel] = ...
     model_class: type[ApiModel] = ...
+    # Services and models of the domain layer used for the compact format, which is not supported if they are not set
+    compact_domain_service: DomainService | None = None
+    compact_model_class: type[DomainModel] | None = None
+    to_compact_model_converter: BaseModelConverter[ApiModel, DomainModel] | None = None
+    from_compact_model_converter: BaseModelConverter[DomainModel, ApiModel] | None = None
 
     def dispatch(self, request: http.HttpRequest, *args, **kwargs) -> http.HttpResponse:
+        with pde.ValidationCounter() as validation_counter:
+            response = self._dispatch_safely(request, *args, **kwargs)
+        logger.debug(
+            f'{request.method} {request.path}: {validation_counter.total} model validations ' +
+            f'{validation_counter.get_summary()}'
+        )
+        return response
+
+    def _dispatch_safely(self, request: http.HttpRequest, *args, **kwargs) -> http.HttpResponse:
         try:
             return super().dispatch(request, *args, **kwargs)
         except (TypeError, json.JSONDecodeError):
             return http.HttpResponse('Invalid json data', status=HTTPStatus.BAD_REQUEST)
+        except ConflictError as e:
+            return http.HttpResponse(str(e), status=HTTPStatus.CONFLICT)
         except UserError as e:
             return http.HttpResponse(str(e), status=HTTPStatus.BAD_REQUEST)
 
-    def get_model_from_request(self, request: http.HttpRequest) -> ApiModel:
-        data = json.loads(request.body)
-        model = self.model_class.model_dict_construct(data)
-        return model.model_safe_validate(data)
+    def is_compact_request(self) -> bool:
+        """Request data is compact if it is sent with the compact media type."""
+        return self.compact_domain_service is not None and self.request.content_type == compact.MEDIA_TYPE
+
+    def is_compact_response(self) -> bool:
+        """
+        Response format is negotiated by quality values of the Accept header,
+        the format of the request data is preferred if both formats are equally acceptable.
+        """
+        if self.compact_domain_service is None:
+            return False
+        media_types = [JSON_MEDIA_TYPE, compact.MEDIA_TYPE]
+        if self.is_compact_request():
+            media_types.reverse()
+        return negotiate_media_type(self.request, media_types) == compact.MEDIA_TYPE
+
+    def get_domain_service(self, is_compact: bool) -> BusinessServiceProtocol[ApiModel] | DomainService:
+        return self.compact_domain_service if is_compact else self.domain_service
+
+    def get_model_class(self, is_compact: bool) -> type[ApiModel] | type[DomainModel]:
+        return self.compact_model_class if is_compact else self.model_class
+
+    def get_model_from_request(self, request: http.HttpRequest) -> ApiModel | DomainModel:
+        if self.is_compact_request():
+            model, data = compact.load(self.compact_model_class, request.body)
+            return model.model_safe_validate(data)
+        return self.model_class.model_safe_validate_json(request.body)
 
     def get_status_code(self, is_ok: bool) -> HTTPStatus:
         return HTTPStatus.OK if is_ok else HTTPStatus.BAD_REQUEST
 
-    def respond_with_model_as_json(self, model: ApiModel, status: HTTPStatus) -> http.HttpResponse:
-        # Dump data and ignore warnings about wrong data format and etc.
-        data = utils.exec_without_warnings(lambda: model.model_dump_json(by_alias=True))
+    def respond_with_model_as_json(self, model: ApiModel | DomainModel, status: HTTPStatus) -> http.HttpResponse:
+        if self.is_compact_response():
+            if not isinstance(model, DomainModel):
+                model = self.to_compact_model_converter.convert(model)
+            return self.respond_with_json(compact.dump(model), status, content_type=compact.MEDIA_TYPE)
+        if isinstance(model, DomainModel):
+            model = self.from_compact_model_converter.convert(model)
+        # Invalid models hold data of wrong types, pydantic warnings about them are not needed
+        data = model.model_dump_json(by_alias=True, warnings=False)
         return self.respond_with_json(data, status)
 
     def respond_with_object_as_json(self, obj: t.Any, status: HTTPStatus) -> http.HttpResponse:
-        return self.respond_with_json(json.dumps(obj), status)
+        return self.respond_with_json(utils.dump_json(obj), status)
 
-    def respond_with_json(self, json_str: str, status: HTTPStatus) -> http.HttpResponse:
-        return http.HttpResponse(json_str, status=status, content_type='application/json')
+    def respond_with_json(
+        self,
+        json_data: str | bytes,
+        status: HTTPStatus,
+        content_type: str = JSON_MEDIA_TYPE
+    ) -> http.HttpResponse:
+        return http.HttpResponse(json_data, status=status, content_type=content_type)
 
 
 class ModelClassView(BaseView):
@@ -113,7 +202,7 @@ class ModelClassView(BaseView):
         model = self.get_model_from_request(request)
         if model.is_valid:
             # TODO: check id empty
-            model, is_ok = self.domain_service.create(model)
+            model, is_ok = self.get_domain_service(self.is_compact_request()).create(model)
         else:
             is_ok = False
         status = self.get_status_code(is_ok)
@@ -122,7 +211,8 @@ class ModelClassView(BaseView):
 
 class ModelInstanceView(BaseView):
     def get(self, request: http.HttpRequest, pk: int) -> http.HttpResponse:
-        model = self.domain_service.read(self.model_class, pk)
+        is_compact = self.is_compact_response()
+        model = self.get_domain_service(is_compact).read(self.get_model_class(is_compact), pk)
         return self.respond_with_model_as_json(model, HTTPStatus.OK)
 
     @log
@@ -130,7 +220,7 @@ class ModelInstanceView(BaseView):
         # TODO: check pk = model.id
         model = self.get_model_from_request(request)
         if model.is_valid:
-            model, is_ok = self.domain_service.update(model, pk)
+            model, is_ok = self.get_domain_service(self.is_compact_request()).update(model, pk)
         else:
             is_ok = False
         status = self.get_status_code(is_ok)
@@ -145,19 +235,171 @@ class ModelInstanceView(BaseView):
 
 class ModelBusinessValidationView(BaseView):
     def post(self, request: http.HttpRequest) -> http.HttpResponse:
-        model = self.get_model_from_request(request)
-        if model.is_valid:
-            model, is_ok = self.domain_service.business_validate(model)
-        else:
-            is_ok = False
+        with self.get_validation_memo():
+            if self.is_compact_request():
+                # Compact data maps onto domain models, thus it is validated only once together with business rules
+                model, data = compact.load(self.compact_model_class, request.body)
+                model, is_ok = self.compact_domain_service.business_validate(model, initial_data=data)
+            else:
+                model = self.get_model_from_request(request)
+                if model.is_valid:
+                    model, is_ok = self.domain_service.business_validate(model)
+                else:
+                    is_ok = False
         status = self.get_status_code(is_ok)
         return self.respond_with_model_as_json(model, status)
 
+    def get_validation_memo(self) -> t.ContextManager:
+        """
+        Sections of the case are usually unchanged between validations as the case is validated on each edit,
+        thus results of their validation are reused.
+        """
+        if not settings.VALIDATION_MEMO_SIZE:
+            return contextlib.nullcontext()
+        return pde.ValidationMemo(self.get_validation_memo_store(), utils.get_source_version('app', 'extensions'))
+
+    @classmethod
+    @functools.cache
+    def get_validation_memo_store(cls) -> pde.ValidationMemoStore:
+        return pde.ValidationMemoStore(settings.VALIDATION_MEMO_SIZE)
+
+
+class ModelBatchBusinessValidationView(BaseView):
+    """Validates many cases in parallel and streams the result of each case as a json line once it is ready."""
+
+    # Cases are read and submitted to the pool only while this many of them per pool process are pending
+    max_pending_per_worker: int = 4
+
+    def post(self, request: http.HttpRequest) -> http.HttpResponse:
+        try:
+            batch_request = batch.BatchValidationRequest.model_validate_json(request.body)
+        except pd.ValidationError as e:
+            raise UserError(f'Invalid batch: {e}')
+        return http.StreamingHttpResponse(
+            self.validate_batch(batch_request),
+            status=HTTPStatus.OK,
+            content_type='application/x-ndjson'
+        )
+
+    def validate_batch(self, batch_request: batch.BatchValidationRequest) -> t.Iterator[str]:
+        """
+        The stream runs after the response is returned by dispatch, so its errors are handled here:
+        the cases without results are reported with the error status, so that every case still gets a line.
+        """
+        executor = batch_validation.get_executor()
+        timeout = settings.BATCH_VALIDATION_CASE_TIMEOUT
+        max_pending = settings.BATCH_VALIDATION_POOL_SIZE * self.max_pending_per_worker
+        results = [
+            *(
+                batch.CaseValidationResult(index=index, status=batch.CaseValidationStatus.ERROR)
+                for index in range(len(batch_request.cases))
+            ),
+            *(batch.CaseValidationResult(id=pk, status=batch.CaseValidationStatus.ERROR) for pk in batch_request.ids)
+        ]
+        pending = {}
+        started_count = 0
+
+        try:
+            for result in results:
+                json_data = self.get_case_json_data(batch_request, result)
+                if json_data is None:
+                    started_count += 1
+                    yield self.dump_result(result)
+                    continue
+                future = executor.submit(
+                    batch_validation.validate_case, self.domain_service, self.model_class, json_data, timeout
+                )
+                pending[future] = result
+                started_count += 1
+                if len(pending) >= max_pending:
+                    done, _ = cf.wait(pending, return_when=cf.FIRST_COMPLETED)
+                    yield from self.iter_completed_results(done, pending, executor)
+            yield from self.iter_completed_results(cf.as_completed(pending), pending, executor)
+
+        except Exception:
+            logger.exception('Batch validation failed')
+            for result in [*pending.values(), *results[started_count:]]:
+                yield self.dump_result(result)
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def get_case_json_data(
+        self,
+        batch_request: batch.BatchValidationRequest,
+        result: batch.CaseValidationResult
+    ) -> str | None:
+        """Stored cases are read here, as pool processes don't access the database, None is returned if missing."""
+        if result.id is None:
+            return json.dumps(batch_request.cases[result.index])
+        try:
+            model = self.domain_service.read(self.model_class, result.id)
+        except UserError:
+            result.status = batch.CaseValidationStatus.NOT_FOUND
+            return None
+        return model.model_dump_json(warnings=False)
+
+    def iter_completed_results(
+        self,
+        futures: t.Iterable[cf.Future],
+        pending: dict[cf.Future, batch.CaseValidationResult],
+        executor: cf.ProcessPoolExecutor
+    ) -> t.Iterator[str]:
+        for future in futures:
+            result = pending.pop(future)
+            try:
+                result.status, result.errors = future.result()
+            except cf.BrokenExecutor:
+                logger.exception('Batch validation pool is broken')
+                batch_validation.reset_executor(executor)
+            except Exception:
+                logger.exception(f'Batch validation failed for {result}')
+            yield self.dump_result(result)
+
+    @staticmethod
+    def dump_result(result: batch.CaseValidationResult) -> str:
+        return result.model_dump_json(by_alias=True) + '\n'
+
+
+class ModelBatchDeleteView(BaseView):
+    """Deletes many cases at once, ids of the cases that don't exist are returned separately."""
+
+    @log
+    def post(self, request: http.HttpRequest) -> http.HttpResponse:
+        try:
+            batch_request = batch.BatchDeleteRequest.model_validate_json(request.body)
+        except pd.ValidationError as e:
+            raise UserError(f'Invalid batch: {e}')
+        deleted_ids = self.domain_service.bulk_delete(self.model_class, batch_request.ids)
+        deleted_id_set = set(deleted_ids)
+        result = batch.BatchDeleteResult(
+            deleted=deleted_ids,
+            not_found=[pk for pk in batch_request.ids if pk not in deleted_id_set]
+        )
+        return self.respond_with_object_as_json(result.model_dump(), HTTPStatus.OK)
+
+
+class ModelCloneView(BaseView):
+    """
+    Copies the case with all its data inside the storage and returns id of the copy.
+    Values of the copy can be overridden by a partial case in the compact format, e.g.:
+    {"c_1_identification_case_safety_report": {"c_1_2_date_creation": "20240115120000"}}
+    """
+
+    @log
+    def post(self, request: http.HttpRequest, pk: int) -> http.HttpResponse:
+        overrides = {}
+        if request.body:
+            _, overrides = compact.load(self.compact_model_class, request.body)
+        new_pk = self.compact_domain_service.clone(self.compact_model_class, pk, overrides)
+        return self.respond_with_object_as_json({'id': new_pk}, HTTPStatus.OK)
+
 
 class ModelToXmlView(BaseView):
     def post(self, request: http.HttpRequest) -> http.HttpResponse:
         model = self.get_model_from_request(request)
-        model_dict = model.model_dump()
+        model_dict = model.model_dump(warnings=False)
         self.extend_lists(model_dict)
         model_dict = {self.model_class.__name__: model_dict}
         result = xmltodict.unparse(model_dict)
@@ -214,7 +456,7 @@ class MedDRASearchView(View):
     meddra_service: MedDRAServiceProtocol = ...
 
     def post(self, request: http.HttpRequest, pk: int) -> http.HttpResponse:
-        search_request = meddra.SearchRequest.parse_raw(request.body)
+        search_request = meddra.SearchRequest.model_validate_json(request.body)
         objects = self.meddra_service.search(search_request.search.level,
                                              search_request.state,
                                              search_request.search.input,
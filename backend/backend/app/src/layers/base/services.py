@@ -14,6 +14,10 @@ class ServiceProtocol[T](t.Protocol):
 
     def delete(self, model_class: type[T], pk: int) -> bool: ...
 
+    def bulk_delete(self, model_class: type[T], pks: t.Iterable[int]) -> t.List[int]: ...
+
+    def clone(self, model_class: type[T], pk: int, overrides: dict[str, t.Any] | None = None) -> int: ...
+
 
 class BusinessServiceProtocol[T](ServiceProtocol[T], t.Protocol):
     def business_validate(self, model: T) -> tuple[T, bool]: ...
@@ -1,6 +1,7 @@
 import abc
 import functools
 import string
+import types
 import typing as t
 
 import pydantic as pd
@@ -72,45 +73,74 @@ class BaseType[T](abc.ABC, str):
     
 
 class BaseAlphaType[T: int](BaseType[T]):
-    @classmethod
-    def _validate_business(cls, val: str, info: pd.ValidationInfo, type_param: T) -> tuple[bool, str]:
-        max_length = type_param
-        length = len(val)
-        return length <= max_length, f'Text length cannot be grater than {max_length}, got {length}'
-
+    """
+    Text validated natively by pydantic-core with the pattern.
+    Max length is a business rule, thus it is checked by the owner model, see get_max_length.
+    """
 
-class AlphaNumeric[T: int](BaseAlphaType[T]):
-    SPECIAL_CHARS = set(string.punctuation + string.whitespace)
+    PATTERN: t.ClassVar[str]
+    PARSING_ERROR_MESSAGE: t.ClassVar[str]
 
     @classmethod
-    def _validate_parsing(cls, val: str, info: pd.ValidationInfo, type_param: T) -> tuple[bool, str]:
-        return not val or ''.join(set(val) - cls.SPECIAL_CHARS).isalnum(), \
-            'Value can contain only alphabetic, numerical, special and whitespace characters'
+    def _get_pydantic_core_schema(cls, source_type: t.Any, handler: pd.GetCoreSchemaHandler) -> pdc.CoreSchema:
+        return pdc.core_schema.chain_schema([
+            pdc.core_schema.str_schema(),
+            pdc.core_schema.custom_error_schema(
+                pdc.core_schema.str_schema(pattern=cls.PATTERN),
+                custom_error_type=pde.CustomErrorType.PARSING,
+                custom_error_message=cls.PARSING_ERROR_MESSAGE
+            )
+        ])
     
     @classmethod
     def __get_pydantic_core_schema__(cls, source_type: t.Any, handler: pd.GetCoreSchemaHandler) -> pdc.CoreSchema:
         return cls._get_pydantic_core_schema(source_type, handler)
+
+    @staticmethod
+    def get_max_length(annotation: t.Any) -> int | None:
+        """Finds max length in the field annotation, e.g. `AN[L[100]] | L[NF.UNK] | None`."""
+        if t.get_origin(annotation) in [t.Union, types.UnionType, t.Annotated]:
+            for arg in t.get_args(annotation):
+                max_length = BaseAlphaType.get_max_length(arg)
+                if max_length is not None:
+                    return max_length
+            return None
+
+        origin = t.get_origin(annotation)
+        if isinstance(origin, type) and issubclass(origin, BaseAlphaType):
+            return t.get_args(t.get_args(annotation)[0])[0]
+        return None
+
+
+def _escape_for_regex_class(chars: str) -> str:
+    return ''.join('\\' + c if c in '\\[]^-&~' else c for c in chars)
+
+
+# Letters and numbers are the same as the ones accepted by str.isalpha and str.isalnum
+_ALPHA = r'\p{L}'
+_ALPHA_NUMERIC = r'\p{L}\p{N}'
+_SPECIAL = _escape_for_regex_class(string.punctuation) + r'\t\n\x0B\x0C\r '
+
+
+class AlphaNumeric[T: int](BaseAlphaType[T]):
+    # Value consisting only of special chars is not allowed, empty value is
+    PATTERN = rf'^(?:[{_ALPHA_NUMERIC}{_SPECIAL}]*[{_ALPHA_NUMERIC}][{_ALPHA_NUMERIC}{_SPECIAL}]*)?$'
+    PARSING_ERROR_MESSAGE = 'Value can contain only alphabetic, numerical, special and whitespace characters'
     
 
 class Alpha[T: int](BaseAlphaType[T]):
-    @classmethod
-    def _validate_parsing(cls, val: str, info: pd.ValidationInfo, type_param: T) -> tuple[bool, str]:
-        return not val or val.isalpha(), 'Value can contain only alphabetic characters'
-    
-    @classmethod
-    def __get_pydantic_core_schema__(cls, source_type: t.Any, handler: pd.GetCoreSchemaHandler) -> pdc.CoreSchema:
-        return cls._get_pydantic_core_schema(source_type, handler)
+    PATTERN = rf'^[{_ALPHA}]*$'
+    PARSING_ERROR_MESSAGE = 'Value can contain only alphabetic characters'
 
 
 class Datetime[T: DatePrecision](BaseType[T]):
     @classmethod
     def _validate_parsing(cls, val: t.Any, info: pd.ValidationInfo, type_param: T) -> tuple[bool, str]:
-        try:
-            precision = HL7DateUtils.parse_and_get_precision(val)
-            info.context['precision'] = precision
-            return True, ''
-        except ValueError as e:
-            return False, str(e)
+        date = HL7DateUtils.try_parse(val)
+        if date is None:
+            return False, f'{val} is not an HL7 valid date value'
+        info.context['precision'] = date.precision
+        return True, ''
 
     @classmethod
     def _validate_business(cls, val: t.Any, info: pd.ValidationInfo, type_param: T) -> tuple[bool]:
@@ -15,6 +15,7 @@ from app.src.layers.domain.models.field_types import (
     Datetime as DT,
     AlphaNumeric as AN,
     Alpha as A,
+    BaseAlphaType,
     Required as R
 )
 from extensions import pydantic as pde
@@ -38,6 +39,30 @@ class DomainModel(pde.PostValidatableModel, pde.SafeValidatableModel):
                     loc=(field_name,),
                     input=None
                 )
+        for field_name, max_length in cls.get_max_lengths().items():
+            value = processor.get_from_valid_data(field_name)
+            if isinstance(value, str) and len(value) > max_length:
+                processor.add_error(
+                    type=pde.CustomErrorType.BUSINESS,
+                    message=f'Text length cannot be grater than {max_length}, got {len(value)}',
+                    loc=(field_name,),
+                    input=value
+                )
+
+    @classmethod
+    def _get_validation_memo_namespace(cls, info: pd.ValidationInfo) -> str:
+        is_business = info.context is not None and BusinessValidationUtils.is_business_validation(info)
+        return 'business' if is_business else ''
+
+    @classmethod
+    @functools.cache
+    def get_max_lengths(cls) -> dict[str, int]:
+        max_lengths = {}
+        for field_name, field_info in cls.model_fields.items():
+            max_length = BaseAlphaType.get_max_length(field_info.annotation)
+            if max_length is not None:
+                max_lengths[field_name] = max_length
+        return max_lengths
 
     @classmethod
     @functools.cache
@@ -57,6 +82,7 @@ class DomainModel(pde.PostValidatableModel, pde.SafeValidatableModel):
 
 
 class ICSR(DomainModel):
+    version: int | None = None
     c_1_identification_case_safety_report: t.Optional['C_1_identification_case_safety_report'] = None
     c_2_r_primary_source_information: list['C_2_r_primary_source_information'] = []
     c_3_information_sender_case_safety_report: t.Optional['C_3_information_sender_case_safety_report'] = None
@@ -68,14 +94,7 @@ class ICSR(DomainModel):
     g_k_drug_information: list['G_k_drug_information'] = []
     h_narrative_case_summary: t.Optional['H_narrative_case_summary'] = None
 
-    @classmethod
-    def _post_validate(cls, processor: pde.PostValidationProcessor) -> None:
-        super()._post_validate(processor)
-        processor.try_validate_with_fields(
-            validate=cls._validate_uuids,
-            is_add_error_manually=True
-        )
-
+    @pde.post_validation_rule(is_add_error_manually=True)
     @classmethod
     def _validate_uuids(
         cls,
@@ -148,19 +167,16 @@ class C_1_identification_case_safety_report(DomainModel):
     c_1_11_1_report_nullification_amendment: e.C_1_11_1_report_nullification_amendment | None = None
     c_1_11_2_reason_nullification_amendment: AN[L[2000]] | None = None
 
-    @classmethod
-    def _post_validate(cls, processor: pde.PostValidationProcessor) -> None:
-        super()._post_validate(processor)
-        if not BusinessValidationUtils.is_business_validation(processor.info):
-            return
-        processor.try_validate_with_fields(
-            error_message='Check that 1 and only 1 information source ' +
-                'with C.2.r.5 = primary and filled C.2.r.3 exists' +
-                'and that your company name is set in the environment variables',
-            error_type=pde.CustomErrorType.BUSINESS,
-            validate=lambda c_1_1_sender_safety_report_unique_id:
-                c_1_1_sender_safety_report_unique_id is not None
-        )
+    @pde.post_validation_rule(
+        error_message='Check that 1 and only 1 information source ' +
+            'with C.2.r.5 = primary and filled C.2.r.3 exists' +
+            'and that your company name is set in the environment variables',
+        error_type=pde.CustomErrorType.BUSINESS,
+        condition=BusinessValidationUtils.is_business_validation
+    )
+    @staticmethod
+    def _validate_sender_safety_report_unique_id(c_1_1_sender_safety_report_unique_id: str | None) -> bool:
+        return c_1_1_sender_safety_report_unique_id is not None
 
 class C_1_6_1_r_documents_held_sender(DomainModel):
     c_1_6_1_r_1_documents_held_sender: AN[L[2000]] | None = None
@@ -432,15 +448,13 @@ class E_i_reaction_event(DomainModel):
     e_i_8_medical_confirmation_healthcare_professional: bool | None = None
     e_i_9_identification_country_reaction: A[L[2]] | None = None  # st
 
-    @classmethod
-    def _post_validate(cls, processor: pde.PostValidationProcessor) -> None:
-        super()._post_validate(processor)
-        processor.try_validate_with_fields(
-            error_message='Both id and uuid cannot be specified',
-            is_add_single_error=True,
-            validate=lambda id, uuid:
-                id is None or uuid is None
-        )
+    @pde.post_validation_rule(
+        error_message='Both id and uuid cannot be specified',
+        is_add_single_error=True
+    )
+    @staticmethod
+    def _validate_id_or_uuid(id: int | None, uuid: UUID | None) -> bool:
+        return id is None or uuid is None
 
 
 # F_r_results_tests_procedures_investigation_patient
@@ -510,15 +524,13 @@ class G_k_drug_information(DomainModel):
 
     g_k_11_additional_information_drug: AN[L[2000]] | None = None
 
-    @classmethod
-    def _post_validate(cls, processor: pde.PostValidationProcessor):
-        super()._post_validate(processor)
-        processor.try_validate_with_fields(
-            error_message='Cannot have duplicate drug to reaction relations',
-            validate=lambda g_k_9_i_drug_reaction_matrix:
-                len(g_k_9_i_drug_reaction_matrix) ==
-                len(set(x.g_k_9_i_1_reaction_assessed for x in g_k_9_i_drug_reaction_matrix))
-        )
+    @pde.post_validation_rule(error_message='Cannot have duplicate drug to reaction relations')
+    @staticmethod
+    def _validate_unique_reactions_assessed(
+        g_k_9_i_drug_reaction_matrix: list['G_k_9_i_drug_reaction_matrix']
+    ) -> bool:
+        return (len(g_k_9_i_drug_reaction_matrix) ==
+                len(set(x.g_k_9_i_1_reaction_assessed for x in g_k_9_i_drug_reaction_matrix)))
 
 
 class G_k_2_3_r_substance_id_strength(DomainModel):
@@ -7,6 +7,7 @@ from django.db import transaction
 from django.db.models import Q
 
 from app.src import enums
+from app.src.exceptions import UserError
 from app.src.layers.base.services import ServiceProtocol, BusinessServiceProtocol, CIOMSServiceProtocol, \
     MedDRAServiceProtocol, CodeSetServiceProtocol
 from app.src.layers.domain.models import DomainModel, ICSR
@@ -38,6 +39,43 @@ class DomainService(BusinessServiceProtocol[DomainModel]):
     def delete(self, model_class: type[DomainModel], pk: int) -> bool:
         return self.storage_service.delete(model_class, pk)
 
+    def bulk_delete(self, model_class: type[DomainModel], pks: t.Iterable[int]) -> t.List[int]:
+        return self.storage_service.bulk_delete(model_class, pks)
+
+    def clone(self, model_class: type[DomainModel], pk: int, overrides: dict[str, t.Any] | None = None) -> int:
+        """
+        Overrides are the values of the fields of the model, the source model with them is validated as a whole,
+        so that the rules across its sections apply to the overridden values too.
+        """
+        if overrides:
+            data = self.storage_service.read(model_class, pk).model_dump(mode='json', warnings=False)
+            self._merge_overrides(data, overrides)
+            model = model_class.model_dict_construct(data).model_safe_validate(data)
+            if not model.is_valid:
+                raise UserError(f'Invalid overrides: {model.errors}')
+            overrides = self._get_overridden_values(model, overrides)
+        return self.storage_service.clone(model_class, pk, overrides)
+
+    @classmethod
+    def _merge_overrides(cls, data: dict[str, t.Any], overrides: dict[str, t.Any]) -> None:
+        for key, value in overrides.items():
+            if isinstance(value, dict) and isinstance(data.get(key), dict):
+                cls._merge_overrides(data[key], value)
+            else:
+                data[key] = value
+
+    @classmethod
+    def _get_overridden_values(cls, model: DomainModel, overrides: dict[str, t.Any]) -> dict[str, t.Any]:
+        """Returns the validated values of the overridden fields in the same nested dicts as the overrides."""
+        values = {}
+        for key, value in overrides.items():
+            model_value = getattr(model, key)
+            if isinstance(value, dict) and isinstance(model_value, DomainModel):
+                values[key] = cls._get_overridden_values(model_value, value)
+            else:
+                values[key] = model.model_dump(include={key})[key]
+        return values
+
     def business_validate(
             self,
             model: DomainModel,
@@ -1,11 +1,19 @@
+import abc
+import dataclasses as dc
+import datetime as dt
+import functools
 import os
+import types
 import typing as t
 
+from django.db import connection
 from django.db import models as m
 
 from app.src import enums as e
 from app.src.enums import NullFlavor as NF
-from app.src.exceptions import UserError
+from app.src.exceptions import ConflictError, UserError
+from app.src.hl7date import HL7Date, HL7DateUtils
+from app.src.layers.storage.unit_of_work import UnitOfWork
 from extensions.django import constraints as ec
 from extensions.django import fields as ef
 from extensions.django import models as em
@@ -18,34 +26,361 @@ from extensions.django import models as em
 
 
 null_flavor_field_utils = ef.PrefixedFieldUtils('nf_')
+date_timestamp_field_utils = ef.PrefixedFieldUtils('ts_')
+date_precision_field_utils = ef.PrefixedFieldUtils('prec_')
+NULL_FLAVORS_FIELD_NAME = 'null_flavors'
+
+
+class HL7DateField(m.CharField):
+    """
+    Raw HL7 date, for which StorageModelMeta adds the fields with its timestamp and precision.
+    These fields are used for filtering and sorting, set is_indexed for the frequently used ones.
+    """
+
+    def __init__(self, *args, is_indexed: bool = False, **kwargs) -> None:
+        self.is_indexed = is_indexed
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.is_indexed:
+            kwargs['is_indexed'] = True
+        return name, path, args, kwargs
+
+
+class HL7DateDerivedField(m.Field, abc.ABC):
+    """Value calculated on save from the raw HL7 date field, thus it is never set directly."""
+
+    def __init__(self, *args, date_field_name: str, **kwargs) -> None:
+        self.date_field_name = date_field_name
+        kwargs.setdefault('null', True)
+        kwargs.setdefault('editable', False)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['date_field_name'] = self.date_field_name
+        del kwargs['editable']
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance: m.Model, add: bool) -> t.Any:
+        raw_value = getattr(model_instance, self.date_field_name)
+        date = HL7DateUtils.try_parse(raw_value) if raw_value else None
+        value = self.get_value_from_date(date) if date else None
+        setattr(model_instance, self.attname, value)
+        return value
+
+    @abc.abstractmethod
+    def get_value_from_date(self, date: HL7Date) -> t.Any:
+        raise NotImplementedError()
+
+
+class HL7DateTimestampField(HL7DateDerivedField, m.DateTimeField):
+    def get_value_from_date(self, date: HL7Date) -> dt.datetime:
+        # Dates without offset are considered to be in UTC
+        tzinfo = dt.timezone.utc
+        if date.offset:
+            hours, minutes = int(date.offset[1:3]), int(date.offset[3:5])
+            sign = -1 if date.offset[0] == '-' else 1
+            tzinfo = dt.timezone(sign * dt.timedelta(hours=hours, minutes=minutes))
+        return date.datetime.replace(tzinfo=tzinfo)
+
+
+class HL7DatePrecisionField(HL7DateDerivedField, m.PositiveSmallIntegerField):
+    def get_value_from_date(self, date: HL7Date) -> int:
+        return date.precision.value
+
+
+class EmbeddedModelsField(m.JSONField):
+    """
+    Repeating group of simple values stored on the parent row as a json list of objects instead of a table,
+    so that it is read and saved together with the parent without a join and inserts of its own.
+    Items have no ids, the whole list is saved every time it is changed.
+    Values of unique_field_names must be unique within the list, as a unique constraint of a table would ensure.
+    """
+
+    def __init__(self, *args, unique_field_names: t.Sequence[str] = (), **kwargs) -> None:
+        self.unique_field_names = list(unique_field_names)
+        kwargs.setdefault('null', True)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.unique_field_names:
+            kwargs['unique_field_names'] = self.unique_field_names
+        del kwargs['null']
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance: m.Model, add: bool) -> t.Any:
+        # Empty list is stored as null, so that it takes no space
+        items = getattr(model_instance, self.attname) or None
+        for field_name in self.unique_field_names:
+            values = [item[field_name] for item in items or [] if item.get(field_name) is not None]
+            if len(values) != len(set(values)):
+                raise UserError(f'Values of {field_name} must be unique within {self.name}')
+        setattr(model_instance, self.attname, items)
+        return items
+
+
+class NullFlavorsField(m.Field):
+    """
+    Null flavors of all value fields of the model packed into a single integer column,
+    so that they don't take a column with a check constraint each.
+    Every value field takes 4 bits at its position in field_names, which hold the number of its null flavor
+    or 0 if there is none. The column is null if none of the fields has a null flavor.
+    The order of field_names is a part of the stored data, so new fields are appended to it.
+    """
+
+    BITS_PER_FIELD = 4
+    # Codes are a part of the stored data, so they are never changed and a new null flavor gets a new code
+    CODES = types.MappingProxyType({
+        NF.NI: 1,
+        NF.MSK: 2,
+        NF.UNK: 3,
+        NF.NA: 4,
+        NF.ASKU: 5,
+        NF.NASK: 6,
+        NF.NINF: 7,
+        NF.PINF: 8,
+    })
+    assert set(CODES.keys()) == set(NF), 'Every null flavor must have a code'
+    assert len(set(CODES.values())) == len(CODES) and 0 < min(CODES.values()) and \
+        max(CODES.values()) < 2 ** BITS_PER_FIELD, f'Codes must be unique and fit into {BITS_PER_FIELD} bits'
+    NULL_FLAVORS = types.MappingProxyType({code: null_flavor for null_flavor, code in CODES.items()})
+    # The smallest integer type is used for the number of fields, one bit is left for the sign
+    INTERNAL_TYPES = {3: 'SmallIntegerField', 7: 'IntegerField', 15: 'BigIntegerField'}
+
+    def __init__(self, *args, field_names: t.Sequence[str], **kwargs) -> None:
+        if len(field_names) > max(self.INTERNAL_TYPES.keys()):
+            raise ValueError(f'Too many null flavor fields: {len(field_names)}')
+        self.field_names = list(field_names)
+        kwargs.setdefault('null', True)
+        kwargs.setdefault('editable', False)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['field_names'] = self.field_names
+        del kwargs['null']
+        del kwargs['editable']
+        return name, path, args, kwargs
+
+    def get_internal_type(self) -> str:
+        for max_field_count, internal_type in self.INTERNAL_TYPES.items():
+            if len(self.field_names) <= max_field_count:
+                return internal_type
+
+    @classmethod
+    def get_null_flavor(cls, value: int | None, position: int) -> NF | None:
+        code = (value or 0) >> (position * cls.BITS_PER_FIELD) & (2 ** cls.BITS_PER_FIELD - 1)
+        return cls.NULL_FLAVORS.get(code)
+
+    @classmethod
+    def set_null_flavor(cls, value: int | None, position: int, null_flavor: NF | None) -> int | None:
+        shift = position * cls.BITS_PER_FIELD
+        value = (value or 0) & ~((2 ** cls.BITS_PER_FIELD - 1) << shift)
+        if null_flavor is not None:
+            value |= cls.CODES[NF(null_flavor)] << shift
+        return value or None
+
+
+class NullFlavorField(property):
+    """
+    Null flavor of the value field, which is stored in the column of NullFlavorsField added by StorageModelMeta.
+    It is set and read as a usual field, model constructor accepts it too.
+    """
+
+    def __init__(self, choices: t.Iterable[NF]) -> None:
+        super().__init__()
+        self.choices = frozenset(choices)
+        # Is set by StorageModelMeta
+        self.position: int | None = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: m.Model | None, owner: type | None = None) -> t.Any:
+        if instance is None:
+            return self
+        return NullFlavorsField.get_null_flavor(getattr(instance, NULL_FLAVORS_FIELD_NAME), self.position)
+
+    def __set__(self, instance: m.Model, value: NF | None) -> None:
+        # Same as the check constraint of a column would do
+        if value is not None and value not in self.choices:
+            raise ValueError(f'Invalid null flavor of {self.name}: {value}')
+        value = NullFlavorsField.set_null_flavor(getattr(instance, NULL_FLAVORS_FIELD_NAME), self.position, value)
+        setattr(instance, NULL_FLAVORS_FIELD_NAME, value)
 
 
 class StorageModelMeta(em.ModelWithFieldChoicesConstraintMeta):
     """
-    Used for implicit call of add_any_null_constraint for null_flavor fields
+    Used for packing null flavor fields into a single NullFlavorsField
     and for checking existence of matching choices restriction which is mandatory.
+    Also adds timestamp and precision fields for HL7 date fields.
     """
 
     def __new__(cls, name, bases, attrs, **kwargs):
-        for field_name, field in attrs.items():
+        null_flavor_value_field_names = []
+
+        for field_name, field in list(attrs.items()):
+            if isinstance(field, HL7DateField):
+                attrs[date_timestamp_field_utils.make_special_field_name(field_name)] = \
+                    HL7DateTimestampField(date_field_name=field_name, db_index=field.is_indexed)
+                attrs[date_precision_field_utils.make_special_field_name(field_name)] = \
+                    HL7DatePrecisionField(date_field_name=field_name)
+
             if not null_flavor_field_utils.is_special_field_name(field_name):
                 continue
 
+            if not isinstance(field, NullFlavorField):
+                raise TypeError(f'Null flavor field {field_name} must be declared with NullFlavorField')
             # Check choices restriction existence
             if not field.choices:
                 raise ValueError(f'Null flavor field {field_name} must have choices restriction')
 
+            field.position = len(null_flavor_value_field_names)
+            null_flavor_value_field_names.append(null_flavor_field_utils.get_base_field_name(field_name))
+
+        if null_flavor_value_field_names:
+            attrs[NULL_FLAVORS_FIELD_NAME] = NullFlavorsField(field_names=null_flavor_value_field_names)
+
         return super().__new__(cls, name, bases, attrs, **kwargs)
 
 
+@dc.dataclass(frozen=True)
+class RelationMetadata:
+    name: str
+    temp_field_name: str
+    # Model on the other side of the relation and the name of its foreign key field
+    related_model: type['StorageModel']
+    remote_field_name: str
+    is_many: bool
+
+
+@dc.dataclass(frozen=True)
+class StorageModelFieldMetadata:
+    """Field data of a storage model class resolved once, so that it is not searched for on every model instance."""
+
+    field_names: frozenset[str]
+    # Concrete fields (forward relations included) mapped to their attribute names
+    concrete_field_attnames: dict[str, str]
+    # Value fields mapped to their null flavor fields
+    null_flavor_field_names: dict[str, str]
+    # Repeating groups stored on the model row, they are not a part of concrete fields
+    embedded_field_names: frozenset[str]
+    forward_relation_names: frozenset[str]
+    # Only backward relations are used for embedded models
+    backward_relations: dict[str, RelationMetadata]
+
+    def is_relation(self, field_name: str) -> bool:
+        return field_name in self.forward_relation_names or field_name in self.backward_relations
+
+
 class StorageModel(em.ModelWithTempRelationSupport, metaclass=StorageModelMeta):
     class Meta:
         abstract = True
 
+    @classmethod
+    @functools.cache
+    def get_field_metadata(cls) -> StorageModelFieldMetadata:
+        field_names = set()
+        concrete_field_attnames = dict()
+        null_flavor_field_names = dict()
+        embedded_field_names = set()
+        forward_relation_names = set()
+        backward_relations = dict()
+
+        for field in cls._meta.get_fields():
+            field_name = field.name
+            field_names.add(field_name)
+
+            if isinstance(field, m.ForeignObjectRel):
+                backward_relations[field_name] = RelationMetadata(
+                    name=field_name,
+                    temp_field_name=ef.temp_relation_field_utils.make_special_field_name(field_name),
+                    related_model=field.related_model,
+                    remote_field_name=field.remote_field.name,
+                    is_many=field.one_to_many
+                )
+                continue
+
+            # Null flavors are a part of the domain model as values of the fields they are specified for
+            if isinstance(field, NullFlavorsField):
+                for value_field_name in field.field_names:
+                    null_flavor_field_names[value_field_name] = \
+                        null_flavor_field_utils.make_special_field_name(value_field_name)
+                continue
+
+            if isinstance(field, EmbeddedModelsField):
+                embedded_field_names.add(field_name)
+                continue
+
+            # Derived fields are not a part of the domain model
+            if not isinstance(field, HL7DateDerivedField):
+                concrete_field_attnames[field_name] = field.attname
+
+            if field.is_relation:
+                forward_relation_names.add(field_name)
+
+        return StorageModelFieldMetadata(
+            field_names=frozenset(field_names),
+            concrete_field_attnames=concrete_field_attnames,
+            null_flavor_field_names=null_flavor_field_names,
+            embedded_field_names=frozenset(embedded_field_names),
+            forward_relation_names=frozenset(forward_relation_names),
+            backward_relations=backward_relations
+        )
+
     @classmethod
     def list(cls) -> list[dict[str, t.Any]]:
         return list(cls.objects.values('id'))
 
+    def get_stored(self) -> t.Self:
+        """Stored state of the model, it is taken from the active unit of work if it is loaded there."""
+        unit_of_work = UnitOfWork.get_active()
+        stored_model = unit_of_work.get(type(self), self.pk) if unit_of_work else None
+        if stored_model is None:
+            stored_model = type(self).objects.get(pk=self.pk)
+            if unit_of_work:
+                unit_of_work.add(stored_model)
+        return stored_model
+
+    def get_related_models(self, relation_name: str) -> 'list[StorageModel]':
+        """
+        Related models of the backward relation (a list for 1-1 relation as well),
+        they are taken from the active unit of work if all of them are known there.
+        """
+        unit_of_work = UnitOfWork.get_active()
+        related_models = unit_of_work.get_related(self, relation_name) if unit_of_work else None
+        if related_models is not None:
+            return related_models
+
+        if self.get_field_metadata().backward_relations[relation_name].is_many:
+            related_models = list(getattr(self, relation_name).all())
+        else:
+            related_model = getattr(self, relation_name, None)
+            related_models = [related_model] if related_model else []
+        if unit_of_work:
+            unit_of_work.set_related(self, relation_name, related_models)
+        return related_models
+
+    def reserve_id(self) -> None:
+        """Sets the id of a new model from the sequence of its table, so that it is known before the insert."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT nextval(pg_get_serial_sequence(%s, %s))',
+                [self._meta.db_table, self._meta.pk.column]
+            )
+            self.id = cursor.fetchone()[0]
+
+    def save_fields(self, *field_names: str) -> None:
+        """Saves the fields together with other changes of the active unit of work or right away without it."""
+        unit_of_work = UnitOfWork.get_active()
+        if unit_of_work:
+            unit_of_work.mark_dirty(self, field_names)
+        else:
+            self.save(update_fields=field_names)
+
     def pre_create(self) -> None:
         pass
 
@@ -58,9 +393,16 @@ class StorageModel(em.ModelWithTempRelationSupport, metaclass=StorageModelMeta):
     def post_update(self) -> None:
         pass
 
+    def post_clone(self) -> None:
+        """Called for the copy of the model, which is cloned with its related models."""
+        pass
+
 
 
 class ICSR(StorageModel):
+    # Is increased on every update for optimistic concurrency control
+    version = m.PositiveIntegerField(default=1)
+
     @classmethod
     def list(cls) -> list[dict[str, t.Any]]:
         # Extracted fields and their constraints are better to be described in domain layer,
@@ -78,7 +420,7 @@ class ICSR(StorageModel):
                 # Default value that might be changed later
                 serious=m.Value(False)
             )\
-            .order_by('-creation_date')
+            .order_by('-c_1_identification_case_safety_report__ts_c_1_2_date_creation')
         
         events = E_i_reaction_event.objects\
             .filter(e_i_3_1_term_highlighted_reporter__in=[
@@ -132,6 +474,8 @@ class ICSR(StorageModel):
         return list(result.values())
     
     def pre_create(self) -> None:
+        self.version = 1
+
         # C.1 is always created
         temp_c_1_name = ef.temp_relation_field_utils\
             .make_special_field_name('c_1_identification_case_safety_report')
@@ -141,17 +485,23 @@ class ICSR(StorageModel):
             setattr(self, temp_c_1_name, c_1)
 
     def pre_update(self) -> None:
+        # Update without the version is not checked for conflicts
+        stored_version = self.get_stored().version
+        if self.version is None:
+            self.version = stored_version
+        elif self.version != stored_version:
+            raise self._make_conflict_error()
+
         # C.1 can never be recreated for icsr, only updated
         temp_c_1_name = ef.temp_relation_field_utils\
             .make_special_field_name('c_1_identification_case_safety_report')
         new_c_1 = getattr(self, temp_c_1_name, None)
         if not new_c_1:
             return
-        try:
-            old_c_1 = self.c_1_identification_case_safety_report
-        except C_1_identification_case_safety_report.DoesNotExist:
+        old_c_1s = self.get_related_models('c_1_identification_case_safety_report')
+        if not old_c_1s:
             return
-        if new_c_1.id != old_c_1.id:
+        if new_c_1.id != old_c_1s[0].id:
             raise UserError('C.1 cannot be recreated for ICSR, consider updating it with the id instead')
         
     def post_create(self) -> None:
@@ -159,15 +509,43 @@ class ICSR(StorageModel):
 
     def post_update(self) -> None:
         self.post_save()
+        self.increase_version()
+
+    def post_clone(self) -> None:
+        # Copy is a new case, which has its own versions and C.1.1
+        self.version = 1
+        self.save_fields('version')
+        self.post_save()
+
+    def increase_version(self) -> None:
+        """
+        Checks and increases the version with a single query, which is the last write of the update,
+        so that the row is locked only until the end of the transaction and the concurrent update,
+        which has already been waiting for the lock, sees the new version and fails.
+        """
+        is_updated = ICSR.objects\
+            .filter(pk=self.pk, version=self.version)\
+            .update(version=m.F('version') + 1)
+        if not is_updated:
+            raise self._make_conflict_error()
+        self.version += 1
+
+    def _make_conflict_error(self) -> ConflictError:
+        return ConflictError(
+            f'ICSR(id={self.pk}) has been changed by another user since version {self.version}, ' +
+            'consider reloading it'
+        )
 
     def post_save(self) -> None:
-        try:
-            c_1 = self.c_1_identification_case_safety_report
-        except C_1_identification_case_safety_report.DoesNotExist:
+        c_1s = self.get_related_models('c_1_identification_case_safety_report')
+        if not c_1s:
             return
+        c_1 = c_1s[0]
         if not c_1.c_1_1_sender_safety_report_unique_id:
             c_1.calculate_c_1_1()
-            c_1.save()
+            # C.1.1 can not be calculated until the required data is specified
+            if c_1.c_1_1_sender_safety_report_unique_id:
+                c_1.save_fields('c_1_1_sender_safety_report_unique_id')
 
 
 # C_1_identification_case_safety_report
@@ -183,16 +561,17 @@ class C_1_identification_case_safety_report(StorageModel):
     )
 
     c_1_1_sender_safety_report_unique_id = m.CharField(null=True, unique=True)
-    c_1_2_date_creation = m.CharField(null=True)  # dt
+    c_1_2_date_creation = HL7DateField(null=True, is_indexed=True)  # dt
     c_1_3_type_report = m.IntegerField(null=True, choices=e.C_1_3_type_report)
-    c_1_4_date_report_first_received_source = m.CharField(null=True)  # dt
-    c_1_5_date_most_recent_information = m.CharField(null=True)  # dt
+    c_1_4_date_report_first_received_source = HL7DateField(null=True, is_indexed=True)  # dt
+    c_1_5_date_most_recent_information = HL7DateField(null=True, is_indexed=True)  # dt
 
     # c_1_6_additional_available_documents_held_sender
     c_1_6_1_additional_documents_available = m.BooleanField(null=True)
+    c_1_6_1_r_documents_held_sender = EmbeddedModelsField()
 
     c_1_7_fulfil_local_criteria_expedited_report = m.BooleanField(null=True)
-    nf_c_1_7_fulfil_local_criteria_expedited_report = m.CharField(null=True, choices=[NF.NI])
+    nf_c_1_7_fulfil_local_criteria_expedited_report = NullFlavorField(choices=[NF.NI])
 
     # c_1_8_worldwide_unique_case_identification
     c_1_8_1_worldwide_unique_case_identification_number = m.CharField(null=True, unique=True)
@@ -200,18 +579,24 @@ class C_1_identification_case_safety_report(StorageModel):
 
     # c_1_9_other_case_ids
     c_1_9_1_other_case_ids_previous_transmissions = m.BooleanField(null=True, choices=[True])
-    nf_c_1_9_1_other_case_ids_previous_transmissions = m.CharField(null=True, choices=[NF.NI])
+    nf_c_1_9_1_other_case_ids_previous_transmissions = NullFlavorField(choices=[NF.NI])
+
+    c_1_10_r_identification_number_report_linked = EmbeddedModelsField(
+        unique_field_names=['c_1_10_r_identification_number_report_linked']
+    )
 
     # c_1_11_report_nullification_amendment
     c_1_11_1_report_nullification_amendment = m.IntegerField(null=True, choices=e.C_1_11_1_report_nullification_amendment)
     c_1_11_2_reason_nullification_amendment = m.CharField(null=True)
 
     def pre_create(self) -> None:
-        if not self.c_1_1_sender_safety_report_unique_id:
+        if not self.c_1_1_sender_safety_report_unique_id and self.get_c_1_1_prefix():
+            # The id is a part of C.1.1, so it is taken before the insert, which saves C.1.1 at once
+            self.reserve_id()
             self.calculate_c_1_1()
 
     def pre_update(self) -> None:
-        old_self = self.__class__.objects.get(id=self.id)
+        old_self = self.get_stored()
         old_c_1_1 = old_self.c_1_1_sender_safety_report_unique_id
         new_c_1_1 = self.c_1_1_sender_safety_report_unique_id
 
@@ -225,40 +610,34 @@ class C_1_identification_case_safety_report(StorageModel):
                 self.c_1_1_sender_safety_report_unique_id = old_c_1_1
         
     def calculate_c_1_1(self) -> None:
+        prefix = self.get_c_1_1_prefix()
+        # The id is a part of C.1.1, so it is calculated once the model has it
+        if prefix and self.id is not None:
+            self.c_1_1_sender_safety_report_unique_id = f'{prefix}-{self.id}'
+
+    def get_c_1_1_prefix(self) -> str | None:
+        """Part of C.1.1 before the id, it is calculated from the case in memory."""
         try:
             company_name = os.environ['COMPANY_NAME']
         except KeyError:
-            return
-        
+            return None
+
         icsr = self.icsr
         if not icsr:
-            return
+            return None
             
-        primary_c_2_r = icsr.c_2_r_primary_source_information.filter(
-            c_2_r_5_primary_source_regulatory_purposes=
-                e.C_2_r_5_primary_source_regulatory_purposes.PRIMARY
-        )
+        primary_c_2_r = [
+            c_2_r for c_2_r in icsr.get_related_models('c_2_r_primary_source_information')
+            if c_2_r.c_2_r_5_primary_source_regulatory_purposes == e.C_2_r_5_primary_source_regulatory_purposes.PRIMARY
+        ]
         if len(primary_c_2_r) != 1:
-            return
+            return None
         
         country_code = primary_c_2_r[0].c_2_r_3_reporter_country_code
         if not country_code:
-            return
-
-        self.c_1_1_sender_safety_report_unique_id = '-'.join([country_code, company_name, str(self.id)])
-
-
-class C_1_6_1_r_documents_held_sender(StorageModel):
-    class Meta: pass
+            return None
 
-    c_1_identification_case_safety_report = m.ForeignKey(
-        to=C_1_identification_case_safety_report,
-        on_delete=m.CASCADE,
-        related_name='c_1_6_1_r_documents_held_sender'
-    )
-
-    c_1_6_1_r_1_documents_held_sender = m.CharField(null=True)
-    # file: c_1_6_1_r_2_included_documents
+        return '-'.join([country_code, company_name])
 
 
 class C_1_9_1_r_source_case_id(StorageModel):
@@ -280,24 +659,6 @@ class C_1_9_1_r_source_case_id(StorageModel):
     c_1_9_1_r_2_case_id = m.CharField(null=True)
 
 
-class C_1_10_r_identification_number_report_linked(StorageModel):
-    class Meta: pass
-
-    ec.add_unique_constraint(
-        Meta,
-        'c_1_identification_case_safety_report',
-        'c_1_10_r_identification_number_report_linked'
-    )
-
-    c_1_identification_case_safety_report = m.ForeignKey(
-        to=C_1_identification_case_safety_report,
-        on_delete=m.CASCADE,
-        related_name='c_1_10_r_identification_number_report_linked'
-    )
-
-    c_1_10_r_identification_number_report_linked = m.CharField(null=True)
-
-
 # C_2_r_primary_source_information
 
 
@@ -318,33 +679,33 @@ class C_2_r_primary_source_information(StorageModel):
 
     # c_2_r_1_reporter_name
     c_2_r_1_1_reporter_title = m.CharField(null=True)
-    nf_c_2_r_1_1_reporter_title = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK, NF.UNK])
+    nf_c_2_r_1_1_reporter_title = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK, NF.UNK])
     c_2_r_1_2_reporter_given_name = m.CharField(null=True)
-    nf_c_2_r_1_2_reporter_given_name = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    nf_c_2_r_1_2_reporter_given_name = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
     c_2_r_1_3_reporter_middle_name = m.CharField(null=True)
-    nf_c_2_r_1_3_reporter_middle_name = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    nf_c_2_r_1_3_reporter_middle_name = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
     c_2_r_1_4_reporter_family_name = m.CharField(null=True)
-    nf_c_2_r_1_4_reporter_family_name = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    nf_c_2_r_1_4_reporter_family_name = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
 
     # c_2_r_2_reporter_address_telephone
     c_2_r_2_1_reporter_organisation = m.CharField(null=True)
-    nf_c_2_r_2_1_reporter_organisation = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    nf_c_2_r_2_1_reporter_organisation = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
     c_2_r_2_2_reporter_department = m.CharField(null=True)
-    nf_c_2_r_2_2_reporter_department = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    nf_c_2_r_2_2_reporter_department = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
     c_2_r_2_3_reporter_street = m.CharField(null=True)
-    nf_c_2_r_2_3_reporter_street = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    nf_c_2_r_2_3_reporter_street = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
     c_2_r_2_4_reporter_city = m.CharField(null=True)
-    nf_c_2_r_2_4_reporter_city = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    nf_c_2_r_2_4_reporter_city = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
     c_2_r_2_5_reporter_state_province = m.CharField(null=True)
-    nf_c_2_r_2_5_reporter_state_province = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    nf_c_2_r_2_5_reporter_state_province = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
     c_2_r_2_6_reporter_postcode = m.CharField(null=True)
-    nf_c_2_r_2_6_reporter_postcode = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    nf_c_2_r_2_6_reporter_postcode = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
     c_2_r_2_7_reporter_telephone = m.CharField(null=True)
-    nf_c_2_r_2_7_reporter_telephone = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    nf_c_2_r_2_7_reporter_telephone = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
 
     c_2_r_3_reporter_country_code = m.CharField(null=True)  # st
     c_2_r_4_qualification = m.IntegerField(null=True, choices=e.C_2_r_4_qualification)
-    nf_c_2_r_4_qualification = m.CharField(null=True, choices=[NF.UNK])
+    nf_c_2_r_4_qualification = NullFlavorField(choices=[NF.UNK])
     c_2_r_5_primary_source_regulatory_purposes = m.IntegerField(null=True, choices=e.C_2_r_5_primary_source_regulatory_purposes)
 
 
@@ -394,7 +755,7 @@ class C_4_r_literature_reference(StorageModel):
     )
 
     c_4_r_1_literature_reference = m.CharField(null=True)
-    nf_c_4_r_1_literature_reference = m.CharField(null=True, choices=[NF.ASKU, NF.NASK])
+    nf_c_4_r_1_literature_reference = NullFlavorField(choices=[NF.ASKU, NF.NASK])
     # file: c_4_r_2_included_documents
 
 
@@ -410,9 +771,9 @@ class C_5_study_identification(StorageModel):
     )
 
     c_5_2_study_name = m.CharField(null=True)
-    nf_c_5_2_study_name = m.CharField(null=True, choices=[NF.ASKU, NF.NASK])
+    nf_c_5_2_study_name = NullFlavorField(choices=[NF.ASKU, NF.NASK])
     c_5_3_sponsor_study_number = m.CharField(null=True)
-    nf_c_5_3_sponsor_study_number = m.CharField(null=True, choices=[NF.ASKU, NF.NASK])
+    nf_c_5_3_sponsor_study_number = NullFlavorField(choices=[NF.ASKU, NF.NASK])
     c_5_4_study_type_reaction = m.IntegerField(null=True, choices=e.C_5_4_study_type_reaction)
 
 
@@ -426,9 +787,9 @@ class C_5_1_r_study_registration(StorageModel):
     )
 
     c_5_1_r_1_study_registration_number = m.CharField(null=True)
-    nf_c_5_1_r_1_study_registration_number = m.CharField(null=True, choices=[NF.ASKU, NF.NASK])
+    nf_c_5_1_r_1_study_registration_number = NullFlavorField(choices=[NF.ASKU, NF.NASK])
     c_5_1_r_2_study_registration_country = m.CharField(null=True)  # st
-    nf_c_5_1_r_2_study_registration_country = m.CharField(null=True, choices=[NF.ASKU, NF.NASK])
+    nf_c_5_1_r_2_study_registration_country = NullFlavorField(choices=[NF.ASKU, NF.NASK])
 
 
 # D_patient_characteristics
@@ -444,22 +805,22 @@ class D_patient_characteristics(StorageModel):
     )
 
     d_1_patient = m.CharField(null=True)
-    nf_d_1_patient = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK, NF.UNK])
+    nf_d_1_patient = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK, NF.UNK])
 
     # d_1_1_medical_record_number_source
     d_1_1_1_medical_record_number_source_gp = m.CharField(null=True)
-    nf_d_1_1_1_medical_record_number_source_gp = m.CharField(null=True, choices=[NF.MSK])
+    nf_d_1_1_1_medical_record_number_source_gp = NullFlavorField(choices=[NF.MSK])
     d_1_1_2_medical_record_number_source_specialist = m.CharField(null=True)
-    nf_d_1_1_2_medical_record_number_source_specialist = m.CharField(null=True, choices=[NF.MSK])
+    nf_d_1_1_2_medical_record_number_source_specialist = NullFlavorField(choices=[NF.MSK])
     d_1_1_3_medical_record_number_source_hospital = m.CharField(null=True)
-    nf_d_1_1_3_medical_record_number_source_hospital = m.CharField(null=True, choices=[NF.MSK])
+    nf_d_1_1_3_medical_record_number_source_hospital = NullFlavorField(choices=[NF.MSK])
     d_1_1_4_medical_record_number_source_investigation = m.CharField(null=True)
-    nf_d_1_1_4_medical_record_number_source_investigation = m.CharField(null=True, choices=[NF.MSK])
+    nf_d_1_1_4_medical_record_number_source_investigation = NullFlavorField(choices=[NF.MSK])
 
     # d_2_age_information
 
-    d_2_1_date_birth = m.CharField(null=True)  # dt
-    nf_d_2_1_date_birth = m.CharField(null=True, choices=[NF.MSK])
+    d_2_1_date_birth = HL7DateField(null=True)  # dt
+    nf_d_2_1_date_birth = NullFlavorField(choices=[NF.MSK])
 
     # d_2_2_age_onset_reaction
 
@@ -475,40 +836,40 @@ class D_patient_characteristics(StorageModel):
     d_3_body_weight = ef.ArbitraryDecimalField(null=True)
     d_4_height = m.PositiveIntegerField(null=True)
     d_5_sex = m.IntegerField(null=True, choices=e.D_5_sex)
-    nf_d_5_sex = m.CharField(null=True, choices=[NF.MSK, NF.UNK, NF.ASKU, NF.NASK])
-    d_6_last_menstrual_period_date = m.CharField(null=True)  # dt
+    nf_d_5_sex = NullFlavorField(choices=[NF.MSK, NF.UNK, NF.ASKU, NF.NASK])
+    d_6_last_menstrual_period_date = HL7DateField(null=True)  # dt
 
     # d_7_medical_history
     d_7_2_text_medical_history = m.CharField(null=True)
-    nf_d_7_2_text_medical_history = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK, NF.UNK])
+    nf_d_7_2_text_medical_history = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK, NF.UNK])
     d_7_3_concomitant_therapies = m.BooleanField(null=True, choices=[True])
 
     # d_9_case_death
-    d_9_1_date_death = m.CharField(null=True)  # dt
-    nf_d_9_1_date_death = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    d_9_1_date_death = HL7DateField(null=True)  # dt
+    nf_d_9_1_date_death = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
     d_9_3_autopsy = m.BooleanField(null=True)
-    nf_d_9_3_autopsy = m.CharField(null=True, choices=[NF.ASKU, NF.NASK, NF.UNK])
+    nf_d_9_3_autopsy = NullFlavorField(choices=[NF.ASKU, NF.NASK, NF.UNK])
 
     # d_10_information_concerning_parent
 
     d_10_1_parent_identification = m.CharField(null=True)
-    nf_d_10_1_parent_identification = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK, NF.UNK])
+    nf_d_10_1_parent_identification = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK, NF.UNK])
 
     # d_10_2_parent_age_information
 
-    d_10_2_1_date_birth_parent = m.CharField(null=True)  # dt
-    nf_d_10_2_1_date_birth_parent = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    d_10_2_1_date_birth_parent = HL7DateField(null=True)  # dt
+    nf_d_10_2_1_date_birth_parent = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
 
     # d_10_2_2_age_parent
     d_10_2_2a_age_parent_num = m.PositiveIntegerField(null=True)
     d_10_2_2b_age_parent_unit = m.CharField(null=True)  # st
 
-    d_10_3_last_menstrual_period_date_parent = m.CharField(null=True)  # dt
-    nf_d_10_3_last_menstrual_period_date_parent = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    d_10_3_last_menstrual_period_date_parent = HL7DateField(null=True)  # dt
+    nf_d_10_3_last_menstrual_period_date_parent = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
     d_10_4_body_weight_parent = ef.ArbitraryDecimalField(null=True)
     d_10_5_height_parent = m.PositiveIntegerField(null=True)
     d_10_6_sex_parent = m.IntegerField(null=True, choices=e.D_10_6_sex_parent)
-    nf_d_10_6_sex_parent = m.CharField(null=True, choices=[NF.UNK, NF.MSK, NF.ASKU, NF.NASK])
+    nf_d_10_6_sex_parent = NullFlavorField(choices=[NF.UNK, NF.MSK, NF.ASKU, NF.NASK])
 
     # d_10_7_medical_history_parent
     d_10_7_2_text_medical_history_parent = m.CharField(null=True)
@@ -525,12 +886,12 @@ class D_7_1_r_structured_information_medical_history(StorageModel):
 
     d_7_1_r_1a_meddra_version_medical_history = m.CharField(null=True)  # st
     d_7_1_r_1b_medical_history_meddra_code = m.PositiveIntegerField(null=True)
-    d_7_1_r_2_start_date = m.CharField(null=True)  # dt
-    nf_d_7_1_r_2_start_date = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])  # dt
+    d_7_1_r_2_start_date = HL7DateField(null=True)  # dt
+    nf_d_7_1_r_2_start_date = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])  # dt
     d_7_1_r_3_continuing = m.BooleanField(null=True)
-    nf_d_7_1_r_3_continuing = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK, NF.UNK])
-    d_7_1_r_4_end_date = m.CharField(null=True)  # dt
-    nf_d_7_1_r_4_end_date = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])  # dt
+    nf_d_7_1_r_3_continuing = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK, NF.UNK])
+    d_7_1_r_4_end_date = HL7DateField(null=True)  # dt
+    nf_d_7_1_r_4_end_date = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])  # dt
     d_7_1_r_5_comments = m.CharField(null=True)
     d_7_1_r_6_family_history = m.BooleanField(null=True, choices=[True])
 
@@ -545,7 +906,7 @@ class D_8_r_past_drug_history(StorageModel):
     )
 
     d_8_r_1_name_drug = m.CharField(null=True)
-    nf_d_8_r_1_name_drug = m.CharField(null=True, choices=[NF.UNK, NF.NA])
+    nf_d_8_r_1_name_drug = NullFlavorField(choices=[NF.UNK, NF.NA])
 
     # d_8_r_2_mpid
     d_8_r_2a_mpid_version = m.CharField(null=True)  # st
@@ -555,10 +916,10 @@ class D_8_r_past_drug_history(StorageModel):
     d_8_r_3a_phpid_version = m.CharField(null=True)  # st
     d_8_r_3b_phpid = m.CharField(null=True)  # st
 
-    d_8_r_4_start_date = m.CharField(null=True)  # dt
-    nf_d_8_r_4_start_date = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
-    d_8_r_5_end_date = m.CharField(null=True)  # dt
-    nf_d_8_r_5_end_date = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    d_8_r_4_start_date = HL7DateField(null=True)  # dt
+    nf_d_8_r_4_start_date = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
+    d_8_r_5_end_date = HL7DateField(null=True)  # dt
+    nf_d_8_r_5_end_date = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
 
     # d_8_r_6_indication_meddra_code
     d_8_r_6a_meddra_version_indication = m.CharField(null=True)  # st
@@ -608,12 +969,12 @@ class D_10_7_1_r_structured_information_parent_meddra_code(StorageModel):
 
     d_10_7_1_r_1a_meddra_version_medical_history = m.CharField(null=True)  # st
     d_10_7_1_r_1b_medical_history_meddra_code = m.PositiveIntegerField(null=True)
-    d_10_7_1_r_2_start_date = m.CharField(null=True)  # dt
-    nf_d_10_7_1_r_2_start_date = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    d_10_7_1_r_2_start_date = HL7DateField(null=True)  # dt
+    nf_d_10_7_1_r_2_start_date = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
     d_10_7_1_r_3_continuing = m.BooleanField(null=True)
-    nf_d_10_7_1_r_3_continuing = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK, NF.UNK])
-    d_10_7_1_r_4_end_date = m.CharField(null=True)  # dt
-    nf_d_10_7_1_r_4_end_date = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    nf_d_10_7_1_r_3_continuing = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK, NF.UNK])
+    d_10_7_1_r_4_end_date = HL7DateField(null=True)  # dt
+    nf_d_10_7_1_r_4_end_date = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
     d_10_7_1_r_5_comments = m.CharField(null=True)
 
 
@@ -636,10 +997,10 @@ class D_10_8_r_past_drug_history_parent(StorageModel):
     d_10_8_r_3a_phpid_version = m.CharField(null=True)  # st
     d_10_8_r_3b_phpid = m.CharField(null=True)  # st
 
-    d_10_8_r_4_start_date = m.CharField(null=True)  # dt
-    nf_d_10_8_r_4_start_date = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
-    d_10_8_r_5_end_date = m.CharField(null=True)  # dt
-    nf_d_10_8_r_5_end_date = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    d_10_8_r_4_start_date = HL7DateField(null=True)  # dt
+    nf_d_10_8_r_4_start_date = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
+    d_10_8_r_5_end_date = HL7DateField(null=True)  # dt
+    nf_d_10_8_r_5_end_date = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
 
     # d_10_8_r_6_indication_meddra_code
     d_10_8_r_6a_meddra_version_indication = m.CharField(null=True)  # st
@@ -678,22 +1039,22 @@ class E_i_reaction_event(StorageModel):
 
     # e_i_3_2_seriousness_criteria_event_level
     e_i_3_2a_results_death = m.BooleanField(null=True, choices=[True])
-    nf_e_i_3_2a_results_death = m.CharField(null=True, choices=[NF.NI])
+    nf_e_i_3_2a_results_death = NullFlavorField(choices=[NF.NI])
     e_i_3_2b_life_threatening = m.BooleanField(null=True, choices=[True])
-    nf_e_i_3_2b_life_threatening = m.CharField(null=True, choices=[NF.NI])
+    nf_e_i_3_2b_life_threatening = NullFlavorField(choices=[NF.NI])
     e_i_3_2c_caused_prolonged_hospitalisation = m.BooleanField(null=True, choices=[True])
-    nf_e_i_3_2c_caused_prolonged_hospitalisation = m.CharField(null=True, choices=[NF.NI])
+    nf_e_i_3_2c_caused_prolonged_hospitalisation = NullFlavorField(choices=[NF.NI])
     e_i_3_2d_disabling_incapacitating = m.BooleanField(null=True, choices=[True])
-    nf_e_i_3_2d_disabling_incapacitating = m.CharField(null=True, choices=[NF.NI])
+    nf_e_i_3_2d_disabling_incapacitating = NullFlavorField(choices=[NF.NI])
     e_i_3_2e_congenital_anomaly_birth_defect = m.BooleanField(null=True, choices=[True])
-    nf_e_i_3_2e_congenital_anomaly_birth_defect = m.CharField(null=True, choices=[NF.NI])
+    nf_e_i_3_2e_congenital_anomaly_birth_defect = NullFlavorField(choices=[NF.NI])
     e_i_3_2f_other_medically_important_condition = m.BooleanField(null=True, choices=[True])
-    nf_e_i_3_2f_other_medically_important_condition = m.CharField(null=True, choices=[NF.NI])
+    nf_e_i_3_2f_other_medically_important_condition = NullFlavorField(choices=[NF.NI])
 
-    e_i_4_date_start_reaction = m.CharField(null=True)  # dt
-    nf_e_i_4_date_start_reaction = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
-    e_i_5_date_end_reaction = m.CharField(null=True)  # dt
-    nf_e_i_5_date_end_reaction = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    e_i_4_date_start_reaction = HL7DateField(null=True, is_indexed=True)  # dt
+    nf_e_i_4_date_start_reaction = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
+    e_i_5_date_end_reaction = HL7DateField(null=True)  # dt
+    nf_e_i_5_date_end_reaction = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
 
     # e_i_6_duration_reaction
     e_i_6a_duration_reaction_num = m.PositiveIntegerField(null=True)
@@ -716,8 +1077,8 @@ class F_r_results_tests_procedures_investigation_patient(StorageModel):
         related_name='f_r_results_tests_procedures_investigation_patient'
     )
 
-    f_r_1_test_date = m.CharField(null=True)  # dt
-    nf_f_r_1_test_date = m.CharField(null=True, choices=[NF.UNK])  # dt
+    f_r_1_test_date = HL7DateField(null=True)  # dt
+    nf_f_r_1_test_date = NullFlavorField(choices=[NF.UNK])  # dt
 
     # f_r_2_test_name
 
@@ -730,7 +1091,7 @@ class F_r_results_tests_procedures_investigation_patient(StorageModel):
     # f_r_3_test_result
     f_r_3_1_test_result_code = m.IntegerField(null=True, choices=e.F_r_3_1_test_result_code)
     f_r_3_2_test_result_val_qual = ef.ArbitraryDecimalField(null=True)  # TODO: check how qualifiers are used
-    nf_f_r_3_2_test_result_val_qual = m.CharField(null=True, choices=[NF.NINF, NF.PINF])
+    nf_f_r_3_2_test_result_val_qual = NullFlavorField(choices=[NF.NINF, NF.PINF])
     f_r_3_3_test_result_unit = m.CharField(null=True)  # st
     f_r_3_4_result_unstructured_data = m.CharField(null=True)
 
@@ -813,10 +1174,10 @@ class G_k_4_r_dosage_information(StorageModel):
     g_k_4_r_1b_dose_unit = m.CharField(null=True)  # st
     g_k_4_r_2_number_units_interval = ef.ArbitraryDecimalField(null=True)
     g_k_4_r_3_definition_interval_unit = m.CharField(null=True)  # st
-    g_k_4_r_4_date_time_drug = m.CharField(null=True)  # dt
-    nf_g_k_4_r_4_date_time_drug = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
-    g_k_4_r_5_date_time_last_administration = m.CharField(null=True)  # dt
-    nf_g_k_4_r_5_date_time_last_administration = m.CharField(null=True, choices=[NF.MSK, NF.ASKU, NF.NASK])
+    g_k_4_r_4_date_time_drug = HL7DateField(null=True, is_indexed=True)  # dt
+    nf_g_k_4_r_4_date_time_drug = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
+    g_k_4_r_5_date_time_last_administration = HL7DateField(null=True)  # dt
+    nf_g_k_4_r_5_date_time_last_administration = NullFlavorField(choices=[NF.MSK, NF.ASKU, NF.NASK])
 
     # g_k_4_r_6_duration_drug_administration
     g_k_4_r_6a_duration_drug_administration_num = ef.ArbitraryDecimalField(null=True)
@@ -828,19 +1189,19 @@ class G_k_4_r_dosage_information(StorageModel):
     # g_k_4_r_9_pharmaceutical_dose_form
 
     g_k_4_r_9_1_pharmaceutical_dose_form = m.CharField(null=True)
-    nf_g_k_4_r_9_1_pharmaceutical_dose_form = m.CharField(null=True, choices=[NF.ASKU, NF.NASK, NF.UNK])
+    nf_g_k_4_r_9_1_pharmaceutical_dose_form = NullFlavorField(choices=[NF.ASKU, NF.NASK, NF.UNK])
     g_k_4_r_9_2a_pharmaceutical_dose_form_termid_version = m.CharField(null=True)  # st
     g_k_4_r_9_2b_pharmaceutical_dose_form_termid = m.CharField(null=True)  # st
 
     # g_k_4_r_10_route_administration
     g_k_4_r_10_1_route_administration = m.CharField(null=True)
-    nf_g_k_4_r_10_1_route_administration = m.CharField(null=True, choices=[NF.ASKU, NF.NASK, NF.UNK])
+    nf_g_k_4_r_10_1_route_administration = NullFlavorField(choices=[NF.ASKU, NF.NASK, NF.UNK])
     g_k_4_r_10_2a_route_administration_termid_version = m.CharField(null=True)  # st
     g_k_4_r_10_2b_route_administration_termid = m.CharField(null=True)  # st
 
     # g_k_4_r_11_parent_route_administration
     g_k_4_r_11_1_parent_route_administration = m.CharField(null=True)
-    nf_g_k_4_r_11_1_parent_route_administration = m.CharField(null=True, choices=[NF.ASKU, NF.NASK, NF.UNK])
+    nf_g_k_4_r_11_1_parent_route_administration = NullFlavorField(choices=[NF.ASKU, NF.NASK, NF.UNK])
     g_k_4_r_11_2a_parent_route_administration_termid_version = m.CharField(null=True)  # st
     g_k_4_r_11_2b_parent_route_administration_termid = m.CharField(null=True)  # st
 
@@ -855,7 +1216,7 @@ class G_k_7_r_indication_use_case(StorageModel):
     )
 
     g_k_7_r_1_indication_primary_source = m.CharField(null=True)
-    nf_g_k_7_r_1_indication_primary_source = m.CharField(null=True, choices=[NF.ASKU, NF.NASK, NF.UNK])
+    nf_g_k_7_r_1_indication_primary_source = NullFlavorField(choices=[NF.ASKU, NF.NASK, NF.UNK])
 
     # g_k_7_r_2_indication_meddra_code
     g_k_7_r_2a_meddra_version_indication = m.CharField(null=True)  # st
@@ -929,6 +1290,8 @@ class H_narrative_case_summary(StorageModel):
 
     h_4_sender_comments = m.CharField(null=True)
 
+    h_5_r_case_summary_reporter_comments_native_language = EmbeddedModelsField()
+
 
 class H_3_r_sender_diagnosis_meddra_code(StorageModel):
     class Meta: pass
@@ -941,16 +1304,3 @@ class H_3_r_sender_diagnosis_meddra_code(StorageModel):
 
     h_3_r_1a_meddra_version_sender_diagnosis = m.CharField(null=True)  # st
     h_3_r_1b_sender_diagnosis_meddra_code = m.PositiveIntegerField(null=True)
-
-
-class H_5_r_case_summary_reporter_comments_native_language(StorageModel):
-    class Meta: pass
-
-    h_narrative_case_summary = m.ForeignKey(
-        to=H_narrative_case_summary,
-        on_delete=m.CASCADE,
-        related_name='h_5_r_case_summary_reporter_comments_native_language'
-    )
-
-    h_5_r_1a_case_summary_reporter_comments_text = m.CharField(null=True)
-    h_5_r_1b_case_summary_reporter_comments_language = m.CharField(null=True)  # st
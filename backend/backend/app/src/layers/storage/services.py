@@ -1,121 +1,493 @@
-import enum
+import collections
+import copy
+import functools
+import graphlib
 import typing as t
 
 from django.core import exceptions as dje
-from django.db import models as djm
-from django.db import transaction
+from django.db import connection, transaction
+from django.db import models as m
 
+from app.src.enums import NullFlavor
 from app.src.exceptions import UserError
 from app.src.layers.base.services import ServiceProtocol
-from app.src.layers.storage.models import StorageModel
-from extensions.django.fields import temp_relation_field_utils
+from app.src.layers.storage.models import RelationMetadata, StorageModel
+from app.src.layers.storage.unit_of_work import UnitOfWork
 
 
 class StorageService(ServiceProtocol[StorageModel]):
-    class SaveOperation(enum.Enum):
-        INSERT = enum.auto()
-        UPDATE = enum.auto()
-
     def list(self, model_class: type[StorageModel]) -> list[dict[str, t.Any]]:
         return model_class.list()
 
     def read(self, model_class: type[StorageModel], pk: int) -> StorageModel:
-        try:
-            return model_class.objects.get(pk=pk)
-        except dje.ObjectDoesNotExist:
-            raise UserError(f"{model_class.__name__} object with id {pk} doesn't exist")
+        unit_of_work = UnitOfWork.get_active()
+        if unit_of_work is None:
+            return self._get(model_class, pk)
+
+        model = unit_of_work.get(model_class, pk)
+        if model is None:
+            model = self._get(model_class, pk)
+            unit_of_work.add(model)
+        # Related models are read together with the model, so they are loaded at once
+        self._load_related_tree([model], unit_of_work)
+        return model
 
     @transaction.atomic
     def create(self, new_model: StorageModel) -> tuple[StorageModel, bool]:
         if new_model.id is not None:
             raise UserError('Id can not be specified when creating a new entity')
         
-        new_model.pre_create()
-        self._save_with_related(new_model, self.SaveOperation.INSERT)
-        new_model.post_create()
+        with UnitOfWork.join() as unit_of_work:
+            self._create_with_related([new_model], unit_of_work)
+            unit_of_work.flush()
         return new_model, True
 
     @transaction.atomic
     def update(self, new_model: StorageModel, pk: int) -> tuple[StorageModel, bool]:
-        new_model.id = pk
+        with UnitOfWork.join() as unit_of_work:
+            self._update(new_model, pk, unit_of_work)
+            unit_of_work.flush()
+        return new_model, True
+
+    @transaction.atomic
+    def delete(self, model_class: type[StorageModel], pk: int) -> bool:
+        if not self._delete_with_related(model_class, [pk]):
+            raise UserError(f"{model_class.__name__} object with id {pk} doesn't exist")
+        return True
+
+    @transaction.atomic
+    def bulk_delete(self, model_class: type[StorageModel], pks: t.Iterable[int]) -> t.List[int]:
+        return self._delete_with_related(model_class, pks)
+
+    @transaction.atomic
+    def clone(self, model_class: type[StorageModel], pk: int, overrides: dict[str, t.Any] | None = None) -> int:
+        # Locked, so that the model is not changed while its tree is copied
+        if not model_class.objects.select_for_update().filter(pk=pk).exists():
+            raise UserError(f"{model_class.__name__} object with id {pk} doesn't exist")
+        new_pk = self._copy_with_related(model_class, pk)
+
+        with UnitOfWork.join() as unit_of_work:
+            new_model = self._get(model_class, new_pk)
+            unit_of_work.add(new_model)
+            self._update_changed_fields(self._override_fields(new_model, overrides or {}))
+            new_model.post_clone()
+            unit_of_work.flush()
+        return new_pk
+
+    def _get(self, model_class: type[StorageModel], pk: int) -> StorageModel:
         try:
-            old_model = self.read(type(new_model), pk)
+            return model_class.objects.get(pk=pk)
         except dje.ObjectDoesNotExist:
-            raise UserError(f'Cannot update not existing entity: {new_model.__class__.__name__}(id={pk})')
-        
-        new_model.pre_update()
+            raise UserError(f"{model_class.__name__} object with id {pk} doesn't exist")
+
+    def _delete_with_related(self, model_class: type[StorageModel], pks: t.Iterable[int]) -> t.List[int]:
+        """
+        Deletes the models with all their related models by a single set-based query per table,
+        so that the rows are not loaded as it is done by django deletion collector.
+        Returns ids of the deleted models, the missing ones are skipped.
+        """
+        # Locked, so that no related models are added to them until they are deleted
+        existing_pks = list(model_class.objects.select_for_update().filter(pk__in=pks).values_list('pk', flat=True))
+        if not existing_pks:
+            return []
 
-        # Delete old related models if they are missing in new model
-        for key, new_value in vars(new_model).items():
-            if not temp_relation_field_utils.is_special_field_name(key):
+        self._delete_rows_with_related(model_class, existing_pks)
+        return existing_pks
+
+    def _delete_rows_with_related(self, model_class: type[StorageModel], pks: t.List[int]) -> None:
+        """Deletes the rows of the model class with all the rows related to them by a single query per table."""
+        # Cascades of the collector are not needed, as every table referencing the models is deleted from here
+        # before the tables it references, and no signal receivers are connected to the storage models
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            for related_model_class, lookup in self._get_related_model_lookups(model_class):
+                cursor.execute(
+                    f'DELETE FROM {qn(related_model_class._meta.db_table)} ' +
+                    f'WHERE {self._get_lookup_condition_sql(related_model_class, lookup)}',
+                    [pks]
+                )
+            cursor.execute(
+                f'DELETE FROM {qn(model_class._meta.db_table)} ' +
+                f'WHERE {self._get_lookup_condition_sql(model_class, "pk")}',
+                [pks]
+            )
+
+    @classmethod
+    def _get_lookup_condition_sql(cls, model_class: type[StorageModel], lookup: str) -> str:
+        """
+        Returns the sql condition selecting the rows of the model class related through the lookup
+        to any of the pks given as the only query param.
+        """
+        qn = connection.ops.quote_name
+        field_name, _, next_lookup = lookup.partition('__')
+        if field_name == 'pk':
+            return f'{qn(model_class._meta.pk.column)} = ANY(%s)'
+
+        field = model_class._meta.get_field(field_name)
+        if next_lookup == 'pk':
+            return f'{qn(field.column)} = ANY(%s)'
+        related_meta = field.related_model._meta
+        return (
+            f'{qn(field.column)} IN (SELECT {qn(related_meta.pk.column)} FROM {qn(related_meta.db_table)} ' +
+            f'WHERE {cls._get_lookup_condition_sql(field.related_model, next_lookup)})'
+        )
+
+    @classmethod
+    @functools.cache
+    def _get_related_model_lookups(
+        cls,
+        model_class: type[StorageModel]
+    ) -> tuple[tuple[type[StorageModel], str], ...]:
+        """
+        Returns all model classes related to the model class through backward relations
+        with lookups of the model pk from them, the ones referencing others by foreign keys go first.
+        Hidden relations, which are not a part of the tree, are included too, e.g. G.k.9.i referencing E.i.
+        """
+        lookups = {model_class: 'pk'}
+        level = [model_class]
+        while level:
+            next_level = []
+            relations = [
+                (parent_class, field) for parent_class in level
+                for field in parent_class._meta.get_fields(include_hidden=True) if isinstance(field, m.ForeignObjectRel)
+            ]
+            # Relations of the tree are preferred for the lookups of the models reachable through hidden ones too
+            for parent_class, relation in sorted(relations, key=lambda item: item[1].is_hidden()):
+                if relation.related_model in lookups:
+                    continue
+                lookups[relation.related_model] = f'{relation.remote_field.name}__{lookups[parent_class]}'
+                next_level.append(relation.related_model)
+            level = next_level
+
+        del lookups[model_class]
+        ordered_classes = reversed(list(cls._sort_by_dependencies(lookups.keys())))
+        return tuple((related_model_class, lookups[related_model_class]) for related_model_class in ordered_classes)
+
+    def _copy_with_related(self, model_class: type[StorageModel], pk: int) -> int:
+        """
+        Copies the model with all its related models by a single set-based query per table inside the database,
+        so that the rows are not loaded and converted as it is done by reading and creating the model.
+        Tables are copied from the model down the tree, the ids of the copied rows are passed to the next tables
+        to remap their foreign keys, tables without copied parents are skipped.
+        Returns id of the copy.
+        """
+        id_maps = {model_class: self._copy_rows(model_class, {}, pk=pk)}
+
+        for related_model_class, lookup in reversed(self._get_related_model_lookups(model_class)):
+            parent_field = related_model_class._meta.get_field(lookup.split('__')[0])
+            if not id_maps.get(parent_field.related_model):
                 continue
+            id_maps[related_model_class] = self._copy_rows(related_model_class, id_maps, parent_field=parent_field)
+
+        return id_maps[model_class][pk]
+
+    @staticmethod
+    def _copy_rows(
+        model_class: type[StorageModel],
+        id_maps: dict[type[StorageModel], dict[int, int]],
+        *,
+        pk: int | None = None,
+        parent_field: m.ForeignKey | None = None
+    ) -> dict[int, int]:
+        """
+        Copies the row with the pk or the rows of the copied parents with a single INSERT ... SELECT,
+        the new ids are taken from the sequence of the table beforehand, so that the old ones are mapped to them.
+        Foreign keys to the copied models are remapped and unique columns are left empty, as they can't be copied.
+        Returns the new ids mapped by the old ones.
+        """
+        qn = connection.ops.quote_name
+        meta = model_class._meta
+        params = [meta.db_table, meta.pk.column]
+        selected_columns, joins, column_values = [], [], []
+
+        for field in meta.concrete_fields:
+            column = f'source.{qn(field.column)}'
+            if field.primary_key:
+                column = 'source.clone_id'
+            elif field.is_relation and field.related_model in id_maps:
+                alias = f'map_{len(joins)}'
+                join_type = 'JOIN' if field == parent_field else 'LEFT JOIN'
+                joins.append(
+                    f'{join_type} unnest(%s::bigint[], %s::bigint[]) AS {alias}(old_id, new_id) ' +
+                    f'ON {alias}.old_id = {qn(meta.db_table)}.{qn(field.column)}'
+                )
+                id_map = id_maps[field.related_model]
+                params.extend([list(id_map.keys()), list(id_map.values())])
+                selected_columns.append(f'{alias}.new_id AS {qn("clone_" + field.column)}')
+                column = f'source.{qn("clone_" + field.column)}'
+            elif field.unique:
+                column = 'NULL'
+            column_values.append(column)
 
-            field_name = temp_relation_field_utils.get_base_field_name(key)
-            field = new_model._meta.get_field(field_name)
-            old_value = getattr(old_model, field_name, None)
-            if not old_value:
+        where = ''
+        if pk is not None:
+            where = f'WHERE {qn(meta.db_table)}.{qn(meta.pk.column)} = %s'
+            params.append(pk)
+
+        sql = f'''
+            WITH source AS MATERIALIZED (
+                SELECT {qn(meta.db_table)}.*, {''.join(c + ', ' for c in selected_columns)}
+                    nextval(pg_get_serial_sequence(%s, %s)) AS clone_id
+                FROM {qn(meta.db_table)}
+                {' '.join(joins)}
+                {where}
+            ), copied AS (
+                INSERT INTO {qn(meta.db_table)} ({', '.join(qn(f.column) for f in meta.concrete_fields)})
+                SELECT {', '.join(column_values)} FROM source
+            )
+            SELECT source.{qn(meta.pk.column)}, source.clone_id FROM source
+        '''
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return dict(cursor.fetchall())
+
+    def _override_fields(
+        self,
+        model: StorageModel,
+        overrides: dict[str, t.Any]
+    ) -> t.List[tuple[StorageModel, StorageModel]]:
+        """
+        Sets the values of the fields of the model and its 1-1 related models given as nested dicts.
+        Returns the changed models paired with their copies before the change.
+        """
+        field_metadata = model.get_field_metadata()
+        old_model = copy.copy(model)
+        pairs = [(model, old_model)]
+
+        for field_name, value in overrides.items():
+            relation = field_metadata.backward_relations.get(field_name)
+            if relation and not relation.is_many and isinstance(value, dict):
+                related_models = model.get_related_models(field_name)
+                if not related_models:
+                    raise UserError(f'{type(model).__name__}.{field_name} is empty and can not be overridden')
+                pairs.extend(self._override_fields(related_models[0], value))
+                continue
+
+            field = model._meta.get_field(field_name) \
+                if field_name in field_metadata.concrete_field_attnames else None
+            if field is None or field.primary_key or field.is_relation or not field.editable:
+                raise UserError(f'{type(model).__name__}.{field_name} can not be overridden')
+
+            null_flavor_field_name = field_metadata.null_flavor_field_names.get(field_name)
+            if isinstance(value, NullFlavor) and null_flavor_field_name:
+                setattr(model, field_name, None)
+                setattr(model, null_flavor_field_name, value)
                 continue
+            setattr(model, field_name, value)
+            if null_flavor_field_name:
+                setattr(model, null_flavor_field_name, None)
+
+        return pairs
+
+    def _load_related_tree(self, models: t.Iterable[StorageModel], unit_of_work: UnitOfWork) -> None:
+        """
+        Loads the related models of the models level by level of the tree into the unit of work,
+        with a single query per relation for the ones that are not known there yet.
+        """
+        level = [*models]
+
+        while level:
+            models_by_class = collections.defaultdict(list)
+            for model in level:
+                models_by_class[type(model)].append(model)
+
+            next_level = []
+            for model_class, models in models_by_class.items():
+                for relation in model_class.get_field_metadata().backward_relations.values():
+                    models_to_load = [model for model in models if unit_of_work.get_related(model, relation.name) is None]
+                    if models_to_load:
+                        remote_attname = relation.related_model._meta.get_field(relation.remote_field_name).attname
+                        related_models_by_parent_id = collections.defaultdict(list)
+                        related_models = relation.related_model.objects\
+                            .filter(**{f'{relation.remote_field_name}__in': [model.id for model in models_to_load]})
+                        for related_model in related_models:
+                            related_models_by_parent_id[getattr(related_model, remote_attname)].append(related_model)
+                            unit_of_work.add(related_model)
+
+                        for model in models_to_load:
+                            for related_model in related_models_by_parent_id[model.id]:
+                                # Parent is known, so it is not fetched when accessed from the related model
+                                setattr(related_model, relation.remote_field_name, model)
+                            unit_of_work.set_related(model, relation.name, related_models_by_parent_id[model.id])
+
+                    for model in models:
+                        next_level.extend(unit_of_work.get_related(model, relation.name))
+            level = next_level
+
+    def _update(self, new_model: StorageModel, pk: int, unit_of_work: UnitOfWork) -> None:
+        """Same as update, but runs in the transaction of the operation it is a part of without a savepoint."""
+        new_model.id = pk
+        old_model = self.read(type(new_model), pk)
+        self._update_with_related(new_model, old_model, unit_of_work)
+
+    def _update_with_related(self, new_model: StorageModel, old_model: StorageModel, unit_of_work: UnitOfWork) -> None:
+        """
+        Updates the model with its related models level by level of the tree against the stored one,
+        which is loaded into the unit of work with a single query per relation.
+        Related models missing in the new tree are deleted and only changed rows and columns are updated,
+        both with a single query per model class. New related models are inserted after that.
+        """
+        updated_models = []
+        new_related_models = []
+        level = [(new_model, old_model)]
+
+        while level:
+            for model, old in level:
+                model.pre_update()
+                self._check_forward_relations(model, old)
+
+            pairs_by_class = collections.defaultdict(list)
+            for model, old in level:
+                pairs_by_class[type(model)].append((model, old))
+
+            next_level = []
+            ids_to_delete = collections.defaultdict(list)
+            for model_class, pairs in pairs_by_class.items():
+                for relation in model_class.get_field_metadata().backward_relations.values():
+                    # Relations missing in the model are left as they are
+                    relation_pairs = [(model, old) for model, old in pairs if relation.temp_field_name in vars(model)]
+                    if not relation_pairs:
+                        continue
+
+                    for model, old in relation_pairs:
+                        old_related_by_id = {m.id: m for m in old.get_related_models(relation.name)}
+                        related_models = list(self._iter_relation_models(model, relation))
+                        for related_model in related_models:
+                            if related_model.id is None:
+                                new_related_models.append(related_model)
+                            elif related_model.id in old_related_by_id:
+                                next_level.append((related_model, old_related_by_id.pop(related_model.id)))
+                            else:
+                                self._raise_not_related(related_model, relation)
+                        ids_to_delete[relation.related_model].extend(old_related_by_id.keys())
+                        unit_of_work.set_related(model, relation.name, related_models)
 
-            if field.many_to_one or field.one_to_one:
-                if not new_value or new_value.id != old_value.id:
-                    self.delete_model(old_value)
-            else:
-                old_id_to_model_dict = {v.id: v for v in old_value.all()}
-                old_ids = old_id_to_model_dict.keys()
-                new_ids = set(v.id for v in new_value) if new_value else set()
-                for old_id in old_ids - new_ids:
-                    self.delete_model(old_id_to_model_dict[old_id])
-
-        # Check that model doesn't change fk as it is not allowed
-        fk_names = [
-            f.name for f in new_model._meta.get_fields() 
-            # Get only real db fk without backward rel
-            if f.many_to_one or f.one_to_one and not isinstance(f, djm.ForeignObjectRel)
-        ]
-        for fk_name in fk_names:
-            new_fk_val = getattr(new_model, fk_name, None)
-            old_fk_val = getattr(old_model, fk_name, None)
-            if old_fk_val and new_fk_val != old_fk_val:
+            # Old related models are deleted before the models are saved, as with the recursive save
+            for related_model_class, ids in ids_to_delete.items():
+                if ids:
+                    self._delete_rows_with_related(related_model_class, ids)
+                    unit_of_work.discard(related_model_class, ids)
+            self._update_changed_fields(level)
+            # Models are stored only now, so hooks of the level get the old ones before that
+            for model, _ in level:
+                unit_of_work.add(model)
+            updated_models.extend(model for model, _ in level)
+            level = next_level
+
+        if new_related_models:
+            self._create_with_related(new_related_models, unit_of_work)
+
+        # Related models are finished before the models they belong to, as with the recursive save
+        for model in reversed(updated_models):
+            model.post_update()
+
+    @staticmethod
+    def _check_forward_relations(new_model: StorageModel, old_model: StorageModel) -> None:
+        """Checks that model doesn't change fk as it is not allowed."""
+        field_metadata = new_model.get_field_metadata()
+        for fk_name in field_metadata.forward_relation_names:
+            attname = field_metadata.concrete_field_attnames[fk_name]
+            old_fk_val = getattr(old_model, attname)
+            if old_fk_val and getattr(new_model, attname) != old_fk_val:
                 raise UserError(
                     f'Forbidden atempt to change the foreign key ' +
-                    '"{new_model.__class__.__name__}.{fk_name}"'
+                    f'"{new_model.__class__.__name__}.{fk_name}"'
                 )
 
-        self._save_with_related(new_model, self.SaveOperation.UPDATE)
-        new_model.post_update()
-        return new_model, True
-    
-    def delete(self, model_class: type[StorageModel], pk: int) -> bool:
-        self.read(model_class, pk).delete()
-        return True
+    def _raise_not_related(self, related_model: StorageModel, relation: RelationMetadata) -> t.NoReturn:
+        # Raises the same errors as if the related model was updated on its own
+        self._get(type(related_model), related_model.id)
+        raise UserError(
+            f'Forbidden atempt to change the foreign key ' +
+            f'"{related_model.__class__.__name__}.{relation.remote_field_name}"'
+        )
 
-    def _save_with_related(self, new_model: StorageModel, save_operation: SaveOperation) -> None:
-        if not isinstance(save_operation, self.SaveOperation):
-            raise ValueError('Expected save_operation to be an instance of SaveOperation')
+    @staticmethod
+    def _update_changed_fields(pairs: t.Iterable[tuple[StorageModel, StorageModel]]) -> None:
+        """Updates the changed columns of the models with a single query per model class."""
+        changed_models_by_class = collections.defaultdict(list)
+        changed_field_names_by_class = collections.defaultdict(set)
 
-        new_model.save(
-            # To prevent django from inserting an entity with the id that does not exist
-            force_insert=save_operation == self.SaveOperation.INSERT,
-            force_update=save_operation == self.SaveOperation.UPDATE
-        )
+        for model, old_model in pairs:
+            changed_field_names = set()
+            for field in model._meta.concrete_fields:
+                if field.primary_key:
+                    continue
+                # Same as on save, this also sets the values derived from other fields
+                new_value = field.get_prep_value(field.pre_save(model, False))
+                if new_value != field.get_prep_value(getattr(old_model, field.attname)):
+                    changed_field_names.add(field.name)
 
-        # Create or update related models
-        for key, value in vars(new_model).items():
-            if not temp_relation_field_utils.is_special_field_name(key):
-                continue
+            if changed_field_names:
+                changed_models_by_class[type(model)].append(model)
+                changed_field_names_by_class[type(model)].update(changed_field_names)
+            # As if the model was saved
+            model._state.adding = False
+            model._state.db = old_model._state.db
 
-            field_name = temp_relation_field_utils.get_base_field_name(key)
-            related_field_name = new_model._meta.get_field(field_name).remote_field.name
-            related_models = value if isinstance(value, list) else [value]
+        for model_class, models in changed_models_by_class.items():
+            model_class.objects.bulk_update(models, changed_field_names_by_class[model_class])
 
-            for related_model in related_models:
-                if related_model is None:
-                    continue
-                setattr(related_model, related_field_name, new_model)
-                if related_model.id is None:
-                    self.create(related_model)
-                else:
-                    self.update(related_model, related_model.id)
+    def _create_with_related(self, new_models: t.Iterable[StorageModel], unit_of_work: UnitOfWork) -> None:
+        """
+        Inserts the models with all their new related models level by level of the tree,
+        so that each level is inserted with a single query per model class and its ids are known to the next level.
+        Related models with ids are updated once their parents are inserted.
+        """
+        created_models = []
+        level = [*new_models]
+
+        while level:
+            # Parents are already inserted, as hooks can use them
+            for model in level:
+                model.pre_create()
+
+            models_by_class = collections.defaultdict(list)
+            for model in level:
+                models_by_class[type(model)].append(model)
+            for model_class in self._sort_by_dependencies(models_by_class.keys()):
+                model_class.objects.bulk_create(models_by_class[model_class])
+            created_models.extend(level)
+
+            next_level = []
+            for model in level:
+                unit_of_work.add(model)
+                # All related models of a new model are known, including the missing ones
+                for relation in model.get_field_metadata().backward_relations.values():
+                    related_models = list(self._iter_relation_models(model, relation))
+                    unit_of_work.set_related(model, relation.name, related_models)
+                    for related_model in related_models:
+                        if related_model.id is None:
+                            next_level.append(related_model)
+                        else:
+                            self._update(related_model, related_model.id, unit_of_work)
+            level = next_level
+
+        # Related models are finished before the models they belong to, as with the recursive save
+        for model in reversed(created_models):
+            model.post_create()
+
+    @staticmethod
+    def _iter_relation_models(model: StorageModel, relation: RelationMetadata) -> t.Iterator[StorageModel]:
+        """Yields the related models of the relation set in the model, each of them gets the model as its parent."""
+        value = vars(model).get(relation.temp_field_name)
+        for related_model in value if isinstance(value, list) else [value]:
+            if related_model is None:
+                continue
+            setattr(related_model, relation.remote_field_name, model)
+            yield related_model
+
+    @staticmethod
+    def _sort_by_dependencies(model_classes: t.Collection[type[StorageModel]]) -> t.Iterable[type[StorageModel]]:
+        """Sorts model classes so that models referenced by foreign keys are inserted first."""
+        sorter = graphlib.TopologicalSorter()
+        for model_class in model_classes:
+            dependencies = [
+                field.related_model for field in model_class._meta.concrete_fields
+                if field.is_relation and field.related_model in model_classes
+            ]
+            sorter.add(model_class, *dependencies)
+        return sorter.static_order()
 
     def delete_model(self, old_model: StorageModel) -> None:
         self.delete(type(old_model), old_model.pk)
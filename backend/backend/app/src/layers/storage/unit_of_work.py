@@ -0,0 +1,84 @@
+import collections
+import contextlib
+import contextvars
+import typing as t
+
+from django.db import models as m
+
+
+class UnitOfWork:
+    """
+    Identity map of the rows loaded and saved while being active, so that they are not fetched again.
+    Related models of a backward relation are kept only when all of them are known,
+    i.e. they are loaded or saved together.
+    Changes of fields made by the model hooks are collected and saved together on flush.
+    """
+
+    _active_unit_of_work: t.ClassVar[contextvars.ContextVar['UnitOfWork | None']] = \
+        contextvars.ContextVar('active_unit_of_work', default=None)
+
+    def __init__(self) -> None:
+        self._models: dict[tuple[type[m.Model], int], m.Model] = dict()
+        self._related_models: dict[tuple[type[m.Model], int, str], list[m.Model]] = dict()
+        self._dirty_field_names: dict[tuple[type[m.Model], int], tuple[m.Model, set[str]]] = dict()
+        self._token: contextvars.Token | None = None
+
+    def __enter__(self) -> t.Self:
+        self._token = self._active_unit_of_work.set(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._active_unit_of_work.reset(self._token)
+
+    @classmethod
+    def get_active(cls) -> t.Self | None:
+        return cls._active_unit_of_work.get()
+
+    @classmethod
+    @contextlib.contextmanager
+    def join(cls) -> t.Iterator[t.Self]:
+        """Uses the active unit of work or a new one, if there is none."""
+        unit_of_work = cls.get_active()
+        if unit_of_work is not None:
+            yield unit_of_work
+            return
+        with cls() as unit_of_work:
+            yield unit_of_work
+
+    def add(self, model: m.Model) -> None:
+        self._models[(type(model), model.pk)] = model
+
+    def get[T: m.Model](self, model_class: type[T], pk: int) -> T | None:
+        return self._models.get((model_class, pk))
+
+    def discard(self, model_class: type[m.Model], pks: t.Iterable[int]) -> None:
+        for pk in pks:
+            self._models.pop((model_class, pk), None)
+            self._dirty_field_names.pop((model_class, pk), None)
+
+    def set_related(self, model: m.Model, relation_name: str, related_models: t.Iterable[m.Model]) -> None:
+        related_models = list(related_models)
+        self._related_models[(type(model), model.pk, relation_name)] = related_models
+        for related_model in related_models:
+            # New models are not stored yet, they are added once they get their pks
+            if related_model.pk is not None:
+                self.add(related_model)
+
+    def get_related(self, model: m.Model, relation_name: str) -> list[m.Model] | None:
+        return self._related_models.get((type(model), model.pk, relation_name))
+
+    def mark_dirty(self, model: m.Model, field_names: t.Iterable[str]) -> None:
+        _, dirty_field_names = self._dirty_field_names.setdefault((type(model), model.pk), (model, set()))
+        dirty_field_names.update(field_names)
+
+    def flush(self) -> None:
+        """Saves the changed fields with a single query per model class."""
+        models_by_class = collections.defaultdict(list)
+        field_names_by_class = collections.defaultdict(set)
+        for (model_class, _), (model, field_names) in self._dirty_field_names.items():
+            models_by_class[model_class].append(model)
+            field_names_by_class[model_class].update(field_names)
+        self._dirty_field_names.clear()
+
+        for model_class, models in models_by_class.items():
+            model_class.objects.bulk_update(models, field_names_by_class[model_class])
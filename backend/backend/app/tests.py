@@ -1,19 +1,32 @@
 import base64
+import copy
 import dataclasses as dc
+import datetime as dt
 from http import HTTPStatus
 import json
 import logging
+import os
 import typing as t
 import tempfile
+from unittest import mock
+import warnings
 
 from django import http
 from django.contrib.auth.models import User
-from django.test import TestCase, Client
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from app.src.enums import NullFlavor as NF
+from app.src.hl7date import DatePrecision, HL7Date, HL7DateUtils
+from app.src.layers import api, domain
+from app.src.layers.api import compact
 from app.src.layers.api.models.logging import Log
+from app.src.layers.api.views import ModelBatchBusinessValidationView, ModelBusinessValidationView
 from app.src.layers.storage import models as sm
 from app.src.layers.storage.models import DosageFormCode
+from extensions import pydantic as pde
 
 PATH_BASE = '/api/icsr'
 USERNAME = 'testuser'
@@ -29,7 +42,15 @@ class RequestData:
     id: int = None
     data: dict[str, t.Any] = None
 
-    def call(self, *, auth: tuple[str, str] = None, id: int = None, data: dict[str, t.Any] = None) -> http.HttpResponse:
+    def call(
+        self,
+        *,
+        auth: tuple[str, str] = None,
+        id: int = None,
+        data: dict[str, t.Any] = None,
+        content_type: str = 'application/json',
+        accept: str = None
+    ) -> http.HttpResponse:
         if auth is None:
             auth = self.auth
         if id is None:
@@ -48,8 +69,11 @@ class RequestData:
                     'Basic ' + base64.b64encode(f'{auth[0]}:{auth[1]}'.encode()).decode()
             }
 
+        if accept:
+            auth_dict['HTTP_ACCEPT'] = accept
+
         if data:
-            return self.method(path, data=json.dumps(data), content_type='application/json', **auth_dict)
+            return self.method(path, data=json.dumps(data), content_type=content_type, **auth_dict)
         else:
             return self.method(path, **auth_dict)
 
@@ -62,6 +86,8 @@ READ_RD = RequestData(method=CLIENT.get, path=PATH_BASE, id=0)
 UPDATE_RD = RequestData(method=CLIENT.put, path=PATH_BASE, id=0)
 DELETE_RD = RequestData(method=CLIENT.delete, path=PATH_BASE, id=0)
 VALIDATE_RD = RequestData(method=CLIENT.post, path=PATH_BASE + '/validate')
+VALIDATE_BATCH_RD = RequestData(method=CLIENT.post, path=PATH_BASE + '/validate/batch')
+DELETE_BATCH_RD = RequestData(method=CLIENT.post, path=PATH_BASE + '/delete/batch')
 TO_XML_RD = RequestData(method=CLIENT.post, path=PATH_BASE + '/to-xml')
 FROM_XML_RD = RequestData(method=CLIENT.post, path=PATH_BASE + '/from-xml')
 
@@ -77,6 +103,9 @@ class MainTestCase(TestCase):
         user.set_password(PASSWORD)
         user.save()
 
+        # Results of validation memoized by other tests should not affect the counts of validations
+        ModelBusinessValidationView.get_validation_memo_store.cache_clear()
+
     def tearDown(self):
         self.logger.setLevel(self.previous_log_level)
 
@@ -140,6 +169,29 @@ class MainTestCase(TestCase):
         self.assertEqual(resp.status_code, HTTPStatus.OK)
         self.assertEqual(len(cont), count)
 
+    def test_list_cases_ordered_by_creation_date(self):
+        # Ordered by time in UTC and not by raw values
+        creation_dates = ['2024011506', '202401151000+0500', '2024']
+        for creation_date in creation_dates:
+            resp = CREATE_RD.call(data={
+                'c_1_identification_case_safety_report': {
+                    'c_1_2_date_creation': {
+                        'value': creation_date
+                    }
+                }
+            })
+            self.assertEqual(resp.status_code, HTTPStatus.OK)
+
+        c_1 = sm.C_1_identification_case_safety_report.objects.get(c_1_2_date_creation='202401151000+0500')
+        self.assertEqual(c_1.ts_c_1_2_date_creation, dt.datetime(2024, 1, 15, 5, tzinfo=dt.timezone.utc))
+        self.assertEqual(c_1.prec_c_1_2_date_creation, DatePrecision.MINUTE)
+
+        resp = LIST_RD.call()
+        cont = json.loads(resp.content)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        self.assertEqual([icsr['creation_date'] for icsr in cont], creation_dates)
+
     def test_create_case(self):
         ini_data = {
             'c_3_information_sender_case_safety_report': {
@@ -185,6 +237,136 @@ class MainTestCase(TestCase):
             res_data['c_2_r_primary_source_information'][1]['id']
         )
 
+    def test_create_case_validates_each_model_once(self):
+        ini_data = {
+            'c_3_information_sender_case_safety_report': {
+                'c_3_2_sender_organisation': {
+                    'value': 'abc'
+                }
+            },
+            'c_2_r_primary_source_information': [
+                {},
+                {}
+            ]
+        }
+        with pde.ValidationCounter() as counter:
+            resp = CREATE_RD.call(data=ini_data)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        for layer in (api, domain):
+            self.assertEqual(counter.counts[layer.models.ICSR], 1)
+            self.assertEqual(counter.counts[layer.models.C_3_information_sender_case_safety_report], 1)
+            self.assertEqual(counter.counts[layer.models.C_2_r_primary_source_information], 2)
+
+    def test_create_invalid_case(self):
+        ini_data = {
+            'c_2_r_primary_source_information': [
+                {},
+                {
+                    'c_2_r_4_qualification': {
+                        'value': 100
+                    }
+                }
+            ]
+        }
+        resp = CREATE_RD.call(data=ini_data)
+        res_data = json.loads(resp.content)
+
+        self.assertEqual(resp.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(sm.ICSR.objects.count(), 0)
+        self.assertEqual(
+            len(res_data['_errors']['c_2_r_primary_source_information']['1']['c_2_r_4_qualification']['value'][
+                    '_self']['parsing']),
+            1
+        )
+
+    def test_create_and_validate_case_with_value_and_null_flavor(self):
+        ini_data = {
+            'c_1_identification_case_safety_report': {
+                'c_1_7_fulfil_local_criteria_expedited_report': {
+                    'value': True,
+                    'null_flavor': 'NI'
+                }
+            }
+        }
+        # Validation is repeated to get the errors memoized by the first one
+        for rd in [CREATE_RD, VALIDATE_RD, VALIDATE_RD]:
+            resp = rd.call(data=ini_data)
+            res_data = json.loads(resp.content)
+
+            self.assertEqual(resp.status_code, HTTPStatus.BAD_REQUEST)
+            self.assertIn(
+                'c_1_7_fulfil_local_criteria_expedited_report',
+                res_data['_errors']['c_1_identification_case_safety_report']
+            )
+        self.assertEqual(sm.ICSR.objects.count(), 0)
+
+    def test_create_case_with_unknown_reaction_assessed(self):
+        ini_data = {
+            'e_i_reaction_event': [
+                {
+                    'uuid': '1b7a4f5e-5b14-4b6a-9a3e-3f1c2f0f9e11'
+                }
+            ],
+            'g_k_drug_information': [
+                {
+                    'g_k_9_i_drug_reaction_matrix': [
+                        {
+                            'g_k_9_i_1_reaction_assessed': '1b7a4f5e-5b14-4b6a-9a3e-3f1c2f0f9e11'
+                        },
+                        {
+                            'g_k_9_i_1_reaction_assessed': 'c2e4d4a8-8f1c-4c55-b8a6-8d4f1b3f7a22'
+                        }
+                    ]
+                }
+            ]
+        }
+        resp = CREATE_RD.call(data=ini_data)
+        res_data = json.loads(resp.content)
+
+        self.assertEqual(resp.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(sm.ICSR.objects.count(), 0)
+        self.assertEqual(
+            len(res_data['_errors']['g_k_drug_information']['0']['g_k_9_i_drug_reaction_matrix']['1'][
+                    'g_k_9_i_1_reaction_assessed']['_self']['parsing']),
+            1
+        )
+        self.assertNotIn('0', res_data['_errors']['g_k_drug_information']['0']['g_k_9_i_drug_reaction_matrix'])
+
+    def test_create_case_with_reaction_assessed_by_several_drugs(self):
+        reaction_uuid = '1b7a4f5e-5b14-4b6a-9a3e-3f1c2f0f9e11'
+        ini_data = {
+            'e_i_reaction_event': [
+                {
+                    'uuid': reaction_uuid
+                }
+            ],
+            'g_k_drug_information': [
+                {
+                    'g_k_9_i_drug_reaction_matrix': [
+                        {
+                            'g_k_9_i_1_reaction_assessed': reaction_uuid
+                        }
+                    ]
+                },
+                {
+                    'g_k_9_i_drug_reaction_matrix': [
+                        {
+                            'g_k_9_i_1_reaction_assessed': reaction_uuid
+                        }
+                    ]
+                }
+            ]
+        }
+        resp = CREATE_RD.call(data=ini_data)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        reaction = sm.E_i_reaction_event.objects.get()
+        self.assertEqual(
+            list(sm.G_k_9_i_drug_reaction_matrix.objects.values_list('g_k_9_i_1_reaction_assessed', flat=True)),
+            [reaction.id, reaction.id]
+        )
+
     def test_read_case(self):
         icsr = sm.ICSR.objects.create()
         c_3 = sm.C_3_information_sender_case_safety_report.objects.create(icsr=icsr, c_3_2_sender_organisation='abc')
@@ -216,6 +398,71 @@ class MainTestCase(TestCase):
             res_data['c_2_r_primary_source_information'][1]['id']
         )
 
+    def test_read_case_with_verification_on_read(self):
+        icsr = sm.ICSR.objects.create()
+        sm.C_3_information_sender_case_safety_report.objects.create(icsr=icsr, c_3_2_sender_organisation='abc')
+        sm.C_2_r_primary_source_information.objects.create(
+            icsr=icsr, nf_c_2_r_1_1_reporter_title='MSK', c_2_r_5_primary_source_regulatory_purposes=1)
+
+        trusted_resp = READ_RD.call(id=icsr.id)
+        with override_settings(STORAGE_VERIFY_ON_READ=True):
+            verified_resp = READ_RD.call(id=icsr.id)
+
+        self.assertEqual(trusted_resp.status_code, HTTPStatus.OK)
+        self.assertEqual(verified_resp.status_code, HTTPStatus.OK)
+        self.assertEqual(json.loads(trusted_resp.content), json.loads(verified_resp.content))
+
+    def test_read_case_verification_detects_corrupted_data(self):
+        icsr = sm.ICSR.objects.create()
+        sm.C_3_information_sender_case_safety_report.objects.create(icsr=icsr, c_3_2_sender_organisation='№')
+
+        trusted_data = json.loads(READ_RD.call(id=icsr.id).content)
+        with override_settings(STORAGE_VERIFY_ON_READ_SAMPLE_PERCENT=100):
+            verified_data = json.loads(READ_RD.call(id=icsr.id).content)
+
+        self.assertNotIn('_errors', trusted_data)
+        self.assertEqual(
+            len(verified_data['_errors']['c_3_information_sender_case_safety_report']['c_3_2_sender_organisation'][
+                    '_self']['parsing']),
+            1
+        )
+
+    def test_create_and_update_case_null_flavors(self):
+        ini_data = {
+            'c_2_r_primary_source_information': [{
+                'c_2_r_1_1_reporter_title': {'null_flavor': 'UNK'},
+                'c_2_r_2_7_reporter_telephone': {'null_flavor': 'MSK'},
+                'c_2_r_4_qualification': {'null_flavor': 'UNK'}
+            }]
+        }
+        resp = CREATE_RD.call(data=ini_data)
+        res_data = json.loads(resp.content)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        c_2 = sm.C_2_r_primary_source_information.objects.get()
+        self.assertIsNotNone(c_2.null_flavors)
+        self.assertEqual(
+            (c_2.nf_c_2_r_1_1_reporter_title, c_2.nf_c_2_r_2_7_reporter_telephone, c_2.nf_c_2_r_4_qualification),
+            (NF.UNK, NF.MSK, NF.UNK)
+        )
+
+        c_2_data = res_data['c_2_r_primary_source_information'][0]
+        c_2_data['c_2_r_2_7_reporter_telephone'] = {'value': '123'}
+        c_2_data['c_2_r_4_qualification'] = {'null_flavor': None}
+        resp = UPDATE_RD.call(id=res_data['id'], data=res_data)
+        res_data = json.loads(resp.content)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        c_2.refresh_from_db()
+        self.assertEqual(
+            (c_2.nf_c_2_r_1_1_reporter_title, c_2.nf_c_2_r_2_7_reporter_telephone, c_2.nf_c_2_r_4_qualification),
+            (NF.UNK, None, None)
+        )
+        self.assertEqual(
+            res_data['c_2_r_primary_source_information'][0]['c_2_r_1_1_reporter_title'],
+            {'value': None, 'null_flavor': 'UNK'}
+        )
+
     def test_update_case(self):
         icsr = sm.ICSR.objects.create()
         c_3 = sm.C_3_information_sender_case_safety_report.objects.create(icsr=icsr, c_3_2_sender_organisation='abc')
@@ -273,6 +520,221 @@ class MainTestCase(TestCase):
             c_2_2.id
         )
 
+    def test_update_case_only_changed_rows(self):
+        ini_data = {
+            'c_2_r_primary_source_information': [
+                {'c_2_r_1_2_reporter_given_name': {'value': name}} for name in ['A', 'B', 'C']
+            ]
+        }
+        resp = CREATE_RD.call(data=ini_data)
+        res_data = json.loads(resp.content)
+        c_2_data = res_data['c_2_r_primary_source_information']
+
+        c_2_data[1]['c_2_r_1_2_reporter_given_name']['value'] = 'D'
+        res_data['c_2_r_primary_source_information'] = [
+            c_2_data[0],
+            c_2_data[1],
+            {'c_2_r_1_2_reporter_given_name': {'value': 'E'}}
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            resp = UPDATE_RD.call(id=res_data['id'], data=res_data)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        c_2s = sm.C_2_r_primary_source_information.objects
+        self.assertEqual(c_2s.count(), 3)
+        self.assertEqual(c_2s.get(id=c_2_data[0]['id']).c_2_r_1_2_reporter_given_name, 'A')
+        self.assertEqual(c_2s.get(id=c_2_data[1]['id']).c_2_r_1_2_reporter_given_name, 'D')
+        # The removed row is deleted and the added one is inserted as a new row
+        self.assertNotIn(c_2s.get(c_2_r_1_2_reporter_given_name='E').id, [c_2['id'] for c_2 in c_2_data])
+        # Requests are logged separately from the case
+        updates = [
+            q['sql'] for q in queries.captured_queries
+            if q['sql'].startswith('UPDATE') and Log._meta.db_table not in q['sql']
+        ]
+        # The version of the case is increased by the last update
+        self.assertEqual(len(updates), 2)
+        self.assertIn('c_2_r_1_2_reporter_given_name', updates[0])
+        self.assertTrue(updates[1].startswith(f'UPDATE "{sm.ICSR._meta.db_table}" SET "version"'))
+
+    def test_update_case_deleting_removed_rows_by_set(self):
+        reaction_uuid = '1b7a4f5e-5b14-4b6a-9a3e-3f1c2f0f9e11'
+        ini_data = {
+            'e_i_reaction_event': [
+                {
+                    'uuid': reaction_uuid
+                },
+                {}
+            ],
+            'g_k_drug_information': [
+                {
+                    'g_k_9_i_drug_reaction_matrix': [
+                        {
+                            'g_k_9_i_1_reaction_assessed': reaction_uuid
+                        }
+                    ]
+                }
+            ]
+        }
+        resp = CREATE_RD.call(data=ini_data)
+        res_data = json.loads(resp.content)
+
+        res_data['e_i_reaction_event'] = res_data['e_i_reaction_event'][1:]
+        del res_data['g_k_drug_information']
+        with CaptureQueriesContext(connection) as queries:
+            resp = UPDATE_RD.call(id=res_data['id'], data=res_data)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        self.assertEqual(sm.E_i_reaction_event.objects.count(), 1)
+        self.assertFalse(sm.G_k_9_i_drug_reaction_matrix.objects.exists())
+        # Removed rows are deleted by the ids of their parents without loading them
+        deletes = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('DELETE')]
+        self.assertTrue(deletes)
+        self.assertTrue(all('= ANY(' in sql for sql in deletes))
+
+    def test_save_case_in_single_transaction(self):
+        ini_data = {
+            'c_2_r_primary_source_information': [{}, {}],
+            'g_k_drug_information': [
+                {
+                    'g_k_2_3_r_substance_id_strength': [{}, {}]
+                }
+            ]
+        }
+        with CaptureQueriesContext(connection) as create_queries:
+            resp = CREATE_RD.call(data=ini_data)
+        res_data = json.loads(resp.content)
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+
+        res_data['g_k_drug_information'].append({'g_k_2_3_r_substance_id_strength': [{}]})
+        with CaptureQueriesContext(connection) as update_queries:
+            resp = UPDATE_RD.call(id=res_data['id'], data=res_data)
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+
+        # Test case runs in a transaction, so the transaction of the operation is a single savepoint
+        for queries in [create_queries, update_queries]:
+            savepoints = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('SAVEPOINT')]
+            self.assertEqual(len(savepoints), 1)
+
+    @mock.patch.dict(os.environ, {'COMPANY_NAME': 'COMPANY'})
+    def test_create_case_calculates_c_1_1(self):
+        ini_data = {
+            'c_2_r_primary_source_information': [
+                {
+                    'c_2_r_3_reporter_country_code': {'value': 'DE'},
+                    'c_2_r_5_primary_source_regulatory_purposes': {'value': 1}
+                }
+            ]
+        }
+        with CaptureQueriesContext(connection) as queries:
+            resp = CREATE_RD.call(data=ini_data)
+        res_data = json.loads(resp.content)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        c_1 = sm.C_1_identification_case_safety_report.objects.get()
+        self.assertEqual(c_1.c_1_1_sender_safety_report_unique_id, f'DE-COMPANY-{c_1.id}')
+        # C.1.1 is saved with the insert of C.1
+        c_1_writes = [
+            q['sql'] for q in queries.captured_queries
+            if q['sql'].startswith(('INSERT', 'UPDATE')) and c_1._meta.db_table in q['sql']
+        ]
+        self.assertEqual(len(c_1_writes), 1)
+        self.assertTrue(c_1_writes[0].startswith('INSERT'))
+        self.assertEqual(
+            res_data['c_1_identification_case_safety_report']['c_1_1_sender_safety_report_unique_id']['value'],
+            f'DE-COMPANY-{c_1.id}'
+        )
+
+    def test_create_and_update_case_repeating_groups_stored_on_parent(self):
+        ini_data = {
+            'c_1_identification_case_safety_report': {
+                'c_1_10_r_identification_number_report_linked': [
+                    {'c_1_10_r_identification_number_report_linked': {'value': 'A-1'}},
+                    {'c_1_10_r_identification_number_report_linked': {'value': 'A-2'}}
+                ]
+            }
+        }
+        resp = CREATE_RD.call(data=ini_data)
+        res_data = json.loads(resp.content)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            sm.C_1_identification_case_safety_report.objects.get().c_1_10_r_identification_number_report_linked,
+            [
+                {'c_1_10_r_identification_number_report_linked': 'A-1'},
+                {'c_1_10_r_identification_number_report_linked': 'A-2'}
+            ]
+        )
+        linked_data = res_data['c_1_identification_case_safety_report']['c_1_10_r_identification_number_report_linked']
+        self.assertEqual(
+            [item['c_1_10_r_identification_number_report_linked']['value'] for item in linked_data],
+            ['A-1', 'A-2']
+        )
+
+        linked_data[0]['c_1_10_r_identification_number_report_linked']['value'] = 'A-2'
+        resp = UPDATE_RD.call(id=res_data['id'], data=res_data)
+
+        self.assertEqual(resp.status_code, HTTPStatus.BAD_REQUEST)
+
+        del linked_data[0]
+        resp = UPDATE_RD.call(id=res_data['id'], data=res_data)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            sm.C_1_identification_case_safety_report.objects.get().c_1_10_r_identification_number_report_linked,
+            [{'c_1_10_r_identification_number_report_linked': 'A-2'}]
+        )
+
+    def test_read_case_with_constant_number_of_queries(self):
+        query_counts = []
+        for rows in [1, 3]:
+            resp = CREATE_RD.call(data={
+                'c_2_r_primary_source_information': [{} for _ in range(rows)],
+                'g_k_drug_information': [
+                    {
+                        'g_k_2_3_r_substance_id_strength': [{} for _ in range(rows)]
+                    }
+                    for _ in range(rows)
+                ]
+            })
+            with CaptureQueriesContext(connection) as queries:
+                READ_RD.call(id=json.loads(resp.content)['id'])
+            query_counts.append(len(queries))
+
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_update_case_with_related_model_of_other_case(self):
+        other_icsr = sm.ICSR.objects.create()
+        other_c_2 = sm.C_2_r_primary_source_information.objects.create(icsr=other_icsr)
+        icsr = sm.ICSR.objects.create()
+
+        ini_data = {
+            'c_2_r_primary_source_information': [
+                {'id': other_c_2.id}
+            ]
+        }
+        resp = UPDATE_RD.call(id=icsr.id, data=ini_data)
+
+        self.assertEqual(resp.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(sm.C_2_r_primary_source_information.objects.get().icsr_id, other_icsr.id)
+
+    def test_update_case_with_outdated_version(self):
+        resp = CREATE_RD.call(data={'c_2_r_primary_source_information': [{}]})
+        res_data = json.loads(resp.content)
+        self.assertEqual(res_data['version'], 1)
+
+        first_data = copy.deepcopy(res_data)
+        first_data['c_2_r_primary_source_information'][0]['c_2_r_1_2_reporter_given_name'] = {'value': 'A'}
+        resp = UPDATE_RD.call(id=res_data['id'], data=first_data)
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        self.assertEqual(json.loads(resp.content)['version'], 2)
+
+        second_data = copy.deepcopy(res_data)
+        second_data['c_2_r_primary_source_information'][0]['c_2_r_1_2_reporter_given_name'] = {'value': 'B'}
+        resp = UPDATE_RD.call(id=res_data['id'], data=second_data)
+        self.assertEqual(resp.status_code, HTTPStatus.CONFLICT)
+        self.assertEqual(sm.ICSR.objects.get().version, 2)
+        self.assertEqual(sm.C_2_r_primary_source_information.objects.get().c_2_r_1_2_reporter_given_name, 'A')
+
     def test_delete_case(self):
         icsrs = [sm.ICSR.objects.create() for _ in range(3)]
         for icsr in icsrs:
@@ -288,6 +750,127 @@ class MainTestCase(TestCase):
         self.assertEqual(sm.C_2_r_primary_source_information.objects.count(), 0)
         self.assertEqual(len(sm.ICSR.objects.filter(id=icsr.id)), 0)
 
+    def test_delete_cases_batch(self):
+        reaction_uuid = '1b7a4f5e-5b14-4b6a-9a3e-3f1c2f0f9e11'
+        ini_data = {
+            'e_i_reaction_event': [
+                {
+                    'uuid': reaction_uuid
+                }
+            ],
+            'g_k_drug_information': [
+                {
+                    'g_k_9_i_drug_reaction_matrix': [
+                        {
+                            'g_k_9_i_1_reaction_assessed': reaction_uuid,
+                            'g_k_9_i_2_r_assessment_relatedness_drug_reaction': [{}]
+                        }
+                    ]
+                }
+            ]
+        }
+        ids = [json.loads(CREATE_RD.call(data=ini_data).content)['id'] for _ in range(3)]
+
+        resp = DELETE_BATCH_RD.call(data={'ids': [ids[0], ids[2], ids[2] + 1]})
+        res_data = json.loads(resp.content)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        self.assertEqual(sorted(res_data['deleted']), [ids[0], ids[2]])
+        self.assertEqual(res_data['not_found'], [ids[2] + 1])
+        self.assertEqual(list(sm.ICSR.objects.values_list('id', flat=True)), [ids[1]])
+        for model_class in [
+            sm.C_1_identification_case_safety_report,
+            sm.E_i_reaction_event,
+            sm.G_k_drug_information,
+            sm.G_k_9_i_drug_reaction_matrix,
+            sm.G_k_9_i_2_r_assessment_relatedness_drug_reaction
+        ]:
+            self.assertEqual(model_class.objects.count(), 1)
+
+    @mock.patch.dict(os.environ, {'COMPANY_NAME': 'COMPANY'})
+    def test_clone_case(self):
+        reaction_uuid = '1b7a4f5e-5b14-4b6a-9a3e-3f1c2f0f9e11'
+        ini_data = {
+            'c_1_identification_case_safety_report': {
+                'c_1_2_date_creation': {'value': '20240101120000'},
+                'c_1_7_fulfil_local_criteria_expedited_report': {'null_flavor': 'NI'},
+                'c_1_8_1_worldwide_unique_case_identification_number': {'value': 'DE-1'}
+            },
+            'c_2_r_primary_source_information': [
+                {
+                    'c_2_r_3_reporter_country_code': {'value': 'DE'},
+                    'c_2_r_5_primary_source_regulatory_purposes': {'value': 1}
+                }
+            ],
+            'e_i_reaction_event': [
+                {
+                    'uuid': reaction_uuid
+                }
+            ],
+            'g_k_drug_information': [
+                {
+                    'g_k_9_i_drug_reaction_matrix': [
+                        {
+                            'g_k_9_i_1_reaction_assessed': reaction_uuid,
+                            'g_k_9_i_2_r_assessment_relatedness_drug_reaction': [{}, {}]
+                        }
+                    ]
+                }
+            ]
+        }
+        res_data = json.loads(CREATE_RD.call(data=ini_data).content)
+        res_data['c_2_r_primary_source_information'][0]['c_2_r_1_2_reporter_given_name'] = {'value': 'A'}
+        UPDATE_RD.call(id=res_data['id'], data=res_data)
+
+        clone_rd = RequestData(method=CLIENT.post, path=f'{PATH_BASE}/{res_data["id"]}/clone')
+        overrides = {'c_1_identification_case_safety_report': {'c_1_2_date_creation': '20240201120000'}}
+        with pde.ValidationCounter() as counter:
+            resp = clone_rd.call(data=overrides)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        # Overrides are validated together with the rest of the case
+        self.assertEqual(counter.counts[domain.models.ICSR], 1)
+        self.assertEqual(counter.counts[domain.models.G_k_9_i_drug_reaction_matrix], 1)
+        clone_id = json.loads(resp.content)['id']
+        self.assertNotEqual(clone_id, res_data['id'])
+        clone = sm.ICSR.objects.get(id=clone_id)
+        self.assertEqual(clone.version, 1)
+        c_1 = sm.C_1_identification_case_safety_report.objects.get(icsr=clone)
+        self.assertEqual(c_1.c_1_1_sender_safety_report_unique_id, f'DE-COMPANY-{c_1.id}')
+        self.assertEqual(c_1.c_1_2_date_creation, '20240201120000')
+        self.assertEqual(c_1.ts_c_1_2_date_creation, dt.datetime(2024, 2, 1, 12, tzinfo=dt.timezone.utc))
+        self.assertEqual(c_1.nf_c_1_7_fulfil_local_criteria_expedited_report, NF.NI)
+        # Unique values can not be copied
+        self.assertIsNone(c_1.c_1_8_1_worldwide_unique_case_identification_number)
+        self.assertEqual(
+            sm.C_2_r_primary_source_information.objects.get(icsr=clone).c_2_r_1_2_reporter_given_name,
+            'A'
+        )
+        # Reaction assessed in the copy is the copied one
+        self.assertEqual(
+            sm.G_k_9_i_drug_reaction_matrix.objects.get(g_k_drug_information__icsr=clone).g_k_9_i_1_reaction_assessed,
+            sm.E_i_reaction_event.objects.get(icsr=clone)
+        )
+        self.assertEqual(
+            sm.G_k_9_i_2_r_assessment_relatedness_drug_reaction.objects
+                .filter(g_k_9_i_drug_reaction_matrix__g_k_drug_information__icsr=clone).count(),
+            2
+        )
+        # Original is left as it is
+        self.assertEqual(
+            sm.C_1_identification_case_safety_report.objects.get(icsr_id=res_data['id']).c_1_2_date_creation,
+            '20240101120000'
+        )
+
+        resp = READ_RD.call(id=clone_id)
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+
+        resp = clone_rd.call(data={'c_1_identification_case_safety_report': {'c_1_2_date_creation': 'abc'}})
+        self.assertEqual(resp.status_code, HTTPStatus.BAD_REQUEST)
+        resp = RequestData(method=CLIENT.post, path=f'{PATH_BASE}/{clone_id + 1}/clone').call()
+        self.assertEqual(resp.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(sm.ICSR.objects.count(), 2)
+
     def test_validate_case(self):
         ini_data = {
             'c_3_information_sender_case_safety_report': {
@@ -307,6 +890,284 @@ class MainTestCase(TestCase):
             1
         )
 
+    def test_validate_case_text_length(self):
+        ini_data = {
+            'c_3_information_sender_case_safety_report': {
+                'c_3_2_sender_organisation': {
+                    'value': 'a' * 101
+                }
+            },
+        }
+
+        resp = VALIDATE_RD.call(data=ini_data)
+        res_data = json.loads(resp.content)
+
+        self.assertEqual(resp.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            res_data['_errors']['c_3_information_sender_case_safety_report']['c_3_2_sender_organisation']['_self'],
+            {'business': ['Text length cannot be grater than 100, got 101']}
+        )
+
+    def test_validate_case_validates_each_model_once(self):
+        ini_data = {
+            'c_3_information_sender_case_safety_report': {
+                'c_3_2_sender_organisation': {
+                    'value': 'abc'
+                }
+            },
+        }
+        with pde.ValidationCounter() as counter:
+            resp = VALIDATE_RD.call(data=ini_data)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        for layer in (api, domain):
+            self.assertEqual(counter.counts[layer.models.ICSR], 1)
+            self.assertEqual(counter.counts[layer.models.C_3_information_sender_case_safety_report], 1)
+
+    def test_create_and_read_compact_case(self):
+        ini_data = {
+            'c_1_identification_case_safety_report': {
+                'c_1_1_sender_safety_report_unique_id': 'abc',
+                'c_1_7_fulfil_local_criteria_expedited_report': None,
+                '_null_flavors': {
+                    'c_1_7_fulfil_local_criteria_expedited_report': 'NI'
+                }
+            },
+            'c_2_r_primary_source_information': [
+                {
+                    'c_2_r_4_qualification': 1
+                }
+            ]
+        }
+        resp = CREATE_RD.call(data=ini_data, content_type=compact.MEDIA_TYPE)
+        res_data = json.loads(resp.content)
+        compact_read_resp = READ_RD.call(id=res_data['id'], accept=compact.MEDIA_TYPE)
+        read_data = json.loads(READ_RD.call(id=res_data['id']).content)
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        self.assertEqual(resp['Content-Type'], compact.MEDIA_TYPE)
+        self.assertEqual(json.loads(compact_read_resp.content), res_data)
+        c_1 = res_data['c_1_identification_case_safety_report']
+        self.assertEqual(c_1['c_1_1_sender_safety_report_unique_id'], 'abc')
+        self.assertEqual(c_1['_null_flavors'], {'c_1_7_fulfil_local_criteria_expedited_report': 'NI'})
+        self.assertNotIn('_null_flavors', res_data['c_2_r_primary_source_information'][0])
+        self.assertEqual(res_data['c_2_r_primary_source_information'][0]['c_2_r_4_qualification'], 1)
+        # Same case in the default format
+        self.assertEqual(
+            read_data['c_1_identification_case_safety_report']['c_1_7_fulfil_local_criteria_expedited_report'],
+            {'value': None, 'null_flavor': 'NI'}
+        )
+
+    def test_negotiate_compact_format(self):
+        ini_data = {
+            'c_1_identification_case_safety_report': {
+                'c_1_1_sender_safety_report_unique_id': 'abc'
+            }
+        }
+        json_resp = CREATE_RD.call(data=ini_data, content_type=compact.MEDIA_TYPE, accept='application/json')
+        res_data = json.loads(json_resp.content)
+        compact_read_resp = READ_RD.call(
+            id=res_data['id'],
+            accept=f'application/json;q=0.5, {compact.MEDIA_TYPE}'
+        )
+        json_read_resp = READ_RD.call(id=res_data['id'], accept=f'{compact.MEDIA_TYPE};q=0, */*')
+
+        self.assertEqual(json_resp.status_code, HTTPStatus.OK)
+        self.assertEqual(json_resp['Content-Type'], 'application/json')
+        self.assertEqual(
+            res_data['c_1_identification_case_safety_report']['c_1_1_sender_safety_report_unique_id'],
+            {'value': 'abc'}
+        )
+        self.assertEqual(compact_read_resp['Content-Type'], compact.MEDIA_TYPE)
+        self.assertEqual(
+            json.loads(compact_read_resp.content)['c_1_identification_case_safety_report']
+            ['c_1_1_sender_safety_report_unique_id'],
+            'abc'
+        )
+        self.assertEqual(json_read_resp['Content-Type'], 'application/json')
+
+    def test_validate_compact_case(self):
+        ini_data = {
+            'c_3_information_sender_case_safety_report': {
+                'c_3_2_sender_organisation': 'a' * 101
+            },
+            'c_2_r_primary_source_information': [
+                {
+                    'c_2_r_4_qualification': 100
+                }
+            ]
+        }
+        resp = VALIDATE_RD.call(data=ini_data, content_type=compact.MEDIA_TYPE)
+        res_data = json.loads(resp.content)
+        invalid_null_flavor_resp = VALIDATE_RD.call(
+            data={'c_3_information_sender_case_safety_report': {'_null_flavors': {'c_3_2_sender_organisation': 'XYZ'}}},
+            content_type=compact.MEDIA_TYPE
+        )
+
+        self.assertEqual(resp.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            res_data['_errors']['c_3_information_sender_case_safety_report']['c_3_2_sender_organisation']['_self'],
+            {'business': ['Text length cannot be grater than 100, got 101']}
+        )
+        self.assertIn(
+            'parsing',
+            res_data['_errors']['c_2_r_primary_source_information']['0']['c_2_r_4_qualification']['_self']
+        )
+        self.assertEqual(invalid_null_flavor_resp.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_validate_invalid_case_without_warnings(self):
+        ini_data = {
+            'c_2_r_primary_source_information': [
+                {
+                    'c_2_r_4_qualification': {
+                        'value': 'abc'
+                    }
+                }
+            ]
+        }
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            resp = VALIDATE_RD.call(data=ini_data)
+
+        self.assertEqual(resp.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(caught_warnings, [])
+
+    def test_validate_case_errors_tree(self):
+        ini_data = {
+            'c_2_r_primary_source_information': [
+                {
+                    'c_2_r_4_qualification': {
+                        'value': 100
+                    }
+                },
+                {},
+                {
+                    'c_2_r_4_qualification': {
+                        'value': 200
+                    },
+                    'c_2_r_5_primary_source_regulatory_purposes': {
+                        'value': 100
+                    }
+                }
+            ]
+        }
+        resp = VALIDATE_RD.call(data=ini_data)
+        res_data = json.loads(resp.content)
+
+        self.assertEqual(resp.status_code, HTTPStatus.BAD_REQUEST)
+        errors = res_data['_errors']['c_2_r_primary_source_information']
+        self.assertEqual(set(errors.keys()), {'0', '2'})
+        self.assertEqual(set(errors['2'].keys()), {'c_2_r_4_qualification', 'c_2_r_5_primary_source_regulatory_purposes'})
+        for item_errors in (errors['0'], errors['2']):
+            self.assertEqual(len(item_errors['c_2_r_4_qualification']['value']['_self']['parsing']), 1)
+        # Empty errors are not dumped
+        for item in res_data['c_2_r_primary_source_information']:
+            self.assertNotIn('_errors', item)
+
+    def test_validate_case_reuses_unchanged_sections(self):
+        ini_data = {
+            'c_3_information_sender_case_safety_report': {
+                'c_3_2_sender_organisation': {
+                    'value': 'abc'
+                }
+            },
+            'c_2_r_primary_source_information': [
+                {},
+                {}
+            ]
+        }
+        first_resp = VALIDATE_RD.call(data=ini_data)
+
+        ini_data['c_3_information_sender_case_safety_report']['c_3_2_sender_organisation']['value'] = 'a' * 101
+        with pde.ValidationCounter() as counter:
+            second_resp = VALIDATE_RD.call(data=ini_data)
+        res_data = json.loads(second_resp.content)
+
+        self.assertEqual(first_resp.status_code, HTTPStatus.OK)
+        self.assertEqual(second_resp.status_code, HTTPStatus.BAD_REQUEST)
+        for layer in (api, domain):
+            self.assertEqual(counter.counts[layer.models.ICSR], 1)
+            self.assertEqual(counter.counts[layer.models.C_3_information_sender_case_safety_report], 1)
+        self.assertEqual(counter.counts[api.models.C_2_r_primary_source_information], 0)
+        self.assertEqual(
+            res_data['_errors']['c_3_information_sender_case_safety_report']['c_3_2_sender_organisation']['_self'],
+            {'business': ['Text length cannot be grater than 100, got 101']}
+        )
+
+        ini_data['c_3_information_sender_case_safety_report']['c_3_2_sender_organisation']['value'] = 'abc'
+        third_resp = VALIDATE_RD.call(data=ini_data)
+
+        self.assertEqual(third_resp.status_code, HTTPStatus.OK)
+        self.assertEqual(json.loads(third_resp.content), json.loads(first_resp.content))
+
+    def test_validation_does_not_change_data(self):
+        ini_data = {
+            'c_3_information_sender_case_safety_report': {
+                'c_3_2_sender_organisation': {
+                    'value': 'abc'
+                }
+            },
+            'c_2_r_primary_source_information': [
+                {}
+            ]
+        }
+        data = copy.deepcopy(ini_data)
+
+        model = api.models.ICSR.model_validate(data)
+        model = model.model_safe_validate(data)
+
+        self.assertTrue(model.is_valid)
+        self.assertEqual(data, ini_data)
+
+    @override_settings(BATCH_VALIDATION_POOL_SIZE=2)
+    @mock.patch.object(ModelBatchBusinessValidationView, 'max_pending_per_worker', 1)
+    def test_validate_batch(self):
+        icsr = sm.ICSR.objects.create()
+        sm.C_1_identification_case_safety_report.objects.create(icsr=icsr, c_1_1_sender_safety_report_unique_id='abc')
+        valid_case = {
+            'c_3_information_sender_case_safety_report': {
+                'c_3_2_sender_organisation': {
+                    'value': 'abc'
+                }
+            },
+        }
+        invalid_case = {
+            'c_3_information_sender_case_safety_report': {
+                'c_3_2_sender_organisation': {
+                    'value': '№'
+                }
+            },
+        }
+
+        resp = VALIDATE_BATCH_RD.call(data={'cases': [valid_case, invalid_case], 'ids': [icsr.id, icsr.id + 1]})
+        results = [json.loads(line) for line in b''.join(resp.streaming_content).splitlines()]
+        results_by_key = {(result['index'], result['id']): result for result in results}
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results_by_key[(0, None)]['status'], 'valid')
+        self.assertEqual(results_by_key[(1, None)]['status'], 'invalid')
+        self.assertEqual(
+            len(results_by_key[(1, None)]['_errors']['c_3_information_sender_case_safety_report'][
+                    'c_3_2_sender_organisation']['_self']['parsing']),
+            1
+        )
+        self.assertEqual(results_by_key[(None, icsr.id)]['status'], 'valid')
+        self.assertEqual(results_by_key[(None, icsr.id + 1)]['status'], 'not_found')
+
+    def test_validate_batch_with_broken_stream(self):
+        executor = mock.Mock(submit=mock.Mock(side_effect=RuntimeError('Pool is closed')))
+
+        with mock.patch('app.src.layers.api.batch_validation.get_executor', return_value=executor):
+            resp = VALIDATE_BATCH_RD.call(data={'cases': [{}, {}], 'ids': [1]})
+            results = [json.loads(line) for line in b''.join(resp.streaming_content).splitlines()]
+
+        self.assertEqual(resp.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            [(result['index'], result['id'], result['status']) for result in results],
+            [(0, None, 'error'), (1, None, 'error'), (None, 1, 'error')]
+        )
+
     def test_to_xml_and_from_xml(self):
         ini_data = {
             'c_3_information_sender_case_safety_report': {
@@ -483,3 +1344,27 @@ class MedDRASearchViewIntegrationTest(TestCase):
             ]
         }
         self.assertEqual(response_data, expected_data)
+
+
+class HL7DateUtilsTest(TestCase):
+    def test_parse(self):
+        cases = [
+            ('2024', dt.datetime(2024, 1, 1), DatePrecision.YEAR, ''),
+            ('202402', dt.datetime(2024, 2, 1), DatePrecision.MONTH, ''),
+            ('20240229', dt.datetime(2024, 2, 29), DatePrecision.DAY, ''),
+            ('2024022912+0100', dt.datetime(2024, 2, 29, 12), DatePrecision.HOUR, '+0100'),
+            ('202402291230-05', dt.datetime(2024, 2, 29, 12, 30), DatePrecision.MINUTE, '-0500'),
+            ('2024022924', dt.datetime(2024, 3, 1), DatePrecision.HOUR, ''),
+            ('20240229123045', dt.datetime(2024, 2, 29, 12, 30, 45), DatePrecision.SECOND, ''),
+            ('20240229123045.12', dt.datetime(2024, 2, 29, 12, 30, 45, 120000), DatePrecision.MILLISECOND, ''),
+        ]
+        for value, datetime, precision, offset in cases:
+            with self.subTest(value=value):
+                self.assertEqual(HL7DateUtils.parse(value), HL7Date(datetime, precision, offset))
+
+    def test_parse_invalid(self):
+        for value in ['', '24', '202413', '20230229', '2024010125', '20240101126000', '20240101+1500', '9999123124']:
+            with self.subTest(value=value):
+                self.assertIsNone(HL7DateUtils.try_parse(value))
+                with self.assertRaises(ValueError):
+                    HL7DateUtils.parse(value)
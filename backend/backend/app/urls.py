@@ -1,10 +1,12 @@
 from django import http
 from django.urls import path
 
+from app.src.connectors.api_domain import model_converters
 from app.src.connectors.api_domain.service_adapters import DomainServiceAdapter
 from app.src.connectors.domain_storage.service_adapters import StorageServiceAdapter
 from app.src.layers.api import models as api_models
 from app.src.layers.api import views
+from app.src.layers.domain import models as domain_models
 from app.src.layers.domain.services import DomainService, CIOMSService, MedDRAService, CodeSetService
 from app.src.layers.storage.services import StorageService
 
@@ -22,13 +24,22 @@ view_shared_args = dict(
     domain_service=domain_service_adapter,
     model_class=api_models.ICSR,
 )
+compact_view_args = dict(
+    compact_domain_service=domain_service,
+    compact_model_class=domain_models.ICSR,
+    to_compact_model_converter=model_converters.ApiToDomainModelConverter(),
+    from_compact_model_converter=model_converters.DomainToApiModelConverter(),
+)
 
 urlpatterns = [
     path('test', lambda *args, **kwargs: http.HttpResponse('This is a test')),
 
-    path('icsr', views.ModelClassView.as_view(**view_shared_args)),
-    path('icsr/<int:pk>', views.ModelInstanceView.as_view(**view_shared_args)),
-    path('icsr/validate', views.ModelBusinessValidationView.as_view(**view_shared_args)),
+    path('icsr', views.ModelClassView.as_view(**view_shared_args, **compact_view_args)),
+    path('icsr/<int:pk>', views.ModelInstanceView.as_view(**view_shared_args, **compact_view_args)),
+    path('icsr/validate', views.ModelBusinessValidationView.as_view(**view_shared_args, **compact_view_args)),
+    path('icsr/validate/batch', views.ModelBatchBusinessValidationView.as_view(**view_shared_args)),
+    path('icsr/delete/batch', views.ModelBatchDeleteView.as_view(**view_shared_args)),
+    path('icsr/<int:pk>/clone', views.ModelCloneView.as_view(**view_shared_args, **compact_view_args)),
 
     path('icsr/to-xml', views.ModelToXmlView.as_view(**view_shared_args)),
     path('icsr/from-xml', views.ModelFromXmlView.as_view(**view_shared_args)),
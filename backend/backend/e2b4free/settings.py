@@ -91,6 +91,24 @@ DATABASES = {
     }
 }
 
+# Data read from the database is trusted as it is validated before being saved.
+# Verification can be enabled for every read or for a percentage of reads to catch corrupted data.
+
+STORAGE_VERIFY_ON_READ = os.environ.get('STORAGE_VERIFY_ON_READ', '').lower() in ('1', 'true')
+
+STORAGE_VERIFY_ON_READ_SAMPLE_PERCENT = float(os.environ.get('STORAGE_VERIFY_ON_READ_SAMPLE_PERCENT', 0))
+
+# Business validation of case batches is done in a pool of processes, validation of each case is aborted on timeout
+
+BATCH_VALIDATION_POOL_SIZE = int(os.environ.get('BATCH_VALIDATION_POOL_SIZE', os.cpu_count() or 1))
+
+BATCH_VALIDATION_CASE_TIMEOUT = float(os.environ.get('BATCH_VALIDATION_CASE_TIMEOUT', 60))
+
+# Results of validation of unchanged case sections are reused by the validation endpoint,
+# this number of them is kept in memory of each process, 0 disables reusing
+
+VALIDATION_MEMO_SIZE = int(os.environ.get('VALIDATION_MEMO_SIZE', 10000))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
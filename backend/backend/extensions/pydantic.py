@@ -1,6 +1,14 @@
+import collections
+import contextvars
+import dataclasses as dc
 import enum
 import functools
+import hashlib
 import inspect
+import json
+import pickle
+import threading
+import time
 import types
 import typing as t
 
@@ -17,13 +25,289 @@ class CustomErrorType(enum.StrEnum):
     BUSINESS = enum.auto()
 
 
+class ValidationCounter:
+    """
+    Counts model validations by model class while being active.
+    Counters can be nested, each of them counts all validations made inside it.
+    """
+
+    _active_counters: t.ClassVar[contextvars.ContextVar[tuple['ValidationCounter', ...]]] = \
+        contextvars.ContextVar('active_validation_counters', default=())
+
+    def __init__(self) -> None:
+        self.counts: collections.Counter[type[pd.BaseModel]] = collections.Counter()
+        self._token: contextvars.Token | None = None
+
+    def __enter__(self) -> t.Self:
+        self._token = self._active_counters.set(self._active_counters.get() + (self,))
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._active_counters.reset(self._token)
+
+    @property
+    def total(self) -> int:
+        return self.counts.total()
+
+    def get_summary(self) -> dict[str, int]:
+        return {f'{c.__module__}.{c.__qualname__}': count for c, count in self.counts.items()}
+
+    @classmethod
+    def register(cls, model_class: type[pd.BaseModel]) -> None:
+        for counter in cls._active_counters.get():
+            counter.counts[model_class] += 1
+
+
+class ValidationMemoStore:
+    """
+    Keeps results of validation in memory of the process, the least recently used ones are dropped over the max size.
+    Validated models are kept as is, without copying or pickling, as building them again costs as much as validation.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._results: collections.OrderedDict[str, t.Any] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> t.Any:
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+            return result
+
+    def set(self, key: str, result: t.Any) -> None:
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+
+
+class ValidationMemo:
+    """
+    Reuses results of model validation while being active, so that unchanged parts of a big model are not validated again.
+    Only models nested at the given depth are memoized. The upper models contain the changed parts,
+    thus they are always validated and their rules, which may check several nested models at once, are always run.
+    Results are stored by the model class, the hash of its input data and the version,
+    which must be changed on any change of the validation code.
+    Memoized models are shared between validations, thus they must not be changed after validation.
+    """
+
+    _active_memo: t.ClassVar[contextvars.ContextVar['ValidationMemo | None']] = \
+        contextvars.ContextVar('active_validation_memo', default=None)
+
+    def __init__(
+        self,
+        store: ValidationMemoStore,
+        version: str,
+        *,
+        depth: int = 1
+    ) -> None:
+        self.store = store
+        self.version = version
+        self.depth = depth
+        self.hits = 0
+        self.misses = 0
+        self._current_depth = 0
+        self._token: contextvars.Token | None = None
+
+    def __enter__(self) -> t.Self:
+        self._token = self._active_memo.set(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._active_memo.reset(self._token)
+
+    @classmethod
+    def get_active(cls) -> 'ValidationMemo | None':
+        return cls._active_memo.get()
+
+    def enter_model(self, model_class: type[pd.BaseModel], data: t.Any, namespace: str) -> str | None:
+        """Goes one model deeper, returns the memo key if the model is memoized."""
+        key = None
+        if self._current_depth == self.depth and isinstance(data, dict):
+            key = self._make_key(model_class, data, namespace)
+        self._current_depth += 1
+        return key
+
+    def exit_model(self) -> None:
+        self._current_depth -= 1
+
+    def get(self, key: str) -> tuple[pd.BaseModel | None, list[pdc.ErrorDetails] | None] | None:
+        """Returns the memoized validated model or errors, None if the result is not memoized."""
+        result = self.store.get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def set_model(self, key: str, model: pd.BaseModel) -> None:
+        self.store.set(key, (model, None))
+
+    def set_errors(self, key: str, errors: list[pdc.ErrorDetails | pdc.InitErrorDetails]) -> None:
+        self.store.set(key, (None, errors))
+
+    def _make_key(self, model_class: type[pd.BaseModel], data: dict[str, t.Any], namespace: str) -> str | None:
+        try:
+            # Pickle distinguishes types of values unlike json, e.g. str and decimal
+            dumped_data = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+        digest = hashlib.blake2b(dumped_data, digest_size=16).hexdigest()
+        return f'validation_memo:{self.version}:{model_class.__module__}.{model_class.__qualname__}:{namespace}:{digest}'
+
+
+_POST_VALIDATION_RULE_ATTR = '_post_validation_rule_kwargs'
+
+
+def post_validation_rule(
+    *,
+    error_message: str | None = None,
+    is_abort_next: bool = False,
+    is_add_single_error: bool = False,
+    is_add_error_manually: bool = False,
+    error_type: CustomErrorType = CustomErrorType.PARSING,
+    condition: t.Callable[[pd.ValidationInfo], bool] | None = None
+) -> t.Callable[[t.Callable[..., bool]], t.Callable[..., bool]]:
+    """
+    Marks a function or a classmethod of PostValidatableModel as a rule, which is run after basic pydantic validation.
+    Rules are compiled once on class creation and inherited by derived models. See PostValidationRule for params.
+    """
+    def decorator(func: t.Callable[..., bool]) -> t.Callable[..., bool]:
+        setattr(getattr(func, '__func__', func), _POST_VALIDATION_RULE_ATTR, dict(
+            error_message=error_message,
+            is_abort_next=is_abort_next,
+            is_add_single_error=is_add_single_error,
+            is_add_error_manually=is_add_error_manually,
+            error_type=error_type,
+            condition=condition
+        ))
+        return func
+    return decorator
+
+
+@dc.dataclass(frozen=True)
+class PostValidationRule:
+    """
+    Validation of model fields with their names resolved from validate func params.
+    If validate func params len > 1, logically it's integration validation.
+    If is_add_error_manually is True, first validate func param must be PostValidationProcessor.
+    Enable is_add_single_error to display a single error on model level and not on each field level.
+    Rule is skipped if condition is set and returns False for the current validation info.
+    """
+
+    name: str
+    validate: t.Callable[..., bool]
+    field_names: tuple[str, ...]
+    error_message: str | None = None
+    is_abort_next: bool = False
+    is_add_single_error: bool = False
+    is_add_error_manually: bool = False
+    error_type: CustomErrorType = CustomErrorType.PARSING
+    condition: t.Callable[[pd.ValidationInfo], bool] | None = None
+
+    @classmethod
+    def create(cls, validate: t.Callable[..., bool], *, name: str | None = None, **kwargs: t.Any) -> t.Self:
+        is_add_error_manually = kwargs.get('is_add_error_manually', False)
+        if not is_add_error_manually and kwargs.get('error_message') is None:
+            raise ValueError('Required error_message if is_add_error_manually is disabled')
+
+        # Signature skips the bound param of methods unlike getfullargspec
+        field_names = list(inspect.signature(validate).parameters.keys())
+        if is_add_error_manually:
+            field_names.pop(0)
+
+        return cls(
+            name=name or validate.__qualname__,
+            validate=validate,
+            field_names=tuple(field_names),
+            **kwargs
+        )
+
+
+@dc.dataclass
+class PostValidationRuleStats:
+    calls: int = 0
+    failures: int = 0
+    total_time: float = 0
+
+
+class PostValidationRuleProfiler:
+    """
+    Collects calls, failures and total run time of post validation rules by rule name while being active.
+    Profilers can be nested, each of them collects stats of all rules run inside it.
+    """
+
+    _active_profilers: t.ClassVar[contextvars.ContextVar[tuple['PostValidationRuleProfiler', ...]]] = \
+        contextvars.ContextVar('active_post_validation_rule_profilers', default=())
+
+    def __init__(self) -> None:
+        self.stats: collections.defaultdict[str, PostValidationRuleStats] = \
+            collections.defaultdict(PostValidationRuleStats)
+        self._token: contextvars.Token | None = None
+
+    def __enter__(self) -> t.Self:
+        self._token = self._active_profilers.set(self._active_profilers.get() + (self,))
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._active_profilers.reset(self._token)
+
+    def get_summary(self) -> dict[str, dict[str, int | float]]:
+        """Returns stats sorted from the most expensive rule."""
+        sorted_stats = sorted(self.stats.items(), key=lambda item: item[1].total_time, reverse=True)
+        return {name: dc.asdict(stats) for name, stats in sorted_stats}
+
+    @classmethod
+    def is_active(cls) -> bool:
+        return bool(cls._active_profilers.get())
+
+    @classmethod
+    def register(cls, rule: PostValidationRule, is_valid: bool, run_time: float) -> None:
+        for profiler in cls._active_profilers.get():
+            stats = profiler.stats[rule.name]
+            stats.calls += 1
+            stats.failures += not is_valid
+            stats.total_time += run_time
+
+
 class PostValidatableModel(pd.BaseModel):
     """Allows custom validation to avoid problems with basic pydantic consequential field validation."""
 
-    _CURRENT_CONTEXT_KEY: t.ClassVar = '_context'
-    _VALID_DATA_KEY: t.ClassVar = '_validated_data'
+    _VALIDATION_STACK_KEY: t.ClassVar = '_validation_stack'
+
+    # Default is validated so that the field validator saving valid data is always called
+    tech_mock: t.Any = pd.Field(default=None, exclude=True, validate_default=True)
+
+    _post_validation_rules: t.ClassVar[tuple[PostValidationRule, ...]] = ()
+    _has_post_validation: t.ClassVar[bool] = False
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._post_validation_rules = cls._compile_post_validation_rules()
+        # Models without rules and overridden _post_validate skip creating the processor
+        cls._has_post_validation = (
+            bool(cls._post_validation_rules)
+            or cls._post_validate.__func__ is not PostValidatableModel._post_validate.__func__
+        )
 
-    tech_mock: t.Any = pd.Field(default=None, exclude=True)
+    @classmethod
+    def _compile_post_validation_rules(cls) -> tuple[PostValidationRule, ...]:
+        # Rules are collected by name, so that a derived model can override the rule of its base
+        rules = {}
+        for base in reversed(cls.__mro__):
+            for attr_name, attr in vars(base).items():
+                rule_kwargs = getattr(getattr(attr, '__func__', attr), _POST_VALIDATION_RULE_ATTR, None)
+                if rule_kwargs is not None:
+                    rules[attr_name] = PostValidationRule.create(
+                        getattr(cls, attr_name),
+                        name=f'{base.__qualname__}.{attr_name}',
+                        **rule_kwargs
+                    )
+        return tuple(rules.values())
 
     @classmethod
     def model_validate(
@@ -39,6 +323,18 @@ class PostValidatableModel(pd.BaseModel):
             context = {}
         return super().model_validate(obj, strict=strict, from_attributes=from_attributes, context=context)
 
+    @classmethod
+    def model_validate_json(
+        cls: type[t.Self],
+        json_data: str | bytes | bytearray,
+        *,
+        strict: bool | None = None,
+        context: dict[str, t.Any] | None = None,
+    ) -> t.Self:
+        if context is None:
+            context = {}
+        return super().model_validate_json(json_data, strict=strict, context=context)
+
     @pd.model_validator(mode='wrap')
     @classmethod
     def _post_validate_wrap(cls, data: t.Any, handler: pd.ValidatorFunctionWrapHandler, info: pd.ValidationInfo) -> t.Self:
@@ -46,19 +342,32 @@ class PostValidatableModel(pd.BaseModel):
         Allows custom validation and concatenates custom errors with catched basic pydantic errors.
         Note that other model_validator declared in a derived model will be called outside this method.
         """
-        data['tech_mock'] = None
-
-        context = cls._get_deepest_context(info)
-        if context is not None:
-            # Create deeper context to isolate current model context
-            context[cls._CURRENT_CONTEXT_KEY] = {cls._VALID_DATA_KEY: None}
-
+        memo = ValidationMemo.get_active()
+        memo_key = None
+        if memo is not None:
+            memo_key = memo.enter_model(cls, data, cls._get_validation_memo_namespace(info))
+            memoized = memo.get(memo_key) if memo_key is not None else None
+            if memoized is not None:
+                memo.exit_model()
+                model, errors = memoized
+                if errors:
+                    raise pd.ValidationError.from_exception_data(title=cls.__name__, line_errors=errors)
+                return model
+
+        ValidationCounter.register(cls)
+
+        stack = cls._get_validation_stack(info)
+        if stack is not None:
+            # Push the frame of the current model, which is filled with its valid data by _save_data
+            stack.append(None)
+
+        result = None
         errors = list()
         expected_exception = None
         unexpected_exception = None
 
         try:
-            return handler(data)
+            result = handler(data)
 
         except pd.ValidationError as e:
             expected_exception = e
@@ -67,50 +376,72 @@ class PostValidatableModel(pd.BaseModel):
             unexpected_exception = e
 
         finally:
-            if unexpected_exception:
-                raise unexpected_exception
-            
-            if expected_exception:
-                errors = expected_exception.errors()
-
-            if context is not None:
-                valid_data = context[cls._CURRENT_CONTEXT_KEY][cls._VALID_DATA_KEY]
-                if valid_data:
-                    processor = PostValidationProcessor(valid_data, data, errors, info)
-                    cls._post_validate(processor)
-                    errors = processor.errors
+            if memo is not None:
+                memo.exit_model()
+
+        if unexpected_exception:
+            raise unexpected_exception
+
+        if expected_exception:
+            errors = _make_line_errors(expected_exception.errors())
+
+        if stack is not None:
+            # Pop the frame so that the upper models will see their frame and not the current one
+            valid_data = stack.pop()
+            if valid_data and cls._has_post_validation:
+                processor = PostValidationProcessor(valid_data, data, errors, info)
+                cls._post_validate(processor)
+                for rule in cls._post_validation_rules:
+                    processor.apply_rule(rule)
+                errors = processor.errors
+
+        if errors:
+            if memo_key is not None:
+                memo.set_errors(memo_key, errors)
+            raise pd.ValidationError.from_exception_data(title=cls.__name__, line_errors=errors)
+
+        if memo_key is not None and result is not None:
+            memo.set_model(memo_key, result)
+        return result
 
-                # Delete the current context so that the upper models will see their context and not the current one
-                del context[cls._CURRENT_CONTEXT_KEY]
-
-            if errors:
-                raise pd.ValidationError.from_exception_data(title=cls.__name__, line_errors=errors)
+    @classmethod
+    def _get_validation_memo_namespace(cls, info: pd.ValidationInfo) -> str:
+        """
+        Returns the part of the memo key, which depends on the validation context.
+        Should be overridden if the result of validation depends not only on the model data.
+        """
+        return ''
             
     @pd.field_validator('tech_mock', mode='after')
     @classmethod
     def _save_data(cls, val: t.Any, info: pd.ValidationInfo) -> t.Any:
         """
-        Saves validated data into the current model context.
+        Saves validated data into the current model frame of the validation stack.
         Needed because pydantic doesn't allow to get succesfully validated data if at least one error has occurred.
         """
-        context = cls._get_deepest_context(info)
-        if context is not None:
+        stack = cls._get_validation_stack(info)
+        if stack:
             # Data is saved by reference, thus will be avaiable in model validator being filled with all valid fields
-            context[cls._VALID_DATA_KEY] = info.data
+            stack[-1] = info.data
         return val
             
     @classmethod
-    def _get_deepest_context(cls, info: pd.ValidationInfo) -> dict[t.Any, t.Any] | None:
+    def _get_validation_stack(cls, info: pd.ValidationInfo) -> list[dict[str, t.Any] | None] | None:
+        """Returns the stack of valid data of the models being validated, the last one is the current model."""
         context = info.context
         if context is None:
             return None
-        while cls._CURRENT_CONTEXT_KEY in context:
-            context = context[cls._CURRENT_CONTEXT_KEY]
-        return context
+        stack = context.get(cls._VALIDATION_STACK_KEY)
+        if stack is None:
+            stack = context[cls._VALIDATION_STACK_KEY] = []
+        return stack
             
     @classmethod
     def _post_validate(cls, processor: 'PostValidationProcessor') -> None:
-        """Override it for custom validation after basic pydantic validation."""
+        """
+        Override it for custom validation after basic pydantic validation.
+        Validation of particular fields should be declared with post_validation_rule instead.
+        """
 
 
 class SafeValidatableModel(pd.BaseModel):
@@ -123,8 +454,10 @@ class SafeValidatableModel(pd.BaseModel):
 
     _errors: dict[str, t.Any] = {}
     _exception: pd.ValidationError | None = None
+    _is_trusted: bool = False
+
+    ERRORS_KEY: t.ClassVar = '_errors'
 
-    @pd.computed_field(alias='_errors')
     @property
     def errors(self) -> dict[str, t.Any]:
         return self._errors.copy()
@@ -133,6 +466,32 @@ class SafeValidatableModel(pd.BaseModel):
     def errors(self, val: dict[str, t.Any]) -> None:
         self._errors = val
 
+    def model_dump(self, *, by_alias: bool = False, **kwargs: t.Any) -> dict[str, t.Any]:
+        """
+        Adds errors to the dumped model if there are some.
+        Errors are saved in the root model only, thus they are not dumped for nested ones.
+        """
+        data = super().model_dump(by_alias=by_alias, **kwargs)
+        if self._errors:
+            data[self._get_errors_key(by_alias)] = self.errors
+        return data
+
+    def model_dump_json(self, *, indent: int | None = None, by_alias: bool = False, **kwargs: t.Any) -> str:
+        """Same as model_dump, errors json is inserted into the model json to keep dumping nested models in pydantic-core."""
+        json_data = super().model_dump_json(indent=indent, by_alias=by_alias, **kwargs)
+        if not self._errors:
+            return json_data
+
+        errors_json_data = pdc.to_json({self._get_errors_key(by_alias): self._errors}, indent=indent).decode()
+        # Both are json objects, so the closing brace of the model is replaced with the errors item
+        model_head = json_data[:-1].rstrip()
+        separator = ',' if model_head != '{' else ''
+        return model_head + separator + errors_json_data[1:]
+
+    @classmethod
+    def _get_errors_key(cls, by_alias: bool) -> str:
+        return cls.ERRORS_KEY if by_alias else 'errors'
+
     @property
     def exception(self) -> pd.ValidationError | None:
         return self._exception
@@ -140,6 +499,15 @@ class SafeValidatableModel(pd.BaseModel):
     @property
     def is_valid(self) -> bool:
         return not self._errors and not self._exception
+
+    @property
+    def is_trusted(self) -> bool:
+        """Shows if the model was constructed without validation from the data that had been validated before."""
+        return self._is_trusted
+
+    @is_trusted.setter
+    def is_trusted(self, val: bool) -> None:
+        self._is_trusted = val
     
     def model_safe_validate(
         self, 
@@ -152,7 +520,7 @@ class SafeValidatableModel(pd.BaseModel):
         if initial_data is None:
             # Dump model as pydantic will not validate the model itself
             # and ignore warnings about wrong data format and etc.
-            initial_data = utils.exec_without_warnings(lambda: self.model_dump())     
+            initial_data = self.model_dump(warnings=False)
 
         result_self = self
         unexpected_exception = None
@@ -171,33 +539,75 @@ class SafeValidatableModel(pd.BaseModel):
                 raise unexpected_exception
             
             result_self._save_errors(initial_data)
+            # The result is carried to other layers, so that models built from it are not validated again
+            result_self.is_trusted = result_self.is_valid
             return result_self
         
+    @classmethod
+    def model_safe_validate_json(
+        cls,
+        json_data: str | bytes | bytearray,
+        *,
+        context: dict[str, t.Any] | None = None
+    ) -> t.Self:
+        """
+        Same as model_safe_validate but for json, which is parsed and validated by pydantic-core in a single pass.
+        Json is parsed in python only if validation fails, as the input data is needed to save the errors.
+        """
+
+        try:
+            result_self = cls.model_validate_json(json_data, context=context)
+            result_self.is_trusted = True
+            return result_self
+
+        except pd.ValidationError as e:
+            exception = e
+
+        initial_data = json.loads(json_data)
+        result_self = cls.model_dict_construct(initial_data)
+        result_self._exception = exception
+        result_self._save_errors(initial_data)
+        return result_self
+
     def _save_errors(self, initial_data: dict[str, t.Any]) -> None:
+        """
+        Saves errors as dict of dicts (of dicts and so on) with max depth = max len of loc.
+        Errors of the same model go one after another, so the path of each error in data and errors
+        is reused by the next one and walked only from the first differing key.
+        """
         if not self._exception:
             return
-            
-        # Saving errors as dict of dicts (of dicts and so on) with max depth = max len of loc
+
+        # Path of the previous error as key, data and errors for each of its keys found in data
+        path: list[tuple[int | str, t.Any, dict[str, t.Any]]] = []
+
         for err in self._exception.errors():
-            errors = self._errors
             loc = err['loc']
 
-            if loc:
-                context_data = initial_data
+            depth = 0
+            while depth < len(path) and depth < len(loc) and path[depth][0] == loc[depth]:
+                depth += 1
+            del path[depth:]
 
-                for key in loc:
-                    if isinstance(key, int):
-                        context_data = context_data[key]
-                    else:  # dict
-                        # If key not in data, then pydntic generated specific error, which will be saved on field level
-                        # (e.g. several erros for union type conversion)
-                        if not isinstance(context_data, dict) or key not in context_data:
-                            break
-                        context_data = context_data[key]
+            if path:
+                _, context_data, errors_tree = path[-1]
+            else:
+                context_data, errors_tree = initial_data, self._errors
+
+            for key in loc[depth:]:
+                if isinstance(key, int):
+                    context_data = context_data[key]
+                else:  # dict
+                    # If key not in data, then pydntic generated specific error, which will be saved on field level
+                    # (e.g. several erros for union type conversion)
+                    if not isinstance(context_data, dict) or key not in context_data:
+                        break
+                    context_data = context_data[key]
 
-                    errors = utils.get_or_create_dict_in_dict(errors, key)
+                errors_tree = utils.get_or_create_dict_in_dict(errors_tree, key)
+                path.append((key, context_data, errors_tree))
 
-            errors = utils.get_or_create_dict_in_dict(errors, self.SELF_ERRORS_KEY)
+            self_errors = utils.get_or_create_dict_in_dict(errors_tree, self.SELF_ERRORS_KEY)
 
             try:
                 # Trying to parse custom type if it is one
@@ -206,68 +616,75 @@ class SafeValidatableModel(pd.BaseModel):
                 # This type will be used for any pydantic type
                 type_ = CustomErrorType.PARSING
             
-            utils.update_or_create_list_in_dict(errors, type_, err['msg'])
+            utils.update_or_create_list_in_dict(self_errors, type_, err['msg'])
 
     @classmethod
     def model_dict_construct(cls, data: dict[str, t.Any]) -> t.Self:
         """Converts model dicts to model instances without validation and calls the super."""
 
-        type_hints = cls.get_type_hints()
+        construction_plan = cls._get_construction_plan()
         parsed_data = data.copy()
         
         for key, val in data.items():
-            if key not in cls.model_fields:
+            field_plan = construction_plan.get(key)
+            if not field_plan:
                 continue
 
-            field_type = type_hints.get(key)
+            kind, model_class = field_plan
+
+            if kind is _FieldConstructionKind.NESTED:
+                if isinstance(val, dict):
+                    parsed_data[key] = model_class.model_dict_construct(val)
+
+            elif kind is _FieldConstructionKind.LIST_OF_NESTED:
+                if isinstance(val, list):
+                    parsed_data[key] = [
+                        model_class.model_dict_construct(item) if isinstance(item, dict) else item
+                        for item in val
+                    ]
+
+        return super().model_construct(**parsed_data)
+
+    @classmethod
+    @functools.cache
+    def _get_construction_plan(cls) -> dict[str, tuple['_FieldConstructionKind', type['SafeValidatableModel'] | None]]:
+        """
+        Maps each field, which holds models, to the way of its construction.
+        Computed once per class on first use, as forward references cannot be resolved at class creation.
+        """
+
+        type_hints = cls.get_type_hints()
+        plan = {}
+
+        for field_name in cls.model_fields.keys():
+            field_type = type_hints.get(field_name)
             if not field_type:
                 continue
-            
+
             field_type_origin = t.get_origin(field_type)
             field_type_args = t.get_args(field_type)
             field_type_first_arg = field_type_args[0] if field_type_args else None
 
-            # Check if model
-            if isinstance(val, dict):
-                if (
-                    isinstance(field_type, type)
-                    and issubclass(field_type, SafeValidatableModel)
-                ):
-                    parsed_data[key] = field_type.model_dict_construct(val)
-
-                # Actually check `Optional[T]`, `T | None`, `Union[T, None]`
-                elif (
-                    field_type_origin in [t.Union, types.UnionType]
-                    and len(field_type_args) == 2
-                    and field_type_args[1] == type(None)
-                    and issubclass(field_type_first_arg, SafeValidatableModel)
-                ):
-                    parsed_data[key] = field_type_first_arg.model_dict_construct(val)
-            
-            # Check if list of models
-            if (
-                isinstance(val, list)
-                and isinstance(field_type, types.GenericAlias)
-                and issubclass(field_type_origin, list)
-                and field_type_args
-            ):
-                parsed_list = []
-
-                for item in val:
-                    parsed_item = item
-
-                    if (
-                        isinstance(item, dict) 
-                        and isinstance(field_type_first_arg, type)
-                        and issubclass(field_type_first_arg, SafeValidatableModel)
-                    ):
-                        parsed_item = field_type_first_arg.model_dict_construct(item)
+            if _is_safe_validatable_model_class(field_type):
+                plan[field_name] = _FieldConstructionKind.NESTED, field_type
 
-                    parsed_list.append(parsed_item)
+            # Actually check `Optional[T]`, `T | None`, `Union[T, None]`
+            elif (
+                field_type_origin in [t.Union, types.UnionType]
+                and len(field_type_args) == 2
+                and field_type_args[1] == type(None)
+                and _is_safe_validatable_model_class(field_type_first_arg)
+            ):
+                plan[field_name] = _FieldConstructionKind.NESTED, field_type_first_arg
 
-                parsed_data[key] = parsed_list
+            elif (
+                isinstance(field_type, types.GenericAlias)
+                and issubclass(field_type_origin, list)
+                and _is_safe_validatable_model_class(field_type_first_arg)
+            ):
+                plan[field_name] = _FieldConstructionKind.LIST_OF_NESTED, field_type_first_arg
 
-        return super().model_construct(**parsed_data)
+        return plan
 
     @classmethod
     @functools.cache
@@ -275,6 +692,56 @@ class SafeValidatableModel(pd.BaseModel):
         return t.get_type_hints(cls)
 
 
+class _FieldConstructionKind(enum.Enum):
+    NESTED = enum.auto()  # Also `Optional[T]` as None is not a dict and is left as is
+    LIST_OF_NESTED = enum.auto()
+
+
+def _is_safe_validatable_model_class(type_: t.Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, SafeValidatableModel)
+
+
+def _make_line_errors(errors: t.Iterable[pdc.ErrorDetails | pdc.InitErrorDetails]) -> list[pdc.InitErrorDetails]:
+    """
+    Prepares errors of a caught validation error to be raised again with ValidationError.from_exception_data,
+    which doesn't accept errors of custom types as they are returned by ValidationError.errors.
+    """
+    line_errors = []
+    for error in errors:
+        error_type = error.get('type')
+        if isinstance(error_type, str) and error_type in CustomErrorType:
+            # Crutch for error with custom type because of the bug in pydantic
+            line_errors.append(_make_custom_line_error(
+                type=error_type,
+                message=error.get('msg'),
+                loc=error.get('loc'),
+                input=error.get('input'),
+                ctx=error.get('ctx')
+            ))
+        else:
+            line_errors.append(error)
+    return line_errors
+
+
+def _make_custom_line_error(
+    *,
+    type: str,
+    message: str,
+    loc: tuple[int | str, ...],
+    input: t.Any,
+    ctx: dict[str, t.Any] | None = None
+) -> pdc.InitErrorDetails:
+    return pdc.InitErrorDetails(
+        type=pdc.PydanticCustomError(
+            type,
+            message
+        ),
+        loc=loc,
+        input=input,
+        ctx=ctx
+    )
+
+
 class PostValidationProcessor:
     """Manages custom validation."""
 
@@ -282,26 +749,16 @@ class PostValidationProcessor:
         self, 
         valid_data: dict[str, t.Any], 
         initial_data: dict[str, t.Any],
-        errors: list[pdc.ErrorDetails],
+        errors: list[pdc.InitErrorDetails],
         info: pd.ValidationInfo
     ) -> None:
-        self._valid_data = valid_data.copy()
-        self._initial_data = initial_data.copy()
-
-        self._errors = []
-        for error in errors: 
-            error_type = error.get('type')
-            if error_type in CustomErrorType:
-                # Crutch for error with custom type because of the bug in pydantic
-                self.add_error(
-                    type=error_type,
-                    message=error.get('msg'),
-                    loc=error.get('loc'),
-                    input=error.get('input'),
-                    ctx=error.get('ctx')
-                )
-            else:
-                self._errors.append(error)
+        # Data is copied only before being changed, as most models don't change it
+        self._valid_data = valid_data
+        self._is_valid_data_copied = False
+        self._initial_data = initial_data
+
+        # Errors are already prepared with _make_line_errors
+        self._errors = list(errors)
 
         self.info = info
 
@@ -320,58 +777,72 @@ class PostValidationProcessor:
         error_type: CustomErrorType = CustomErrorType.PARSING
     ) -> None:
         """
-        Calls validation for fields.
-        Fields are extracted from func params, thus their names must equal field names.
-        If validate func params len > 1, logically it's integration validation.  
-        If is_add_error_manually is True, first validate func param must be PostValidationProcessor.
-        Enable is_add_single_error to display a single error on model level and not on each field level.
+        Calls validation for fields. See PostValidationRule for params.
+        Fields are extracted from func params on every call,
+        thus prefer declaring rules with post_validation_rule for validation made on each model.
         """
-        if not is_add_error_manually and error_message is None:
-            raise ValueError('Required error_message if is_add_error_manually is disabled')
-
-        field_names = inspect.getfullargspec(validate).args
-        if is_add_error_manually:
-            field_names.pop(0)
+        self.apply_rule(PostValidationRule.create(
+            validate,
+            error_message=error_message,
+            is_abort_next=is_abort_next,
+            is_add_single_error=is_add_single_error,
+            is_add_error_manually=is_add_error_manually,
+            error_type=error_type
+        ))
+
+    def apply_rule(self, rule: PostValidationRule) -> None:
+        if rule.condition and not rule.condition(self.info):
+            return
 
         valid_data = {}
         initial_data = {}
         try:
-            for field_name in field_names:
+            for field_name in rule.field_names:
                 valid_data[field_name] = self._valid_data[field_name]
                 initial_data[field_name] = self._initial_data[field_name]
         except KeyError:
             # If some data is missing, it haven't been parsed and valdiaion shouldn't be done
             return
         
+        is_profiled = PostValidationRuleProfiler.is_active()
+        if is_profiled:
+            start_time = time.perf_counter()
+
         args = valid_data.values()
-        if is_add_error_manually:
-            is_valid = validate(self, *args) 
+        if rule.is_add_error_manually:
+            is_valid = rule.validate(self, *args)
         else:
-            is_valid = validate(*args)
+            is_valid = rule.validate(*args)
+
+        if is_profiled:
+            PostValidationRuleProfiler.register(rule, is_valid, time.perf_counter() - start_time)
 
         if is_valid:
             return
         
-        if not is_add_error_manually:
-            if is_add_single_error:
+        if not rule.is_add_error_manually:
+            if rule.is_add_single_error:
                 self.add_error(
-                    type=error_type,
-                    message=error_message,
+                    type=rule.error_type,
+                    message=rule.error_message,
                     loc=tuple(),
                     input=initial_data
                 )
             else:
-                for field_name in field_names:
+                for field_name in rule.field_names:
                     self.add_error(
-                        type=error_type,
-                        message=error_message,
+                        type=rule.error_type,
+                        message=rule.error_message,
                         loc=(field_name,),
                         input=initial_data
                     )
 
         # Prevent further validation for these fields 
-        if is_abort_next:
-            for field_name in field_names:
+        if rule.is_abort_next:
+            if not self._is_valid_data_copied:
+                self._valid_data = self._valid_data.copy()
+                self._is_valid_data_copied = True
+            for field_name in rule.field_names:
                 self._valid_data.pop(field_name)
 
     def add_error(
@@ -383,17 +854,7 @@ class PostValidationProcessor:
         input: t.Any, 
         ctx: dict[str, t.Any] | None = None
     ) -> None:
-        self._errors.append(
-            pdc.InitErrorDetails(
-                type=pdc.PydanticCustomError(
-                    type,
-                    message
-                ),
-                loc=loc,
-                input=input,
-                ctx=ctx
-            )
-        )
+        self._errors.append(_make_custom_line_error(type=type, message=message, loc=loc, input=input, ctx=ctx))
 
     def get_from_valid_data(self, key: str) -> t.Any:
         return self._valid_data.get(key)
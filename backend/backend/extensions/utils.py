@@ -1,5 +1,14 @@
+import functools
+import hashlib
+import importlib.util
+import json
+from pathlib import Path
 import typing as t
-import warnings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def update_or_create_list_in_dict[K, V](dict_: dict[K, list[V]], key: K, val: V) -> None:
@@ -21,7 +30,23 @@ def get_or_create_dict_in_dict[K1, K2, V](dict_: dict[K1, dict[K2, V]], key: K1)
     return val
 
 
-def exec_without_warnings[T, **P](exec: t.Callable[[], T]) -> T:
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        return exec()
+def dump_json(obj: t.Any) -> bytes:
+    """Dumps the object with orjson if it is installed as it is several times faster than json."""
+    if orjson is not None:
+        # Non str keys are converted to str as json does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode()
+
+
+@functools.cache
+def get_source_version(*package_names: str) -> str:
+    """Returns the hash of the source files of the packages, which is changed with any change of their code."""
+    hash_ = hashlib.blake2b(digest_size=8)
+    for package_name in package_names:
+        spec = importlib.util.find_spec(package_name)
+        for location in spec.submodule_search_locations:
+            root = Path(location)
+            for path in sorted(root.rglob('*.py')):
+                hash_.update(str(path.relative_to(root)).encode())
+                hash_.update(path.read_bytes())
+    return hash_.hexdigest()